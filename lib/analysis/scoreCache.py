@@ -0,0 +1,251 @@
+# lib/analysis/scoreCache.py
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+import numpy as np
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Any
+
+# SQLite caps the number of bound parameters per statement
+_SQLITE_BATCH = 500
+_WHITESPACE = re.compile(r'\s+')
+
+
+class ScoreCache:
+    """
+    Content-addressed score cache for repeated texts (retweets, quote posts, spam)
+
+    Entries are keyed by a hash of the normalized text and kept in an in-process
+    LRU bounded by max_size. An optional SQLite file adds a persistent second tier
+    shared across processes and runs; disk hits are promoted back into memory.
+    Each write to disk deletes expired rows and, past max_disk_size rows, the
+    oldest rows of the namespace, so the file stays bounded.
+    """
+    def __init__(
+        self,
+        max_size: int = 100000,
+        ttl_seconds: Optional[float] = None,
+        db_path: Optional[str] = None,
+        namespace: str = 'default',
+        max_disk_size: int = 1000000
+    ):
+        """
+        Initialize score cache
+
+        Args:
+            max_size (int): Maximum number of entries held in memory
+            ttl_seconds (Optional[float]): Entry lifetime, None keeps entries until evicted
+            db_path (Optional[str]): SQLite file for the on-disk tier
+            namespace (str): Scorer name, keeps scores from different models apart
+            max_disk_size (int): Maximum number of rows kept on disk for this namespace
+        """
+        self.max_size = max_size
+        self.max_disk_size = max_disk_size
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+
+        if db_path is not None:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS scores ('
+                'namespace TEXT NOT NULL, key TEXT NOT NULL, score REAL NOT NULL, '
+                'stored_at REAL NOT NULL, PRIMARY KEY (namespace, key))'
+            )
+            self._db.execute(
+                'CREATE INDEX IF NOT EXISTS scores_age ON scores (namespace, stored_at)'
+            )
+            self._db.commit()
+
+    @staticmethod
+    def text_key(text: str) -> str:
+        """
+        Hash normalized text (NFC, collapsed and stripped whitespace)
+
+        Args:
+            text (str): Raw text
+
+        Returns:
+            str: Hex digest used as cache key
+        """
+        normalized = _WHITESPACE.sub(' ', unicodedata.normalize('NFC', text)).strip()
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _is_expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - stored_at > self.ttl_seconds
+
+    def _store(self, key: str, score: float, stored_at: float):
+        self._entries[key] = (score, stored_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _lookup_disk(self, keys: List[str], now: float) -> Dict[str, tuple]:
+        found = {}
+        for start in range(0, len(keys), _SQLITE_BATCH):
+            batch = keys[start:start + _SQLITE_BATCH]
+            rows = self._db.execute(
+                'SELECT key, score, stored_at FROM scores WHERE namespace = ? AND key IN (%s)'
+                % ','.join('?' * len(batch)),
+                [self.namespace] + batch
+            )
+            for key, score, stored_at in rows:
+                if not self._is_expired(stored_at, now):
+                    found[key] = (score, stored_at)
+        return found
+
+    def _prune_disk(self, now: float):
+        if self.ttl_seconds is not None:
+            self._db.execute(
+                'DELETE FROM scores WHERE namespace = ? AND stored_at < ?',
+                (self.namespace, now - self.ttl_seconds)
+            )
+
+        (rows,) = self._db.execute(
+            'SELECT COUNT(*) FROM scores WHERE namespace = ?', (self.namespace,)
+        ).fetchone()
+        if rows > self.max_disk_size:
+            # Oldest writes go first; disk hits do not refresh stored_at
+            self._db.execute(
+                'DELETE FROM scores WHERE namespace = ? AND key IN ('
+                'SELECT key FROM scores WHERE namespace = ? ORDER BY stored_at LIMIT ?)',
+                (self.namespace, self.namespace, rows - self.max_disk_size)
+            )
+
+    def get_many(self, keys: List[str]) -> Dict[str, float]:
+        """
+        Look up cached scores
+
+        Args:
+            keys (List[str]): Cache keys from text_key
+
+        Returns:
+            Dict of key to score for every key that is cached and not expired
+        """
+        now = time.time()
+        found = {}
+        missing = []
+
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and self._is_expired(entry[1], now):
+                    del self._entries[key]
+                    entry = None
+                if entry is None:
+                    missing.append(key)
+                else:
+                    self._entries.move_to_end(key)
+                    found[key] = entry[0]
+
+            if missing and self._db is not None:
+                disk_entries = self._lookup_disk(missing, now)
+                for key, (score, stored_at) in disk_entries.items():
+                    self._store(key, score, stored_at)
+                    found[key] = score
+                self.disk_hits += len(disk_entries)
+
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+
+        return found
+
+    def put_many(self, keys: List[str], scores: np.ndarray):
+        """
+        Store scores in memory and, when configured, on disk
+
+        Args:
+            keys (List[str]): Cache keys from text_key
+            scores (np.ndarray): Score per key
+        """
+        now = time.time()
+        scores = [float(score) for score in scores]
+
+        with self._lock:
+            for key, score in zip(keys, scores):
+                self._store(key, score, now)
+
+            if self._db is not None:
+                self._db.executemany(
+                    'INSERT OR REPLACE INTO scores (namespace, key, score, stored_at) VALUES (?, ?, ?, ?)',
+                    [(self.namespace, key, score, now) for key, score in zip(keys, scores)]
+                )
+                self._prune_disk(now)
+                self._db.commit()
+
+    def get_or_compute(
+        self,
+        texts: List[str],
+        score_fn: Callable[[List[str]], np.ndarray]
+    ) -> np.ndarray:
+        """
+        Return a score per text, calling score_fn once for the distinct uncached texts
+
+        Args:
+            texts (List[str]): Texts to score
+            score_fn (Callable): Scores a list of texts, returning one value per text
+
+        Returns:
+            np.ndarray: Score per text, in input order
+        """
+        keys = [self.text_key(text) for text in texts]
+
+        # Duplicates inside the batch are looked up and scored once
+        first_text = {}
+        for key, text in zip(keys, texts):
+            first_text.setdefault(key, text)
+
+        unique_keys = list(first_text)
+        scores = self.get_many(unique_keys)
+
+        missing = [key for key in unique_keys if key not in scores]
+        if missing:
+            computed = np.asarray(score_fn([first_text[key] for key in missing])).ravel()
+            self.put_many(missing, computed)
+            scores.update(zip(missing, computed.tolist()))
+
+        return np.fromiter((scores[key] for key in keys), dtype=np.float64, count=len(keys))
+
+    def clear(self):
+        """
+        Drop every entry in this namespace from memory and disk
+        """
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute('DELETE FROM scores WHERE namespace = ?', (self.namespace,))
+                self._db.commit()
+
+    def close(self):
+        """
+        Close the on-disk tier
+        """
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache hit/miss counters
+
+        Returns:
+            Dict with hit, miss and size statistics
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'disk_hits': self.disk_hits,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self._entries),
+            'max_size': self.max_size
+        }
@@ -1,19 +1,120 @@
 # lib/analysis/sentimentAnalysis.py
 
 import re
+import time
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Any
-from textblob import TextBlob
+from concurrent.futures import Executor
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+from analysis.scoreCache import ScoreCache
+from common.workerPool import default_workers, worker_pool
+
+# Category boundaries for polarity scores. Lower edges are closed on the left
+# (-0.6 <= s < -0.2) and upper edges on the right (0.2 < s <= 0.6), so the
+# codes are built from two digitize passes and summed.
+SENTIMENT_CATEGORIES = ['very_negative', 'negative', 'neutral', 'positive', 'very_positive']
+_NEGATIVE_EDGES = np.array([-0.6, -0.2])
+_POSITIVE_EDGES = np.array([0.2, 0.6])
+
+# Smallest batch scored on a process pool (see default_workers)
+PARALLEL_MIN_TEXTS = 5000
+DEFAULT_CHUNK_SIZE = 2000
+
+_PUNCTUATION = re.compile(r'[^\w\s]')
+
+
+def _score_polarity_chunk(texts: List[str]) -> np.ndarray:
+    """
+    Score one chunk of texts with TextBlob (module level so it can be pickled)
+    
+    Args:
+        texts (List[str]): Texts to score
+    
+    Returns:
+        np.ndarray: Polarity score per text
+    """
+    # Imported on first scoring call (and once per worker), not at module import
+    from textblob import TextBlob
+    
+    return np.fromiter(
+        (TextBlob(text).sentiment.polarity for text in texts),
+        dtype=np.float64,
+        count=len(texts)
+    )
 
 class SentimentAnalyzer:
     """
     Advanced sentiment analysis for sports and betting context
     """
+    @staticmethod
+    def score_polarity(
+        texts: List[str],
+        n_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        score_cache: Optional[ScoreCache] = None,
+        executor: Optional[Executor] = None
+    ) -> np.ndarray:
+        """
+        Score text polarity in chunks, spread across a process pool for large batches
+        
+        Args:
+            texts (List[str]): Texts to score
+            n_workers (Optional[int]): Worker processes, 1 scores serially; chosen
+                from the batch size against PARALLEL_MIN_TEXTS when None
+            chunk_size (int): Texts per worker task
+            score_cache (Optional[ScoreCache]): Cache consulted before scoring
+            executor (Optional[Executor]): Existing pool to run chunks on instead
+                of starting one
+        
+        Returns:
+            np.ndarray: Polarity score per text, in input order
+        """
+        if score_cache is not None:
+            return score_cache.get_or_compute(
+                texts,
+                lambda batch: SentimentAnalyzer.score_polarity(
+                    batch, n_workers=n_workers, chunk_size=chunk_size, executor=executor
+                )
+            )
+        
+        if n_workers is None:
+            n_workers = default_workers(len(texts), PARALLEL_MIN_TEXTS, executor)
+        
+        if n_workers <= 1 or len(texts) <= chunk_size:
+            return _score_polarity_chunk(texts)
+        
+        chunks = [texts[start:start + chunk_size] for start in range(0, len(texts), chunk_size)]
+        with worker_pool(executor, max_workers=min(n_workers, len(chunks))) as pool:
+            return np.concatenate(list(pool.map(_score_polarity_chunk, chunks)))
+    
+    @staticmethod
+    def categorize_sentiments(sentiments: np.ndarray) -> Dict[str, int]:
+        """
+        Count polarity scores per sentiment category in one vectorized pass
+        
+        Args:
+            sentiments (np.ndarray): Polarity scores
+        
+        Returns:
+            Dict of category name to number of scores
+        """
+        codes = (
+            np.digitize(sentiments, _NEGATIVE_EDGES, right=False) +
+            np.digitize(sentiments, _POSITIVE_EDGES, right=True)
+        )
+        counts = np.bincount(codes, minlength=len(SENTIMENT_CATEGORIES))
+        
+        return {
+            category: int(count) for category, count in zip(SENTIMENT_CATEGORIES, counts)
+        }
+    
     @staticmethod
     def analyze_social_sentiment(
         texts: List[str], 
-        sports_context: bool = True
+        sports_context: bool = True,
+        n_workers: Optional[int] = None,
+        score_cache: Optional[ScoreCache] = None,
+        executor: Optional[Executor] = None
     ) -> Dict[str, Any]:
         """
         Perform multi-dimensional sentiment analysis
@@ -21,6 +122,10 @@ class SentimentAnalyzer:
         Args:
             texts (List[str]): List of text for sentiment analysis
             sports_context (bool): Apply sports-specific sentiment weighting
+            n_workers (Optional[int]): Worker processes for polarity scoring
+            score_cache (Optional[ScoreCache]): Cache of raw polarity scores
+            executor (Optional[Executor]): Existing pool for polarity scoring, so
+                repeated calls do not each start one
         
         Returns:
             Dict with comprehensive sentiment analysis
@@ -33,29 +138,17 @@ class SentimentAnalyzer:
             }
         
         # Sentiment scoring
-        sentiments = [TextBlob(text).sentiment.polarity for text in texts]
+        sentiments = SentimentAnalyzer.score_polarity(
+            texts, n_workers=n_workers, score_cache=score_cache, executor=executor
+        )
         
         # Sports context adjustment
         if sports_context:
-            sentiments = [
-                sentiment * (1.2 if sentiment > 0 else 0.8) 
-                for sentiment in sentiments
-            ]
-        
-        # Categorize sentiments
-        sentiment_categories = {
-            'very_negative': [s for s in sentiments if s < -0.6],
-            'negative': [s for s in sentiments if -0.6 <= s < -0.2],
-            'neutral': [s for s in sentiments if -0.2 <= s <= 0.2],
-            'positive': [s for s in sentiments if 0.2 < s <= 0.6],
-            'very_positive': [s for s in sentiments if s > 0.6]
-        }
+            sentiments = sentiments * np.where(sentiments > 0, 1.2, 0.8)
         
         return {
             'overall_sentiment': np.mean(sentiments),
-            'sentiment_breakdown': {
-                category: len(scores) for category, scores in sentiment_categories.items()
-            },
+            'sentiment_breakdown': SentimentAnalyzer.categorize_sentiments(sentiments),
             'text_count': len(texts),
             'sentiment_std_dev': np.std(sentiments)
         }
@@ -76,7 +169,7 @@ class SentimentAnalyzer:
             Dict of key phrases with their importance scores
         """
         # Preprocessing
-        cleaned_texts = [re.sub(r'[^\w\s]', '', text.lower()) for text in texts]
+        cleaned_texts = [_PUNCTUATION.sub('', text.lower()) for text in texts]
         
         # Phrase extraction
         all_phrases = [
@@ -107,8 +200,8 @@ class SentimentAnalyzer:
         if sentiment_history.empty:
             return {'trend_status': 'insufficient_data'}
         
-        # Time-series sentiment analysis
-        sentiment_history['sentiment_ewm'] = sentiment_history['sentiment'].ewm(
+        # Time-series sentiment analysis (kept local so the caller's frame is untouched)
+        sentiment_ewm = sentiment_history['sentiment'].ewm(
             span=5, 
             adjust=False
         ).mean()
@@ -116,16 +209,345 @@ class SentimentAnalyzer:
         # Trend detection
         trend_slope, _ = np.polyfit(
             sentiment_history.index, 
-            sentiment_history['sentiment_ewm'], 
+            sentiment_ewm, 
             1
         )
         
         return {
-            'trend_status': (
-                'improving' if trend_slope > 0 else 
-                'declining' if trend_slope < 0 else 
-                'stable'
-            ),
+            'trend_status': _trend_status(trend_slope),
             'trend_slope': trend_slope,
             'volatility': sentiment_history['sentiment'].std()
-        }
\ No newline at end of file
+        }
+
+
+def _trend_status(trend_slope: float) -> str:
+    return (
+        'improving' if trend_slope > 0 else 
+        'declining' if trend_slope < 0 else 
+        'stable'
+    )
+
+
+class KeyPhraseCounter:
+    """
+    Streaming key-phrase counter for live "top phrases" panels
+    
+    Texts are tokenized the same way as SentimentAnalyzer.extract_key_phrases and
+    counted as n-grams. Memory stays bounded with a batched Space-Saving
+    scheme: once the table holds twice `capacity` phrases it is pruned back to
+    the heaviest `capacity`, and a phrase that (re)enters the table inherits the
+    largest pruned count as its starting value. Reported counts therefore never
+    undercount, and overcount by at most max_error(). With a half-life, counts
+    decay over time using forward decay (new observations get growing weights
+    relative to a landmark), so a refresh costs only the newly ingested texts.
+    """
+    # Rescale stored weights before 2**exponent overflows float precision
+    _MAX_EXPONENT = 50.0
+    
+    def __init__(
+        self,
+        ngram_range: Tuple[int, int] = (1, 1),
+        capacity: int = 10000,
+        half_life_seconds: Optional[float] = None,
+        min_token_length: int = 3
+    ):
+        """
+        Initialize phrase counter
+        
+        Args:
+            ngram_range (Tuple[int, int]): Smallest and largest n-gram size to count
+            capacity (int): Number of phrases retained after pruning
+            half_life_seconds (Optional[float]): Count half-life, None disables decay
+            min_token_length (int): Shortest token kept
+        """
+        self.ngram_range = ngram_range
+        self.capacity = capacity
+        self.half_life_seconds = half_life_seconds
+        self.min_token_length = min_token_length
+        self.texts_seen = 0
+        self._counts: Dict[str, float] = {}
+        # Largest count ever pruned: an upper bound on any untracked phrase's count
+        self._floor = 0.0
+        self._landmark: Optional[float] = None
+    
+    def _tokens(self, text: str) -> List[str]:
+        return [
+            token for token in _PUNCTUATION.sub('', text.lower()).split()
+            if len(token) >= self.min_token_length
+        ]
+    
+    def _weight(self, timestamp: float) -> float:
+        if self.half_life_seconds is None:
+            return 1.0
+        
+        if self._landmark is None:
+            self._landmark = timestamp
+        
+        exponent = (timestamp - self._landmark) / self.half_life_seconds
+        if exponent > self._MAX_EXPONENT:
+            # Move the landmark forward and rescale every stored count once
+            rescale = 2.0 ** -exponent
+            self._counts = {phrase: count * rescale for phrase, count in self._counts.items()}
+            self._floor *= rescale
+            self._landmark = timestamp
+            exponent = 0.0
+        
+        return 2.0 ** exponent
+    
+    def _prune(self):
+        phrases = list(self._counts)
+        counts = np.fromiter(self._counts.values(), dtype=np.float64, count=len(phrases))
+        # Keep everything above the capacity-th count plus the earliest phrases
+        # tied with it, in table order so ties keep ranking by first appearance
+        threshold = np.partition(counts, -self.capacity)[-self.capacity]
+        keep = counts > threshold
+        tied = np.flatnonzero(counts == threshold)
+        keep[tied[:self.capacity - np.count_nonzero(keep)]] = True
+        self._floor = max(self._floor, float(counts[~keep].max()))
+        self._counts = {phrases[i]: counts[i] for i in np.flatnonzero(keep)}
+    
+    def ingest(self, texts: Iterable[str], timestamp: Optional[float] = None) -> int:
+        """
+        Count phrases from new texts
+        
+        Args:
+            texts (Iterable[str]): New texts, consumed lazily (generators are fine)
+            timestamp (Optional[float]): Observation time in seconds, defaults to now
+        
+        Returns:
+            int: Number of texts ingested
+        """
+        weight = self._weight(time.time() if timestamp is None else timestamp)
+        min_n, max_n = self.ngram_range
+        counts = self._counts
+        floor = self._floor
+        ingested = 0
+        
+        for text in texts:
+            tokens = self._tokens(text)
+            for n in range(min_n, max_n + 1):
+                for start in range(len(tokens) - n + 1):
+                    phrase = ' '.join(tokens[start:start + n])
+                    counts[phrase] = counts.get(phrase, floor) + weight
+            
+            ingested += 1
+            if len(counts) >= 2 * self.capacity:
+                self._prune()
+                counts = self._counts
+                floor = self._floor
+        
+        self.texts_seen += ingested
+        return ingested
+    
+    def top_phrases(self, top_n: int = 10, now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Rank the heaviest phrases
+        
+        Equal counts are ordered by when the phrase entered the table, matching
+        SentimentAnalyzer.extract_key_phrases on the same texts.
+        
+        Args:
+            top_n (int): Number of top phrases to return
+            now (Optional[float]): Time to decay counts to, defaults to now
+        
+        Returns:
+            Dict of key phrases with their (decayed) counts
+        """
+        if not self._counts:
+            return {}
+        
+        phrases = list(self._counts)
+        counts = np.fromiter(self._counts.values(), dtype=np.float64, count=len(phrases))
+        
+        top_n = min(top_n, len(phrases))
+        if top_n == 0:
+            return {}
+        
+        # Every phrase tied with the top_n-th count is a candidate; the stable
+        # sort over table order then breaks ties by first appearance
+        threshold = np.partition(counts, -top_n)[-top_n]
+        candidates = np.flatnonzero(counts >= threshold)
+        top = candidates[np.argsort(-counts[candidates], kind='stable')[:top_n]]
+        
+        scale = self._decay_scale(now)
+        return {phrases[i]: float(counts[i] * scale) for i in top}
+    
+    def _decay_scale(self, now: Optional[float]) -> float:
+        if self.half_life_seconds is None or self._landmark is None:
+            return 1.0
+        now = time.time() if now is None else now
+        return 2.0 ** (-(now - self._landmark) / self.half_life_seconds)
+    
+    def max_error(self, now: Optional[float] = None) -> float:
+        """
+        Largest amount by which a count from top_phrases can exceed the true count
+        
+        Zero until the table is first pruned. Phrases counted since before any
+        pruning are exact.
+        
+        Args:
+            now (Optional[float]): Time to decay the bound to, defaults to now
+        
+        Returns:
+            float: Overcount bound, in the same (decayed) units as top_phrases
+        """
+        return float(self._floor * self._decay_scale(now))
+    
+    def reset(self):
+        """
+        Forget all counted phrases
+        """
+        self._counts = {}
+        self._floor = 0.0
+        self._landmark = None
+        self.texts_seen = 0
+
+
+class SentimentTrendTracker:
+    """
+    Incremental counterpart of SentimentAnalyzer.sentiment_trend_analysis
+    
+    Keeps a running EWM (span, adjust=False), running least-squares co-moments
+    of the EWM against the observation index and Welford variance of the raw
+    sentiment, so each new observation costs O(1) and reports the same
+    trend_status / trend_slope / volatility fields.
+    """
+    def __init__(self, span: int = 5):
+        """
+        Initialize trend tracker
+        
+        Args:
+            span (int): EWM span, matching pandas ewm(span=..., adjust=False)
+        """
+        self.span = span
+        self.alpha = 2.0 / (span + 1.0)
+        self.count = 0
+        self.ewm = None
+        
+        # Least-squares state for slope of ewm against index
+        self._mean_index = 0.0
+        self._mean_ewm = 0.0
+        self._index_m2 = 0.0
+        self._co_moment = 0.0
+        
+        # Welford state for raw sentiment volatility
+        self._mean_sentiment = 0.0
+        self._sentiment_m2 = 0.0
+    
+    def update(self, sentiment: float, index: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Fold in one observation
+        
+        Args:
+            sentiment (float): New sentiment value
+            index (Optional[float]): Position on the time axis, defaults to the
+                observation count (0, 1, 2, ...) like a RangeIndex
+        
+        Returns:
+            Dict with sentiment trend insights
+        """
+        index = float(self.count if index is None else index)
+        self.count += 1
+        n = self.count
+        
+        self.ewm = sentiment if self.ewm is None else (
+            (1.0 - self.alpha) * self.ewm + self.alpha * sentiment
+        )
+        
+        d_index = index - self._mean_index
+        self._mean_index += d_index / n
+        self._mean_ewm += (self.ewm - self._mean_ewm) / n
+        self._index_m2 += d_index * (index - self._mean_index)
+        self._co_moment += d_index * (self.ewm - self._mean_ewm)
+        
+        d_sentiment = sentiment - self._mean_sentiment
+        self._mean_sentiment += d_sentiment / n
+        self._sentiment_m2 += d_sentiment * (sentiment - self._mean_sentiment)
+        
+        return self.report()
+    
+    def update_many(self, sentiments: Iterable[float]) -> Dict[str, Any]:
+        """
+        Fold in several observations in order
+        
+        Args:
+            sentiments (Iterable[float]): New sentiment values
+        
+        Returns:
+            Dict with sentiment trend insights
+        """
+        for sentiment in sentiments:
+            self.update(sentiment)
+        return self.report()
+    
+    def report(self) -> Dict[str, Any]:
+        """
+        Current trend insights
+        
+        Returns:
+            Dict with sentiment trend insights
+        """
+        if self.count == 0:
+            return {'trend_status': 'insufficient_data'}
+        
+        trend_slope = self._co_moment / self._index_m2 if self._index_m2 > 0 else 0.0
+        
+        return {
+            'trend_status': _trend_status(trend_slope),
+            'trend_slope': trend_slope,
+            'volatility': (
+                np.sqrt(self._sentiment_m2 / (self.count - 1)) if self.count > 1 else np.nan
+            )
+        }
+    
+    @staticmethod
+    def batch_trends(
+        sentiment_history: pd.DataFrame,
+        entity_column: str,
+        sentiment_column: str = 'sentiment',
+        order_column: Optional[str] = None,
+        span: int = 5
+    ) -> pd.DataFrame:
+        """
+        Compute trends for many entities (players/teams) from one grouped frame
+        
+        Args:
+            sentiment_history (pd.DataFrame): Long-format sentiment history
+            entity_column (str): Column identifying the player/team
+            sentiment_column (str): Sentiment value column
+            order_column (Optional[str]): Time axis column; rows are used in frame
+                order with a per-entity counter when omitted
+            span (int): EWM span
+        
+        Returns:
+            pd.DataFrame: trend_status, trend_slope and volatility per entity
+        """
+        if order_column is not None:
+            sentiment_history = sentiment_history.sort_values(
+                [entity_column, order_column], kind='stable'
+            )
+        
+        groups = sentiment_history.groupby(entity_column, sort=True)
+        index = (
+            sentiment_history[order_column].astype(float) if order_column is not None 
+            else groups.cumcount().astype(float)
+        )
+        sentiment_ewm = groups[sentiment_column].ewm(span=span, adjust=False).mean()
+        sentiment_ewm = sentiment_ewm.reset_index(level=0, drop=True).reindex(sentiment_history.index)
+        
+        # Slope from centred sums per entity
+        keys = sentiment_history[entity_column]
+        d_index = index - index.groupby(keys).transform('mean')
+        d_ewm = sentiment_ewm - sentiment_ewm.groupby(keys).transform('mean')
+        index_m2 = (d_index * d_index).groupby(keys).sum()
+        co_moment = (d_index * d_ewm).groupby(keys).sum()
+        
+        trend_slope = (co_moment / index_m2.where(index_m2 > 0)).fillna(0.0)
+        
+        return pd.DataFrame({
+            'trend_status': np.select(
+                [trend_slope > 0, trend_slope < 0], ['improving', 'declining'], 'stable'
+            ),
+            'trend_slope': trend_slope,
+            'volatility': groups[sentiment_column].std()
+        })
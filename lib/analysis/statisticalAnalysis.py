@@ -2,8 +2,252 @@
 
 import numpy as np
 import pandas as pd
-import scipy.stats as stats
-from typing import Dict, List, Any, Tuple
+from concurrent.futures import Executor
+from statistics import NormalDist
+from typing import Dict, List, Any, Hashable, Optional, Sequence, Tuple, Union
+from common.correlationPairs import correlation_pairs
+from common.workerPool import default_workers, worker_pool
+
+DENSITY_GRID_POINTS = 100
+DENSITY_ENGINES = ('scipy', 'fft')
+SUMMARY_FIELDS = ['mean', 'median', 'mode', 'standard_deviation', 'skewness', 'kurtosis']
+
+# Fewest (group, metric) samples fitted on a process pool (see default_workers)
+PARALLEL_MIN_SAMPLES = 64
+
+# Binned KDE: fine-grid spacing relative to bandwidth, kernel support and grid cap
+_BIN_SPACING_PER_BANDWIDTH = 0.1
+_KERNEL_SUPPORT_BANDWIDTHS = 5.0
+_MAX_FINE_GRID_POINTS = 1 << 16
+
+
+def _kde_bandwidth(std_dev: float, n: int, bw_method: str) -> float:
+    """
+    Kernel standard deviation matching scipy.stats.gaussian_kde's rules
+    
+    Args:
+        std_dev (float): Sample standard deviation (ddof=1)
+        n (int): Number of observations
+        bw_method (str): 'scott' or 'silverman'
+    
+    Returns:
+        float: Kernel bandwidth in data units
+    """
+    if bw_method == 'scott':
+        factor = n ** (-1.0 / 5.0)
+    elif bw_method == 'silverman':
+        factor = (n * 3.0 / 4.0) ** (-1.0 / 5.0)
+    else:
+        raise ValueError(f"Unknown bandwidth method: {bw_method}")
+    return std_dev * factor
+
+
+def _distribution_summary(values: np.ndarray) -> Dict[str, float]:
+    """
+    Mean, median, mode and moments from one sort and one pass of deviations
+    
+    Args:
+        values (np.ndarray): Observations without NaN
+    
+    Returns:
+        Dict with summary statistics (pandas conventions for std/skew/kurtosis)
+    """
+    ordered = np.sort(values)
+    n = len(ordered)
+    
+    # Mode: longest run in sorted order, smallest value on ties (as scipy.stats.mode)
+    run_starts = np.concatenate([[0], np.flatnonzero(np.diff(ordered)) + 1])
+    run_lengths = np.diff(np.append(run_starts, n))
+    mode = ordered[run_starts[np.argmax(run_lengths)]]
+    
+    mean = ordered.mean()
+    deviations = ordered - mean
+    squared = deviations * deviations
+    m2 = squared.mean()
+    m3 = (squared * deviations).mean()
+    m4 = (squared * squared).mean()
+    
+    # Bias-corrected skewness/excess kurtosis as in pandas Series.skew/kurtosis
+    skewness = kurtosis = np.nan
+    if n >= 3:
+        skewness = 0.0 if m2 == 0 else np.sqrt(n * (n - 1)) / (n - 2) * m3 / m2 ** 1.5
+    if n >= 4:
+        kurtosis = 0.0 if m2 == 0 else (
+            (n - 1) / ((n - 2) * (n - 3)) * ((n + 1) * m4 / m2 ** 2 - 3 * (n - 1))
+        )
+    
+    return {
+        'min': ordered[0],
+        'max': ordered[-1],
+        'mean': mean,
+        'median': np.median(ordered),
+        'mode': mode,
+        'standard_deviation': np.sqrt(m2 * n / (n - 1)) if n > 1 else np.nan,
+        'skewness': skewness,
+        'kurtosis': kurtosis
+    }
+
+
+def _binned_fft_kde(values: np.ndarray, x_range: np.ndarray, bandwidth: float) -> np.ndarray:
+    """
+    Gaussian KDE on an evenly spaced grid via linear binning and FFT convolution
+    
+    Data is linearly binned onto a grid k times finer than x_range (fine enough
+    that bins are a fraction of the bandwidth), convolved with the sampled
+    kernel and read back at every k-th point, so cost is O(n + M log M).
+    
+    Args:
+        values (np.ndarray): Observations inside [x_range[0], x_range[-1]]
+        x_range (np.ndarray): Evenly spaced evaluation grid
+        bandwidth (float): Kernel standard deviation
+    
+    Returns:
+        np.ndarray: Density at each grid point
+    """
+    lo, hi = x_range[0], x_range[-1]
+    intervals = len(x_range) - 1
+    refine = int(np.ceil((hi - lo) / intervals / (bandwidth * _BIN_SPACING_PER_BANDWIDTH)))
+    refine = max(1, min(refine, (_MAX_FINE_GRID_POINTS - 1) // intervals))
+    n_fine = intervals * refine + 1
+    spacing = (hi - lo) / (n_fine - 1)
+    
+    # Linear binning
+    position = (values - lo) / spacing
+    left = np.clip(np.floor(position).astype(np.intp), 0, n_fine - 2)
+    fraction = position - left
+    counts = (
+        np.bincount(left, weights=1.0 - fraction, minlength=n_fine) +
+        np.bincount(left + 1, weights=fraction, minlength=n_fine)
+    )
+    
+    # Sampled kernel over +/- support bandwidths
+    half_width = min(n_fine - 1, int(np.ceil(_KERNEL_SUPPORT_BANDWIDTHS * bandwidth / spacing)))
+    offsets = np.arange(-half_width, half_width + 1) * spacing
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (np.sqrt(2 * np.pi) * bandwidth * len(values))
+    
+    # Linear convolution through zero-padded real FFTs
+    size = 1 << int(np.ceil(np.log2(n_fine + 2 * half_width)))
+    density = np.fft.irfft(np.fft.rfft(counts, size) * np.fft.rfft(kernel, size), size)
+    density = density[half_width:half_width + n_fine:refine]
+    
+    return np.maximum(density, 0.0)
+
+
+def _fit_density(
+    values: np.ndarray,
+    density_engine: str = 'fft',
+    bw_method: str = 'scott',
+    grid_points: int = DENSITY_GRID_POINTS
+) -> Optional[Tuple[np.ndarray, np.ndarray, Dict[str, float]]]:
+    """
+    Fit a density to one sample and summarize it
+    
+    Args:
+        values (np.ndarray): Observations (NaN are dropped)
+        density_engine (str): 'scipy' (gaussian_kde) or 'fft' (binned FFT KDE)
+        bw_method (str): 'scott' or 'silverman'
+        grid_points (int): Number of evaluation points between min and max
+    
+    Returns:
+        Optional tuple of grid, pdf and summary; None when the sample has fewer
+        than two distinct values
+    """
+    if density_engine not in DENSITY_ENGINES:
+        raise ValueError(f"Unknown density engine: {density_engine}")
+    
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if len(values) < 2:
+        return None
+    
+    summary = _distribution_summary(values)
+    if summary['max'] == summary['min']:
+        return None
+    
+    x_range = np.linspace(summary['min'], summary['max'], grid_points)
+    
+    if density_engine == 'scipy':
+        # Imported here so callers that never use the scipy engine skip its import
+        import scipy.stats as stats
+        pdf = stats.gaussian_kde(values, bw_method=bw_method)(x_range)
+    else:
+        bandwidth = _kde_bandwidth(summary['standard_deviation'], len(values), bw_method)
+        pdf = _binned_fft_kde(values, x_range, bandwidth)
+    
+    return x_range, pdf, summary
+
+
+def _evidence_log_likelihood(count: np.ndarray, m2: np.ndarray) -> np.ndarray:
+    """
+    Log of prod(norm.pdf(x, mean, std)) over each evidence set, in closed form
+    
+    With the evidence's own mean and population std, sum(((x - mean) / std)^2)
+    equals the count, so the log-likelihood only needs count and M2 (the sum of
+    squared deviations). Empty sets give 0 (likelihood 1); zero-spread sets give
+    NaN, as norm.pdf with scale=0 does.
+    
+    Args:
+        count (np.ndarray): Observations per evidence set
+        m2 (np.ndarray): Sum of squared deviations per evidence set
+    
+    Returns:
+        np.ndarray: Log-likelihood per evidence set
+    """
+    count = np.asarray(count, dtype=np.float64)
+    m2 = np.asarray(m2, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_likelihood = -count * (0.5 * np.log(2 * np.pi * m2 / count) + 0.5)
+    log_likelihood = np.where(count == 0, 0.0, log_likelihood)
+    return np.where((count > 0) & (m2 <= 0), np.nan, log_likelihood)
+
+
+def _log_space_posterior(prior_prob: np.ndarray, log_likelihood: np.ndarray) -> np.ndarray:
+    """
+    prior * L / (prior * L + (1 - prior)) evaluated without forming L
+    
+    Args:
+        prior_prob (np.ndarray): Prior probabilities
+        log_likelihood (np.ndarray): Evidence log-likelihoods
+    
+    Returns:
+        np.ndarray: Posterior probabilities
+    """
+    prior_prob = np.asarray(prior_prob, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_numerator = np.log(prior_prob) + log_likelihood
+        return np.exp(log_numerator - np.logaddexp(log_numerator, np.log1p(-prior_prob)))
+
+
+def _posterior_log_odds(prior_prob: np.ndarray, log_likelihood: np.ndarray) -> np.ndarray:
+    """
+    log(posterior / (1 - posterior)), finite even when the posterior rounds to 0 or 1
+    
+    Args:
+        prior_prob (np.ndarray): Prior probabilities
+        log_likelihood (np.ndarray): Evidence log-likelihoods
+    
+    Returns:
+        np.ndarray: Posterior log-odds
+    """
+    prior_prob = np.asarray(prior_prob, dtype=np.float64)
+    with np.errstate(divide='ignore'):
+        return np.log(prior_prob) - np.log1p(-prior_prob) + log_likelihood
+
+
+def _fit_density_chunk(
+    samples: List[np.ndarray],
+    density_engine: str,
+    bw_method: str,
+    grid_points: int
+) -> List[Optional[Tuple[np.ndarray, np.ndarray, Dict[str, float]]]]:
+    """
+    Fit densities for a chunk of samples (module level so it can be pickled)
+    """
+    return [
+        _fit_density(values, density_engine=density_engine, bw_method=bw_method, grid_points=grid_points)
+        for values in samples
+    ]
+
 
 class StatisticalAnalyzer:
     """
@@ -32,7 +276,7 @@ class StatisticalAnalyzer:
         z_scores = (data - mean) / std_dev
         
         # Identify outliers
-        threshold = stats.norm.ppf(threshold_percentile)
+        threshold = NormalDist().inv_cdf(threshold_percentile)
         outliers = data[np.abs(z_scores) > threshold]
         
         return {
@@ -43,10 +287,87 @@ class StatisticalAnalyzer:
             'outlier_indices': np.where(np.abs(z_scores) > threshold)[0].tolist()
         }
     
+    @staticmethod
+    def calculate_z_scores_batch(
+        data: Union[np.ndarray, pd.DataFrame],
+        threshold_percentile: float = 0.95,
+        group_column: Optional[str] = None,
+        value_columns: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Calculate Z-scores and outliers for many series in one vectorized pass
+        
+        Args:
+            data (Union[np.ndarray, pd.DataFrame]): Either a 2-D array with one series
+                per row (pad ragged series with NaN) or a long-format DataFrame
+            threshold_percentile (float): Outlier threshold
+            group_column (Optional[str]): Series key column for DataFrame input
+                (e.g. player_id); the whole frame is one group when omitted
+            value_columns (Optional[List[str]]): Stat columns for DataFrame input,
+                defaults to every numeric column except the group column
+        
+        Returns:
+            Dict with per-series means/standard deviations and z-score/outlier arrays
+            aligned with the input values (NaN z-scores for zero-spread series and
+            rows with a missing group key)
+        """
+        threshold = NormalDist().inv_cdf(threshold_percentile)
+        
+        if isinstance(data, pd.DataFrame):
+            if value_columns is None:
+                value_columns = [
+                    column for column in data.select_dtypes(include='number').columns 
+                    if column != group_column
+                ]
+            values = data[value_columns].to_numpy(dtype=np.float64)
+            
+            if group_column is None:
+                codes, groups = np.zeros(len(data), dtype=np.intp), pd.Index([None])
+            else:
+                codes, groups = pd.factorize(data[group_column], sort=True)
+            
+            # Rows without a group key (code -1) belong to no series and get NaN z-scores
+            keyed = codes >= 0
+            grouped = pd.DataFrame(values[keyed], columns=value_columns).groupby(codes[keyed])
+            means = grouped.mean().to_numpy()
+            std_devs = grouped.std(ddof=0).to_numpy()
+            
+            z_scores = np.full_like(values, np.nan)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                z_scores[keyed] = (
+                    (values[keyed] - means[codes[keyed]]) 
+                    / np.where(std_devs > 0, std_devs, np.nan)[codes[keyed]]
+                )
+            
+            return {
+                'groups': groups,
+                'columns': value_columns,
+                'mean': means,
+                'standard_deviation': std_devs,
+                'z_scores': z_scores,
+                'outlier_mask': np.abs(z_scores) > threshold
+            }
+        
+        values = np.atleast_2d(np.asarray(data, dtype=np.float64))
+        means = np.nanmean(values, axis=1, keepdims=True)
+        std_devs = np.nanstd(values, axis=1, keepdims=True)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_scores = (values - means) / np.where(std_devs > 0, std_devs, np.nan)
+        
+        return {
+            'mean': means.ravel(),
+            'standard_deviation': std_devs.ravel(),
+            'z_scores': z_scores,
+            'outlier_mask': np.abs(z_scores) > threshold
+        }
+    
     @staticmethod
     def probabilistic_prop_model(
         historical_data: pd.DataFrame, 
-        prop_metric: str
+        prop_metric: str,
+        density_engine: str = 'scipy',
+        bw_method: str = 'scott'
     ) -> Dict[str, Any]:
         """
         Create probabilistic model for prop bet predictions
@@ -54,6 +375,9 @@ class StatisticalAnalyzer:
         Args:
             historical_data (pd.DataFrame): Historical performance data
             prop_metric (str): Metric to model (e.g., 'points')
+            density_engine (str): 'scipy' for exact gaussian_kde evaluation or
+                'fft' for the binned FFT KDE (near-identical PDF, O(n + m log m))
+            bw_method (str): Bandwidth rule, 'scott' or 'silverman'
         
         Returns:
             Dict with probabilistic model insights
@@ -61,27 +385,115 @@ class StatisticalAnalyzer:
         if historical_data.empty:
             return {'model_status': 'insufficient_data'}
         
-        # Kernel Density Estimation
-        kde = stats.gaussian_kde(historical_data[prop_metric])
-        
-        # Probability Distribution Analysis
-        x_range = np.linspace(
-            historical_data[prop_metric].min(), 
-            historical_data[prop_metric].max(), 
-            100
+        # Kernel Density Estimation and summary statistics
+        fitted = _fit_density(
+            historical_data[prop_metric].to_numpy(), 
+            density_engine=density_engine, 
+            bw_method=bw_method
         )
+        if fitted is None:
+            return {'model_status': 'insufficient_data'}
+        
+        x_range, pdf, summary = fitted
         
         return {
             'distribution': {
                 'x': list(x_range),
-                'pdf': list(kde(x_range))
+                'pdf': list(pdf)
             },
-            'mean': historical_data[prop_metric].mean(),
-            'median': historical_data[prop_metric].median(),
-            'mode': stats.mode(historical_data[prop_metric])[0][0],
-            'standard_deviation': historical_data[prop_metric].std(),
-            'skewness': historical_data[prop_metric].skew(),
-            'kurtosis': historical_data[prop_metric].kurtosis()
+            'mean': summary['mean'],
+            'median': summary['median'],
+            'mode': summary['mode'],
+            'standard_deviation': summary['standard_deviation'],
+            'skewness': summary['skewness'],
+            'kurtosis': summary['kurtosis']
+        }
+    
+    @staticmethod
+    def probabilistic_prop_model_batch(
+        historical_data: pd.DataFrame,
+        metrics: List[str],
+        group_column: str = 'player_id',
+        density_engine: str = 'fft',
+        bw_method: str = 'scott',
+        grid_points: int = DENSITY_GRID_POINTS,
+        n_workers: Optional[int] = None,
+        samples_per_task: int = 256,
+        executor: Optional[Executor] = None
+    ) -> Dict[str, Any]:
+        """
+        Fit probabilistic prop models for every (group, metric) pair of a slate
+        
+        The frame is grouped once (one stable sort on the group key), each metric
+        column is split into per-group views and fits are spread across a process
+        pool in chunks.
+        
+        Args:
+            historical_data (pd.DataFrame): Long historical frame, one row per game
+            metrics (List[str]): Metric columns to model (e.g., ['points', 'assists'])
+            group_column (str): Column identifying the player
+            density_engine (str): 'fft' or 'scipy'
+            bw_method (str): Bandwidth rule, 'scott' or 'silverman'
+            grid_points (int): Number of evaluation points per density
+            n_workers (Optional[int]): Worker processes, 1 fits serially; chosen
+                from the sample count against PARALLEL_MIN_SAMPLES when None
+            samples_per_task (int): Samples fitted per worker task
+            executor (Optional[Executor]): Existing pool to fit on instead of
+                starting one
+        
+        Returns:
+            Dict with a 'table' DataFrame (group, metric, model_status, observation
+            count and summary statistics per row) and row-aligned 'grid' and 'pdf'
+            arrays of shape (rows, grid_points), NaN for insufficient data
+        """
+        codes, groups = pd.factorize(historical_data[group_column], sort=True)
+        # Rows without a group key (code -1) sort first and are left out
+        order = np.argsort(codes, kind='stable')[np.count_nonzero(codes < 0):]
+        boundaries = np.cumsum(np.bincount(codes[order], minlength=len(groups)))[:-1]
+        
+        samples = []
+        # np.split would still yield one empty piece per metric when there are no groups
+        for metric in metrics if len(groups) else []:
+            column = historical_data[metric].to_numpy(dtype=np.float64)[order]
+            samples.extend(np.split(column, boundaries))
+        
+        if n_workers is None:
+            n_workers = default_workers(len(samples), PARALLEL_MIN_SAMPLES, executor)
+        
+        chunks = [samples[start:start + samples_per_task] for start in range(0, len(samples), samples_per_task)]
+        fit_args = (density_engine, bw_method, grid_points)
+        if n_workers <= 1 or len(chunks) <= 1:
+            fitted = [_fit_density_chunk(chunk, *fit_args) for chunk in chunks]
+        else:
+            with worker_pool(executor, max_workers=min(n_workers, len(chunks))) as pool:
+                fitted = list(pool.map(
+                    _fit_density_chunk, chunks, *[[arg] * len(chunks) for arg in fit_args]
+                ))
+        fitted = [result for chunk in fitted for result in chunk]
+        
+        # Columnar results
+        n_rows = len(samples)
+        grid = np.full((n_rows, grid_points), np.nan)
+        pdf = np.full((n_rows, grid_points), np.nan)
+        summaries = np.full((n_rows, len(SUMMARY_FIELDS)), np.nan)
+        for row, result in enumerate(fitted):
+            if result is not None:
+                grid[row], pdf[row] = result[0], result[1]
+                summaries[row] = [result[2][field] for field in SUMMARY_FIELDS]
+        
+        fitted_mask = np.array([result is not None for result in fitted], dtype=bool)
+        table = pd.DataFrame({
+            group_column: np.tile(np.asarray(groups), len(metrics)),
+            'metric': np.repeat(metrics, len(groups)),
+            'model_status': np.where(fitted_mask, 'fitted', 'insufficient_data'),
+            'observations': np.array([np.count_nonzero(~np.isnan(values)) for values in samples], dtype=np.int64)
+        })
+        table[SUMMARY_FIELDS] = summaries
+        
+        return {
+            'table': table,
+            'grid': grid,
+            'pdf': pdf
         }
     
     @staticmethod
@@ -97,26 +509,68 @@ class StatisticalAnalyzer:
             evidence_data (List[float]): Additional evidence/data points
         
         Returns:
-            Dict with Bayesian probability metrics
+            Dict with Bayesian probability metrics. For long histories the
+            likelihood and posterior probability round to 0.0 in float64;
+            log_likelihood and posterior_log_odds stay finite and keep such
+            props comparable.
         """
-        # Likelihood calculation
-        likelihood = np.prod([
-            stats.norm.pdf(x, loc=np.mean(evidence_data), scale=np.std(evidence_data)) 
-            for x in evidence_data
-        ])
+        evidence = np.asarray(evidence_data, dtype=np.float64)
         
-        # Posterior probability
-        posterior = (prior_prob * likelihood) / (
-            (prior_prob * likelihood) + (1 - prior_prob)
+        # Likelihood calculation in log space (closed form in count and M2)
+        log_likelihood = _evidence_log_likelihood(
+            len(evidence), np.sum((evidence - evidence.mean()) ** 2) if len(evidence) else 0.0
         )
         
+        # Posterior probability
+        posterior = float(_log_space_posterior(prior_prob, log_likelihood))
+        
         return {
             'prior_probability': prior_prob,
-            'likelihood': likelihood,
+            'likelihood': float(np.exp(log_likelihood)),
+            'log_likelihood': float(log_likelihood),
             'posterior_probability': posterior,
+            'posterior_log_odds': float(_posterior_log_odds(prior_prob, log_likelihood)),
             'probability_shift': posterior - prior_prob
         }
     
+    @staticmethod
+    def bayesian_probability_batch(
+        prior_probs: np.ndarray,
+        evidence_sets: Sequence[Sequence[float]]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Bayesian probability estimates for many props at once
+        
+        Args:
+            prior_probs (np.ndarray): Prior probability per prop
+            evidence_sets (Sequence[Sequence[float]]): Ragged evidence per prop
+        
+        Returns:
+            Dict with prior, log-likelihood, posterior, posterior log-odds and
+            shift arrays per prop
+        """
+        prior_probs = np.asarray(prior_probs, dtype=np.float64)
+        lengths = np.fromiter((len(evidence) for evidence in evidence_sets), dtype=np.intp, count=len(evidence_sets))
+        values = np.concatenate([np.asarray(evidence, dtype=np.float64) for evidence in evidence_sets]) \
+            if lengths.sum() else np.zeros(0)
+        codes = np.repeat(np.arange(len(lengths)), lengths)
+        
+        # Per-prop mean and M2 from flat values
+        sums = np.bincount(codes, weights=values, minlength=len(lengths))
+        means = np.divide(sums, lengths, out=np.zeros_like(sums), where=lengths > 0)
+        m2 = np.bincount(codes, weights=(values - means[codes]) ** 2, minlength=len(lengths))
+        
+        log_likelihood = _evidence_log_likelihood(lengths, m2)
+        posterior = _log_space_posterior(prior_probs, log_likelihood)
+        
+        return {
+            'prior_probability': prior_probs,
+            'log_likelihood': log_likelihood,
+            'posterior_probability': posterior,
+            'posterior_log_odds': _posterior_log_odds(prior_probs, log_likelihood),
+            'probability_shift': posterior - prior_probs
+        }
+    
     @staticmethod
     def multi_variable_correlation(
         data: pd.DataFrame, 
@@ -137,10 +591,241 @@ class StatisticalAnalyzer:
         
         corr_matrix = data[variables].corr()
         
+        # Strongest off-diagonal pair (the diagonal is always 1)
+        strongest = correlation_pairs(corr_matrix, top_k=1, absolute=False)
+        if strongest.empty:
+            strongest_correlation = {'variables': None, 'correlation_value': np.nan}
+        else:
+            strongest_correlation = {
+                'variables': (strongest['feature1'].iloc[0], strongest['feature2'].iloc[0]),
+                'correlation_value': strongest['correlation'].iloc[0]
+            }
+        
         return {
             'correlation_matrix': corr_matrix.to_dict(),
-            'strongest_correlation': {
-                'variables': corr_matrix.unstack().nlargest(1).index[0],
-                'correlation_value': corr_matrix.unstack().nlargest(1)[0]
+            'strongest_correlation': strongest_correlation
+        }
+
+
+def _as_stat_matrix(values: np.ndarray) -> np.ndarray:
+    # 1-D chunks are one stat column; reshape(len, -1) fails on empty chunks
+    values = np.asarray(values, dtype=np.float64)
+    return values[:, None] if values.ndim == 1 else values
+
+
+class StreamingZScore:
+    """
+    Streaming Welford/Chan accumulator for z-scores over data too big for memory
+    
+    Feed chunks through update() to accumulate count, mean and M2 per group
+    and stat column, then make a second pass with score() to get z-scores and
+    outlier flags consistent with StatisticalAnalyzer.calculate_z_scores_batch.
+    Missing (NaN) values are skipped per column, as the batch scan does.
+    """
+    def __init__(self, threshold_percentile: float = 0.95):
+        """
+        Initialize streaming accumulator
+        
+        Args:
+            threshold_percentile (float): Outlier threshold
+        """
+        self.threshold = NormalDist().inv_cdf(threshold_percentile)
+        self.groups: List[Hashable] = []
+        self._slots: Dict[Hashable, int] = {}
+        self._count = None
+        self._mean = None
+        self._m2 = None
+    
+    def _group_codes(self, groups: Optional[np.ndarray], n_rows: int, add: bool) -> np.ndarray:
+        if groups is None:
+            groups = np.zeros(n_rows, dtype=np.intp)
+        
+        chunk_codes, chunk_keys = pd.factorize(np.asarray(groups))
+        slots = np.empty(len(chunk_keys), dtype=np.intp)
+        for position, key in enumerate(chunk_keys):
+            if key not in self._slots:
+                if not add:
+                    raise KeyError(f"Group {key!r} was never seen by update()")
+                self._slots[key] = len(self.groups)
+                self.groups.append(key)
+            slots[position] = self._slots[key]
+        
+        # Rows without a group key stay at -1
+        codes = np.full(len(chunk_codes), -1, dtype=np.intp)
+        keyed = chunk_codes >= 0
+        codes[keyed] = slots[chunk_codes[keyed]]
+        return codes
+    
+    def update(self, values: np.ndarray, groups: Optional[np.ndarray] = None):
+        """
+        Merge one chunk into the running statistics
+        
+        Rows with a missing group key are ignored, as are NaN values (per column).
+        
+        Args:
+            values (np.ndarray): Chunk values, 1-D or (rows, stats)
+            groups (Optional[np.ndarray]): Group key per row
+        """
+        values = _as_stat_matrix(values)
+        codes = self._group_codes(groups, len(values), add=True)
+        values, codes = values[codes >= 0], codes[codes >= 0]
+        n_groups, n_stats = len(self.groups), values.shape[1]
+        
+        if self._count is None:
+            self._count = np.zeros((0, n_stats))
+            self._mean = np.zeros((0, n_stats))
+            self._m2 = np.zeros((0, n_stats))
+        
+        grow = n_groups - len(self._count)
+        if grow:
+            self._count = np.vstack([self._count, np.zeros((grow, n_stats))])
+            self._mean = np.vstack([self._mean, np.zeros((grow, n_stats))])
+            self._m2 = np.vstack([self._m2, np.zeros((grow, n_stats))])
+        
+        # Chunk statistics per group and column, over the non-missing values only
+        observed = ~np.isnan(values)
+        chunk_count = np.zeros((n_groups, n_stats))
+        chunk_mean = np.zeros((n_groups, n_stats))
+        chunk_m2 = np.zeros((n_groups, n_stats))
+        for column in range(n_stats):
+            column_codes = codes[observed[:, column]]
+            column_values = values[observed[:, column], column]
+            counts = np.bincount(column_codes, minlength=n_groups).astype(np.float64)
+            sums = np.bincount(column_codes, weights=column_values, minlength=n_groups)
+            chunk_count[:, column] = counts
+            chunk_mean[:, column] = np.divide(sums, counts, out=np.zeros(n_groups), where=counts > 0)
+            deviations = column_values - chunk_mean[column_codes, column]
+            chunk_m2[:, column] = np.bincount(column_codes, weights=deviations ** 2, minlength=n_groups)
+        
+        # Chan et al. parallel merge
+        total = self._count + chunk_count
+        delta = chunk_mean - self._mean
+        weight = np.divide(chunk_count, total, out=np.zeros_like(total), where=total > 0)
+        self._mean = self._mean + delta * weight
+        self._m2 = self._m2 + chunk_m2 + delta ** 2 * (self._count * weight)
+        self._count = total
+    
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Accumulated statistics per group
+        
+        Returns:
+            Dict with group keys and per (group, stat) counts, means and population
+            standard deviations (NaN where a group has no values for a stat; all
+            empty before the first update)
+        """
+        if self._count is None:
+            return {
+                'groups': [],
+                'count': np.zeros((0, 0)),
+                'mean': np.zeros((0, 0)),
+                'standard_deviation': np.zeros((0, 0))
             }
-        }
\ No newline at end of file
+        
+        seen = self._count > 0
+        return {
+            'groups': list(self.groups),
+            'count': self._count,
+            'mean': np.where(seen, self._mean, np.nan),
+            'standard_deviation': np.sqrt(
+                np.divide(self._m2, self._count, out=np.full_like(self._m2, np.nan), where=seen)
+            )
+        }
+    
+    def score(self, values: np.ndarray, groups: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Z-score a chunk against the accumulated statistics
+        
+        Args:
+            values (np.ndarray): Chunk values, 1-D or (rows, stats)
+            groups (Optional[np.ndarray]): Group key per row
+        
+        Returns:
+            Dict with z-scores and outlier mask for the chunk (NaN z-scores for
+            rows with a missing group key)
+        """
+        values = _as_stat_matrix(values)
+        codes = self._group_codes(groups, len(values), add=False)
+        keyed = codes >= 0
+        statistics = self.statistics()
+        means, std_devs = statistics['mean'], statistics['standard_deviation']
+        
+        z_scores = np.full_like(values, np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_scores[keyed] = (
+                (values[keyed] - means[codes[keyed]]) 
+                / np.where(std_devs > 0, std_devs, np.nan)[codes[keyed]]
+            )
+        
+        return {
+            'z_scores': z_scores,
+            'outlier_mask': np.abs(z_scores) > self.threshold
+        }
+
+
+class BayesianPropUpdater:
+    """
+    Incremental form of StatisticalAnalyzer.bayesian_probability_estimation
+    
+    Keeps count, mean and M2 (Welford) of each prop's evidence, so folding in a
+    new game result is O(1) and never revisits the history.
+    """
+    def __init__(self):
+        """
+        Initialize an empty updater
+        """
+        self._state: Dict[Hashable, List[float]] = {}
+    
+    def set_prior(self, prop: Hashable, prior_prob: float, evidence_data: Sequence[float] = ()):
+        """
+        Register a prop, optionally seeding it with existing evidence
+        
+        Args:
+            prop (Hashable): Prop identifier
+            prior_prob (float): Initial probability estimate
+            evidence_data (Sequence[float]): Evidence gathered so far
+        """
+        evidence = np.asarray(evidence_data, dtype=np.float64)
+        mean = evidence.mean() if len(evidence) else 0.0
+        self._state[prop] = [prior_prob, float(len(evidence)), mean, float(np.sum((evidence - mean) ** 2))]
+    
+    def update(self, prop: Hashable, value: float) -> Dict[str, float]:
+        """
+        Fold in one new game result
+        
+        Args:
+            prop (Hashable): Prop identifier registered with set_prior
+            value (float): New evidence data point
+        
+        Returns:
+            Dict with Bayesian probability metrics
+        """
+        state = self._state[prop]
+        state[1] += 1.0
+        delta = value - state[2]
+        state[2] += delta / state[1]
+        state[3] += delta * (value - state[2])
+        return self.estimate(prop)
+    
+    def estimate(self, prop: Hashable) -> Dict[str, float]:
+        """
+        Current Bayesian estimate for a prop
+        
+        Args:
+            prop (Hashable): Prop identifier
+        
+        Returns:
+            Dict with Bayesian probability metrics
+        """
+        prior_prob, count, _, m2 = self._state[prop]
+        log_likelihood = float(_evidence_log_likelihood(count, m2))
+        posterior = float(_log_space_posterior(prior_prob, log_likelihood))
+        
+        return {
+            'prior_probability': prior_prob,
+            'likelihood': float(np.exp(log_likelihood)),
+            'log_likelihood': log_likelihood,
+            'posterior_probability': posterior,
+            'posterior_log_odds': float(_posterior_log_odds(prior_prob, log_likelihood)),
+            'probability_shift': posterior - prior_prob
+        }
@@ -0,0 +1,127 @@
+"""
+Import-time benchmark for lib/common, lib/analysis and lib/ml/models
+
+Each module is imported in a fresh interpreter. The run fails (exit code 1)
+when an import pulls in a heavy dependency (TensorFlow, scikit-learn, SciPy,
+TextBlob) or when its wall time, beyond the NumPy/pandas baseline every module
+pays, exceeds the budget.
+
+Usage: python lib/benchmarks/benchmarkImports.py [--budget-ms 300] [--repeat 3]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+LIB_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEARCH_PATHS = [LIB_DIR, os.path.join(LIB_DIR, 'ml')]
+
+MODULES = [
+    'common.correlationPairs',
+    'common.workerPool',
+    'analysis.scoreCache',
+    'analysis.sentimentAnalysis',
+    'analysis.statisticalAnalysis',
+    'models.artifactStore',
+    'models.clutchInference',
+    'models.clutchModel',
+    'models.correlationModel',
+    'models.modelRegistry',
+    'models.sentimentModel',
+    'models.timeSeriesModel'
+]
+
+HEAVY_MODULES = ['tensorflow', 'keras', 'tf_keras', 'sklearn', 'scipy', 'textblob']
+
+# Imported by nearly everything, so measured once and subtracted
+BASELINE_IMPORTS = 'numpy, pandas'
+
+DEFAULT_BUDGET_MS = 300.0
+
+_PROBE = """
+import sys, time, json
+sys.path[:0] = {paths!r}
+start = time.perf_counter()
+import {imports}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'seconds': elapsed,
+    'heavy': [name for name in {heavy!r} if name in sys.modules]
+}}))
+"""
+
+
+def probe(imports: str) -> Dict:
+    """
+    Time one import statement in a fresh interpreter
+
+    Args:
+        imports (str): Comma-separated modules for an import statement
+
+    Returns:
+        Dict with elapsed seconds and the heavy modules left in sys.modules
+    """
+    code = _PROBE.format(paths=SEARCH_PATHS, imports=imports, heavy=HEAVY_MODULES)
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"import {imports} failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def median_probe(imports: str, repeat: int) -> Dict:
+    runs = [probe(imports) for _ in range(repeat)]
+    return {
+        'seconds': statistics.median(run['seconds'] for run in runs),
+        'heavy': sorted({name for run in runs for name in run['heavy']})
+    }
+
+
+def run_benchmark(modules: List[str], budget_ms: float, repeat: int) -> bool:
+    """
+    Benchmark each module and print a report
+
+    Args:
+        modules (List[str]): Dotted module names, relative to lib/ and lib/ml/
+        budget_ms (float): Allowed import time beyond the baseline, per module
+        repeat (int): Fresh-interpreter runs per module (median is reported)
+
+    Returns:
+        bool: True when every module is within budget and imports nothing heavy
+    """
+    baseline = median_probe(BASELINE_IMPORTS, repeat)['seconds']
+    print(f"baseline ({BASELINE_IMPORTS}): {baseline * 1000:.0f} ms")
+
+    passed = True
+    for module in modules:
+        result = median_probe(module, repeat)
+        extra_ms = max(result['seconds'] - baseline, 0.0) * 1000
+
+        problems = []
+        if extra_ms > budget_ms:
+            problems.append(f"over budget ({budget_ms:.0f} ms)")
+        if result['heavy']:
+            problems.append(f"imports {', '.join(result['heavy'])}")
+
+        status = 'FAIL ' + '; '.join(problems) if problems else 'ok'
+        print(f"{module:<32} +{extra_ms:7.1f} ms  {status}")
+        passed = passed and not problems
+
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help='allowed import time per module beyond the numpy/pandas baseline')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per module')
+    parser.add_argument('modules', nargs='*', default=MODULES, help='modules to check')
+    args = parser.parse_args()
+
+    sys.exit(0 if run_benchmark(args.modules, args.budget_ms, args.repeat) else 1)
+
+
+if __name__ == '__main__':
+    main()
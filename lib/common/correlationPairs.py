@@ -0,0 +1,63 @@
+# lib/common/correlationPairs.py
+
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Union
+
+
+def correlation_pairs(
+    correlation_matrix: Union[pd.DataFrame, np.ndarray],
+    threshold: Optional[float] = None,
+    top_k: Optional[int] = None,
+    absolute: bool = True,
+    features: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Extract off-diagonal feature pairs from a correlation matrix as a sparse pair table
+
+    Only the strict upper triangle is considered, so the trivial diagonal and
+    mirrored duplicates never appear.
+
+    Args:
+        correlation_matrix (Union[pd.DataFrame, np.ndarray]): Square correlation matrix
+        threshold (Optional[float]): Keep pairs whose strength is at least this value
+        top_k (Optional[int]): Keep only the k strongest pairs (argpartition)
+        absolute (bool): Rank/threshold on |correlation| rather than the signed value
+        features (Optional[List[str]]): Feature names for array input
+
+    Returns:
+        pd.DataFrame: feature1, feature2, row/column positions i, j and correlation,
+        in upper-triangle order or, with top_k, strongest first
+    """
+    if isinstance(correlation_matrix, pd.DataFrame):
+        features = list(correlation_matrix.columns)
+        matrix = correlation_matrix.to_numpy(dtype=np.float64)
+    else:
+        matrix = np.asarray(correlation_matrix, dtype=np.float64)
+        if features is None:
+            features = list(range(matrix.shape[0]))
+
+    rows, columns = np.triu_indices(matrix.shape[0], k=1)
+    values = matrix[rows, columns]
+    strength = np.abs(values) if absolute else values.copy()
+    strength[np.isnan(strength)] = -np.inf
+
+    if threshold is not None:
+        keep = np.flatnonzero(strength >= threshold)
+    else:
+        keep = np.arange(len(values))
+
+    if top_k is not None and top_k < len(keep):
+        keep = keep[np.argpartition(-strength[keep], top_k - 1)[:top_k]]
+    if top_k is not None:
+        keep = keep[np.argsort(-strength[keep], kind='stable')]
+
+    feature_names = np.asarray(features, dtype=object)
+
+    return pd.DataFrame({
+        'feature1': feature_names[rows[keep]],
+        'feature2': feature_names[columns[keep]],
+        'i': rows[keep].astype(np.int32),
+        'j': columns[keep].astype(np.int32),
+        'correlation': values[keep]
+    })
@@ -0,0 +1,54 @@
+# lib/common/workerPool.py
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+def default_workers(n_items: int, min_items: int, executor: Optional[Executor] = None) -> int:
+    """
+    Worker count for a batch when the caller gives none
+
+    Below min_items items a process pool costs more than it saves, so the
+    batch runs serially; otherwise work is split one share per CPU. A
+    supplied executor is always used, split by its own pool size.
+
+    Args:
+        n_items (int): Units of work in the batch (texts, samples, features)
+        min_items (int): Smallest batch worth a process pool
+        executor (Optional[Executor]): Executor supplied by the caller
+
+    Returns:
+        int: Number of workers
+    """
+    if executor is not None:
+        # Both concurrent.futures pools record their size here; never below 2,
+        # which callers read as "run inline"
+        return max(getattr(executor, '_max_workers', None) or os.cpu_count() or 1, 2)
+    if n_items < min_items:
+        return 1
+    return os.cpu_count() or 1
+
+
+@contextmanager
+def worker_pool(executor: Optional[Executor] = None, **pool_kwargs) -> Iterator[Executor]:
+    """
+    Use the caller's executor, or a process pool owned by this block
+
+    A supplied executor is left running for the caller to reuse; otherwise a
+    ProcessPoolExecutor is created with pool_kwargs and shut down on exit.
+
+    Args:
+        executor (Optional[Executor]): Executor supplied by the caller
+        **pool_kwargs: ProcessPoolExecutor arguments (max_workers, initializer, ...)
+
+    Returns:
+        Iterator yielding the executor to submit work to
+    """
+    if executor is not None:
+        yield executor
+        return
+
+    with ProcessPoolExecutor(**pool_kwargs) as pool:
+        yield pool
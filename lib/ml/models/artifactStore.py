@@ -0,0 +1,284 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional, Tuple
+
+ARTIFACT_FORMAT_VERSION = 1
+MANIFEST_FILENAME = 'manifest.json'
+
+
+def _array_filename(name: str) -> str:
+    # Names may be hierarchical ("player/layer_0"); keep one flat directory
+    return name.replace('/', '__') + '.npy'
+
+
+def save_array_bundle(directory: str, arrays: Dict[str, np.ndarray], metadata: Dict[str, Any]) -> str:
+    """
+    Write arrays as individual .npy files plus a small JSON manifest
+
+    The manifest is written last (via rename), so a reader never sees a bundle
+    whose arrays are still being written.
+
+    Args:
+        directory (str): Bundle directory (created if missing)
+        arrays (Dict[str, np.ndarray]): Named arrays to store
+        metadata (Dict[str, Any]): JSON-serializable metadata for the manifest
+
+    Returns:
+        str: Path of the manifest file
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    entries = {}
+    for name, array in arrays.items():
+        # ascontiguousarray would turn 0-d scalars into shape (1,)
+        array = np.asarray(array)
+        if not array.flags.c_contiguous:
+            array = np.ascontiguousarray(array)
+        filename = _array_filename(name)
+        np.save(os.path.join(directory, filename), array, allow_pickle=False)
+        entries[name] = {
+            'file': filename,
+            'shape': list(array.shape),
+            'dtype': array.dtype.str
+        }
+
+    manifest = dict(metadata)
+    manifest['format_version'] = ARTIFACT_FORMAT_VERSION
+    manifest['arrays'] = entries
+
+    manifest_path = os.path.join(directory, MANIFEST_FILENAME)
+    with open(manifest_path + '.tmp', 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(manifest_path + '.tmp', manifest_path)
+
+    return manifest_path
+
+
+class ArrayBundle:
+    """
+    Reader for bundles written by save_array_bundle
+
+    Arrays are opened lazily and, by default, memory-mapped read-only, so only
+    the pages a caller touches are read and processes share them.
+    """
+    def __init__(self, directory: str, mmap: bool = True):
+        """
+        Open a bundle
+
+        Args:
+            directory (str): Bundle directory
+            mmap (bool): Memory-map arrays instead of reading them fully
+        """
+        self.directory = directory
+        self.mmap = mmap
+        with open(os.path.join(directory, MANIFEST_FILENAME)) as f:
+            self.manifest = json.load(f)
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    def names(self) -> List[str]:
+        """
+        Names of the stored arrays
+
+        Returns:
+            List[str]: Array names
+        """
+        return list(self.manifest['arrays'])
+
+    def array(self, name: str) -> np.ndarray:
+        """
+        Load (or map) one array
+
+        Args:
+            name (str): Array name
+
+        Returns:
+            np.ndarray: Stored array, read-only when memory-mapped
+        """
+        if name not in self._arrays:
+            entry = self.manifest['arrays'][name]
+            self._arrays[name] = np.load(
+                os.path.join(self.directory, entry['file']),
+                mmap_mode='r' if self.mmap else None,
+                allow_pickle=False
+            )
+        return self._arrays[name]
+
+
+def correlation_artifact_arrays(
+    analysis_results: Dict[str, Any], 
+    analyzer: Any = None
+) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """
+    Arrays and manifest metadata for a correlation analysis artifact
+
+    Matrices are float32 (row-major, so a row is one contiguous read);
+    significant pairs are stored as parallel index/value arrays. With the
+    analyzer, its fitted scaler and PCA centering are stored too, so
+    CorrelationArtifact.transform can project new data.
+
+    Args:
+        analysis_results (Dict[str, Any]): Output of analyze_prop_relationships
+            or analyze_prop_relationships_streaming
+        analyzer (Any): PlayerPropCorrelationAnalyzer that produced the results
+
+    Returns:
+        Tuple of arrays and metadata
+    """
+    correlation_matrix = analysis_results['correlation_matrix']
+    features = [str(feature) for feature in correlation_matrix.columns]
+    position = {feature: index for index, feature in enumerate(correlation_matrix.columns)}
+    significant = analysis_results['significant_correlations']
+    pca_results = analysis_results['pca_results']
+
+    arrays = {
+        'correlation_matrix': correlation_matrix.to_numpy(dtype=np.float32),
+        'mutual_information': analysis_results['mutual_information'].to_numpy(dtype=np.float32),
+        'pca_components': np.asarray(pca_results['components'], dtype=np.float32),
+        'pca_explained_variance': np.asarray(pca_results['explained_variance'], dtype=np.float64),
+        'significant_i': np.array([position[f1] for f1, _, _ in significant], dtype=np.int32),
+        'significant_j': np.array([position[f2] for _, f2, _ in significant], dtype=np.int32),
+        'significant_correlation': np.array([corr for _, _, corr in significant], dtype=np.float32)
+    }
+
+    if analyzer is not None:
+        arrays['scaler_mean'] = np.asarray(analyzer.scaler.mean_, dtype=np.float64)
+        arrays['scaler_scale'] = np.asarray(analyzer.scaler.scale_, dtype=np.float64)
+        arrays['pca_mean'] = np.asarray(analyzer.pca.mean_, dtype=np.float64)
+
+    metadata = {
+        'features': features,
+        'significant_correlations_count': len(significant)
+    }
+    return arrays, metadata
+
+
+def write_correlation_artifact(directory: str, analysis_results: Dict[str, Any], analyzer: Any = None) -> str:
+    """
+    Store PlayerPropCorrelationAnalyzer results as a binary artifact
+
+    Args:
+        directory (str): Artifact directory
+        analysis_results (Dict[str, Any]): Output of analyze_prop_relationships
+            or analyze_prop_relationships_streaming
+        analyzer (Any): PlayerPropCorrelationAnalyzer that produced the results
+
+    Returns:
+        str: Path of the manifest file
+    """
+    arrays, metadata = correlation_artifact_arrays(analysis_results, analyzer)
+    return save_array_bundle(directory, arrays, dict(metadata, kind='correlation_analysis'))
+
+
+def open_correlation_artifact(bundle: ArrayBundle) -> 'CorrelationArtifact':
+    """
+    Reopen a bundle as a CorrelationArtifact (model registry loader)
+
+    Args:
+        bundle (ArrayBundle): Bundle of correlation analysis arrays
+
+    Returns:
+        CorrelationArtifact: Artifact reader over the same directory
+    """
+    return CorrelationArtifact(bundle.directory, mmap=bundle.mmap)
+
+
+class CorrelationArtifact(ArrayBundle):
+    """
+    Reader for correlation analysis artifacts with row- and pair-level access
+    """
+    def __init__(self, directory: str, mmap: bool = True):
+        """
+        Open a correlation artifact
+
+        Args:
+            directory (str): Artifact directory
+            mmap (bool): Memory-map arrays instead of reading them fully
+        """
+        super().__init__(directory, mmap=mmap)
+        self.features: List[str] = self.manifest['features']
+        self.feature_index = {feature: index for index, feature in enumerate(self.features)}
+
+    def rows(self, features: List[str], matrix: str = 'correlation_matrix') -> pd.DataFrame:
+        """
+        Load only the requested rows of a feature-by-feature matrix
+
+        Args:
+            features (List[str]): Row features
+            matrix (str): 'correlation_matrix' or 'mutual_information'
+
+        Returns:
+            pd.DataFrame: Requested rows against every feature
+        """
+        positions = [self.feature_index[feature] for feature in features]
+        return pd.DataFrame(
+            np.asarray(self.array(matrix)[positions]),
+            index=features,
+            columns=self.features
+        )
+
+    def pair(self, feature1: str, feature2: str, matrix: str = 'correlation_matrix') -> float:
+        """
+        Look up a single matrix entry
+
+        Args:
+            feature1 (str): Row feature
+            feature2 (str): Column feature
+            matrix (str): 'correlation_matrix' or 'mutual_information'
+
+        Returns:
+            float: Stored value
+        """
+        return float(self.array(matrix)[self.feature_index[feature1], self.feature_index[feature2]])
+
+    def significant_correlations(self) -> List[Tuple[str, str, float]]:
+        """
+        Significant pairs in the same shape as find_significant_correlations
+
+        Returns:
+            List[Tuple[str, str, float]]: List of (feature1, feature2, correlation_value)
+        """
+        return [
+            (self.features[i], self.features[j], float(value))
+            for i, j, value in zip(
+                self.array('significant_i'),
+                self.array('significant_j'),
+                self.array('significant_correlation')
+            )
+        ]
+
+    def pca(self, n_components: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Leading PCA components and explained variance ratios
+
+        Args:
+            n_components (Optional[int]): Number of leading components, all if None
+
+        Returns:
+            Dict[str, np.ndarray]: PCA results
+        """
+        return {
+            'explained_variance': self.array('pca_explained_variance')[:n_components],
+            'components': self.array('pca_components')[:n_components]
+        }
+
+    def transform(self, data: pd.DataFrame, n_components: Optional[int] = None) -> np.ndarray:
+        """
+        Project data onto the stored principal components
+
+        Requires an artifact written with the analyzer (scaler and PCA centering).
+
+        Args:
+            data (pd.DataFrame): Rows with the artifact's feature columns
+            n_components (Optional[int]): Number of leading components, all if None
+
+        Returns:
+            np.ndarray: PCA scores, one row per input row
+        """
+        if 'pca_mean' not in self.manifest['arrays']:
+            raise ValueError("Artifact was written without the fitted scaler and PCA")
+
+        scaled = (data[self.features].to_numpy(dtype=np.float64) - self.array('scaler_mean')) / self.array('scaler_scale')
+        components = np.asarray(self.array('pca_components')[:n_components], dtype=np.float64)
+        return (scaled - self.array('pca_mean')) @ components.T
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+from typing import Callable, List, Union
+
+# Only plain NumPy here: serving workers import this module without TensorFlow
+_ACTIVATIONS = {
+    'relu': lambda z: np.maximum(z, 0, out=z),
+    'sigmoid': lambda z: 0.5 * (1.0 + np.tanh(0.5 * z)),
+    'linear': lambda z: z
+}
+
+
+class NumpyClutchPredictor:
+    """
+    TensorFlow-free clutch probability scorer for ClutchPerformancePredictor.export_numpy files
+    
+    The scaler is folded into the first layer's weights at load time, so
+    scoring is one float32 matmul per layer over the whole batch.
+    """
+    def __init__(self, path: str):
+        """
+        Load an exported clutch model
+        
+        Args:
+            path (str): .npz written by ClutchPerformancePredictor.export_numpy
+        """
+        with np.load(path, allow_pickle=False) as exported:
+            self._load_arrays(exported.__getitem__)
+
+    @classmethod
+    def from_bundle(cls, bundle) -> 'NumpyClutchPredictor':
+        """
+        Load a clutch model from the model registry (usable as a registry loader)
+        
+        Args:
+            bundle: models.artifactStore.ArrayBundle of a 'clutch' model
+        
+        Returns:
+            NumpyClutchPredictor: Predictor over the stored weights
+        """
+        predictor = cls.__new__(cls)
+        predictor._load_arrays(bundle.array)
+        return predictor
+
+    def _load_arrays(self, read: Callable[[str], np.ndarray]):
+        # read: array name -> array (NpzFile lookup or ArrayBundle.array)
+        self.features: List[str] = [str(feature) for feature in read('features')]
+        layer_count = int(read('layer_count'))
+        kernels = [np.asarray(read(f'kernel_{i}'), dtype=np.float32) for i in range(layer_count)]
+        biases = [np.asarray(read(f'bias_{i}'), dtype=np.float32) for i in range(layer_count)]
+        activations = [str(read(f'activation_{i}')) for i in range(layer_count)]
+        mean = np.asarray(read('scaler_mean'))
+        scale = np.asarray(read('scaler_scale'))
+        
+        unsupported = set(activations) - set(_ACTIVATIONS)
+        if unsupported:
+            raise ValueError(f"Unsupported activations in export: {sorted(unsupported)}")
+        
+        # ((x - mean) / scale) @ W + b == x @ (W / scale) + (b - (mean / scale) @ W)
+        first_kernel = kernels[0].astype(np.float64)
+        kernels[0] = (first_kernel / scale[:, np.newaxis]).astype(np.float32)
+        biases[0] = (biases[0] - (mean / scale) @ first_kernel).astype(np.float32)
+        
+        self.layers = [
+            (kernel, bias, _ACTIVATIONS[activation])
+            for kernel, bias, activation in zip(kernels, biases, activations)
+        ]
+
+    def predict_clutch_probability(self, data: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """
+        Predict clutch performance probabilities
+        
+        Args:
+            data (Union[pd.DataFrame, np.ndarray]): Player performance data, or a
+                raw (unscaled) matrix with columns in self.features order
+        
+        Returns:
+            np.ndarray: Predicted probabilities, shape (rows, 1) like Keras predict
+        """
+        if isinstance(data, pd.DataFrame):
+            X = data[self.features].to_numpy(dtype=np.float32)
+        else:
+            X = np.asarray(data, dtype=np.float32)
+        
+        for kernel, bias, activation in self.layers:
+            X = X @ kernel
+            X += bias
+            X = activation(X)
+        return X
@@ -1,10 +1,11 @@
+import weakref
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import Dense, Dropout
-from typing import Dict, List, Any
+from typing import TYPE_CHECKING, Dict, List, Any
+
+# scikit-learn and TensorFlow are imported inside the methods that need them
+if TYPE_CHECKING:
+    from tensorflow.keras.models import Sequential
 
 class ClutchPerformancePredictor:
     def __init__(self, clutch_threshold: float = 0.7):
@@ -15,47 +16,179 @@ class ClutchPerformancePredictor:
             clutch_threshold (float): Threshold for defining clutch performance
         """
         self.clutch_threshold = clutch_threshold
+        
+        from sklearn.preprocessing import StandardScaler
         self.scaler = StandardScaler()
         self.model = None
+        
+        # Labels, scaled features and split of the last training frame, reused by evaluate_model
+        self._prepared = None
+
+    def __getstate__(self):
+        # The prepared-dataset cache holds a weak reference and training-sized arrays
+        state = self.__dict__.copy()
+        state['_prepared'] = None
+        return state
 
-    def define_clutch_performance(self, data: pd.DataFrame, performance_columns: List[str]) -> pd.Series:
+    def define_clutch_performance(self, 
+                                  data: pd.DataFrame, 
+                                  performance_columns: List[str],
+                                  group_columns: List[str] = None) -> pd.Series:
         """
         Define clutch performance based on various metrics
         
+        Columns are min-max normalized to 0-100 in one array operation (constant
+        columns normalize to 0) and averaged per row. Rows at or above the
+        clutch_threshold quantile of that score are labeled clutch, either over
+        the whole frame or within each group (e.g. season, team).
+        
         Args:
             data (pd.DataFrame): Player performance data
             performance_columns (List[str]): Columns to consider for clutch performance
+            group_columns (List[str]): Columns whose groups get their own threshold
         
         Returns:
             pd.Series: Binary clutch performance labels
         """
         # Compute normalized performance score
-        performance_score = data[performance_columns].apply(
-            lambda x: (x - x.min()) / (x.max()
-            - x.min()) * 100, axis=0
-        ).mean(axis=1)
+        values = data[performance_columns].to_numpy(dtype=np.float64)
+        minimum = np.nanmin(values, axis=0)
+        value_range = np.nanmax(values, axis=0) - minimum
+        safe_range = np.where(value_range > 0, value_range, 1.0)
+        normalized = np.where(value_range > 0, (values - minimum) / safe_range * 100, 0.0)
+        
+        # Row mean over the non-missing columns, NaN when all are missing
+        present = ~np.isnan(values)
+        counts = present.sum(axis=1)
+        performance_score = np.where(present, normalized, 0.0).sum(axis=1) / np.where(counts > 0, counts, 1)
+        performance_score[counts == 0] = np.nan
+        
+        if group_columns:
+            codes = data.groupby(group_columns, sort=False, dropna=False).ngroup().to_numpy()
+        else:
+            codes = np.zeros(len(data), dtype=np.int64)
+        
+        # Define clutch performance relative to the (group) score quantile
+        thresholds = self._grouped_quantile(performance_score, codes, self.clutch_threshold)
+        clutch_labels = (performance_score >= thresholds[codes]).astype(int)
+        
+        return pd.Series(clutch_labels, index=data.index)
+
+    @staticmethod
+    def _grouped_quantile(values: np.ndarray, codes: np.ndarray, q: float) -> np.ndarray:
+        """
+        Per-group quantile with linear interpolation, ignoring NaN (as pandas quantile)
         
-        # Define clutch performance based on performance score and high-stakes conditions
-        clutch_labels = (performance_score >= performance_score.quantile(self.clutch_threshold)).astype(int)
+        Values are sorted once, then stably regrouped by an integer sort on the
+        codes (much cheaper than a two-key lexsort); each group's quantile is
+        read from its slice of the result.
         
-        return clutch_labels
+        Args:
+            values (np.ndarray): Values, may contain NaN
+            codes (np.ndarray): Dense group code per value
+            q (float): Quantile in [0, 1]
+        
+        Returns:
+            np.ndarray: Quantile per group code, NaN for groups without values
+        """
+        n_groups = int(codes.max()) + 1 if len(codes) else 0
+        if n_groups <= 1:
+            sorted_values = np.sort(values)
+        else:
+            order = np.argsort(values)
+            order = order[np.argsort(codes[order], kind='stable')]
+            sorted_values = values[order]
+        
+        # NaN sorts last within a group, so valid values lead each slice
+        starts = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=n_groups))[:-1]))
+        valid = np.bincount(codes, weights=~np.isnan(values), minlength=n_groups).astype(np.int64)
+        
+        position = (valid - 1) * q
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, valid - 1)
+        gamma = position - lower
+        
+        has_values = valid > 0
+        below = np.where(has_values, sorted_values[np.where(has_values, starts + lower, 0)], np.nan)
+        above = np.where(has_values, sorted_values[np.where(has_values, starts + upper, 0)], np.nan)
+        
+        # Same two-sided lerp as numpy's 'linear' method, so ties at the threshold match
+        difference = above - below
+        return np.where(gamma >= 0.5, above - difference * (1 - gamma), below + difference * gamma)
 
-    def prepare_features(self, data: pd.DataFrame, clutch_features: List[str]) -> np.ndarray:
+    def prepare_features(self, data: pd.DataFrame, clutch_features: List[str], fit: bool = False) -> np.ndarray:
         """
         Prepare and scale features for clutch performance prediction
         
         Args:
             data (pd.DataFrame): Player performance data
             clutch_features (List[str]): Features to use for prediction
+            fit (bool): Fit the scaler on this data (training) or reuse the
+                scaler fitted at training time
         
         Returns:
             np.ndarray: Scaled feature matrix
         """
         # Select and scale features
-        X = data[clutch_features]
-        return self.scaler.fit_transform(X)
+        X = data[clutch_features].to_numpy(dtype=np.float64)
+        if fit:
+            self.scaler.fit(X)
+            self._prepared = None
+        return self.scaler.transform(X)
+
+    def _cache_key(self, data: pd.DataFrame, clutch_features: List[str], performance_columns: List[str]) -> tuple:
+        return (data.shape, tuple(clutch_features), tuple(performance_columns), self.clutch_threshold)
+
+    def prepare_dataset(self, 
+                        data: pd.DataFrame, 
+                        clutch_features: List[str], 
+                        performance_columns: List[str],
+                        fit_scaler: bool = True) -> Dict[str, np.ndarray]:
+        """
+        Labels, scaled features and train/test split for a training frame
+        
+        The result of a fitting call is cached for the frame object and feature
+        lists, so train and evaluate_model label, scale and split the data only
+        once. Pass a new frame (not an in-place edit) to retrain on different data.
+        
+        Args:
+            data (pd.DataFrame): Player performance data
+            clutch_features (List[str]): Features to use for prediction
+            performance_columns (List[str]): Columns to define clutch performance
+            fit_scaler (bool): Fit the scaler on the training rows, or reuse the
+                scaler fitted at training time
+        
+        Returns:
+            Dict[str, np.ndarray]: y, X, train_index and test_index
+        """
+        key = self._cache_key(data, clutch_features, performance_columns)
+        if self._prepared is not None and self._prepared['data']() is data and self._prepared['key'] == key:
+            return self._prepared['dataset']
+        
+        # Define clutch performance labels
+        y = self.define_clutch_performance(data, performance_columns).to_numpy()
+        
+        # Split row positions so the scaler is fitted on training rows only
+        from sklearn.model_selection import train_test_split
+        train_index, test_index = train_test_split(
+            np.arange(len(y)), test_size=0.2, random_state=42, stratify=y
+        )
+        
+        X = data[clutch_features].to_numpy(dtype=np.float64)
+        if fit_scaler:
+            self.scaler.fit(X[train_index])
+        
+        dataset = {
+            'y': y,
+            'X': self.scaler.transform(X),
+            'train_index': train_index,
+            'test_index': test_index
+        }
+        if fit_scaler:
+            self._prepared = {'data': weakref.ref(data), 'key': key, 'dataset': dataset}
+        return dataset
 
-    def build_model(self, input_shape: int) -> Sequential:
+    def build_model(self, input_shape: int) -> 'Sequential':
         """
         Build neural network model for clutch performance prediction
         
@@ -65,6 +198,9 @@ class ClutchPerformancePredictor:
         Returns:
             Sequential: Compiled Keras model
         """
+        from tensorflow.keras.models import Sequential
+        from tensorflow.keras.layers import Dense, Dropout
+        
         model = Sequential([
             Dense(64, activation='relu', input_shape=(input_shape,)),
             Dropout(0.3),
@@ -94,19 +230,13 @@ class ClutchPerformancePredictor:
             clutch_features (List[str]): Features to use for prediction
             performance_columns (List[str]): Columns to define clutch performance
         """
-        # Define clutch performance labels
-        y = self.define_clutch_performance(data, performance_columns)
-        
-        # Prepare features
-        X = self.prepare_features(data, clutch_features)
-        
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=0.2, random_state=42, stratify=y
-        )
+        # Labels, scaled features and split, fitting the scaler
+        dataset = self.prepare_dataset(data, clutch_features, performance_columns)
+        X, y = dataset['X'], dataset['y']
+        X_train, y_train = X[dataset['train_index']], y[dataset['train_index']]
         
         # Build and train model
-        self.model = self.build_model(input_shape=(X.shape[1],))
+        self.model = self.build_model(input_shape=X.shape[1])
         
         # Class weights to handle potential imbalance
         class_weights = {
@@ -137,7 +267,7 @@ class ClutchPerformancePredictor:
         if self.model is None:
             raise ValueError("Model must be trained before prediction")
         
-        # Prepare and scale features
+        # Scale features with the scaler fitted at training time
         X = self.prepare_features(data, clutch_features)
         
         # Predict probabilities
@@ -158,16 +288,12 @@ class ClutchPerformancePredictor:
         Returns:
             Dict[str, float]: Model performance metrics
         """
-        # Define clutch performance labels
-        y = self.define_clutch_performance(data, performance_columns)
-        
-        # Prepare features
-        X = self.prepare_features(data, clutch_features)
+        if self.model is None:
+            raise ValueError("Model must be trained before evaluation")
         
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=0.2, random_state=42, stratify=y
-        )
+        # Reuses the labels, scaling and split computed by train for the same frame
+        dataset = self.prepare_dataset(data, clutch_features, performance_columns, fit_scaler=False)
+        X_test, y_test = dataset['X'][dataset['test_index']], dataset['y'][dataset['test_index']]
         
         # Predict and evaluate
         y_pred_proba = self.model.predict(X_test)
@@ -214,4 +340,82 @@ class ClutchPerformancePredictor:
         # Normalize to percentage
         feature_importance = feature_importance / feature_importance.sum() * 100
         
-        return dict(zip(clutch_features, feature_importance))
\ No newline at end of file
+        return dict(zip(clutch_features, feature_importance))
+
+    def export_arrays(self, clutch_features: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Trained network and fitted scaler as plain arrays
+        
+        Holds kernel_<i>, bias_<i> and activation_<i> for each Dense layer in
+        order (Dropout is an identity at inference), the scaler mean and scale,
+        and the feature order.
+        
+        Args:
+            clutch_features (List[str]): Features used in the model, in training order
+        
+        Returns:
+            Dict[str, np.ndarray]: Arrays for export_numpy or the model registry
+        """
+        if self.model is None:
+            raise ValueError("Model must be trained before export")
+        
+        from tensorflow.keras.layers import Dense
+        
+        arrays = {}
+        dense_layers = [layer for layer in self.model.layers if isinstance(layer, Dense)]
+        for index, layer in enumerate(dense_layers):
+            kernel, bias = layer.get_weights()
+            arrays[f'kernel_{index}'] = kernel.astype(np.float32)
+            arrays[f'bias_{index}'] = bias.astype(np.float32)
+            arrays[f'activation_{index}'] = np.array(layer.get_config()['activation'])
+        
+        arrays['layer_count'] = np.array(len(dense_layers))
+        arrays['scaler_mean'] = self.scaler.mean_
+        arrays['scaler_scale'] = self.scaler.scale_
+        arrays['features'] = np.array(clutch_features)
+        return arrays
+
+    def export_numpy(self, path: str, clutch_features: List[str]) -> str:
+        """
+        Write the trained network and fitted scaler to a compact .npz
+        
+        The file holds the export_arrays arrays and is read by
+        clutchInference.NumpyClutchPredictor, which needs no TensorFlow.
+        
+        Args:
+            path (str): Output .npz path
+            clutch_features (List[str]): Features used in the model, in training order
+        
+        Returns:
+            str: Path written
+        """
+        np.savez(path, **self.export_arrays(clutch_features))
+        return path
+
+
+def load_clutch_predictor(bundle) -> ClutchPerformancePredictor:
+    """
+    Rebuild a trained predictor from a model registry bundle
+    
+    Args:
+        bundle: models.artifactStore.ArrayBundle written from export_arrays, with
+            clutch_threshold in its manifest
+    
+    Returns:
+        ClutchPerformancePredictor: Predictor ready for predict_clutch_probability
+    """
+    predictor = ClutchPerformancePredictor(clutch_threshold=bundle.manifest['clutch_threshold'])
+    
+    # Fitting on mean +/- scale sets every fitted attribute; the assignment keeps them bit-exact
+    mean = np.asarray(bundle.array('scaler_mean'))
+    scale = np.asarray(bundle.array('scaler_scale'))
+    predictor.scaler.fit(np.vstack([mean - scale, mean + scale]))
+    predictor.scaler.mean_, predictor.scaler.scale_ = mean.copy(), scale.copy()
+    
+    predictor.model = predictor.build_model(input_shape=len(mean))
+    layer_count = int(bundle.array('layer_count'))
+    predictor.model.set_weights([
+        np.asarray(bundle.array(f'{part}_{index}'))
+        for index in range(layer_count) for part in ('kernel', 'bias')
+    ])
+    return predictor
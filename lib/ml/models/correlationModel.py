@@ -1,9 +1,302 @@
 import numpy as np
 import pandas as pd
-import scipy.stats as stats
-from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
-from typing import Dict, List, Tuple
+from concurrent.futures import Executor
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple
+from common.correlationPairs import correlation_pairs
+from common.workerPool import default_workers, worker_pool
+
+MI_BINS = 10
+
+# Rows binned per bincount call when building joint histograms
+MI_ROW_BLOCK = 65536
+
+# Fewest features whose MI rows are computed on a process pool (see default_workers)
+MI_PARALLEL_MIN_FEATURES = 32
+
+_mi_worker_codes = None
+
+
+def _interior_bin_edges(minimum: float, maximum: float, bins: int) -> np.ndarray:
+    """
+    Interior edges of pd.cut(bins=bins) for one column's range
+    
+    Args:
+        minimum (float): Column minimum
+        maximum (float): Column maximum
+        bins (int): Number of equal-width bins
+    
+    Returns:
+        np.ndarray: bins - 1 interior edges (bins are right-closed)
+    """
+    if minimum == maximum:
+        # Constant columns land in a single bin, whatever pd.cut's padding
+        return np.full(bins - 1, np.inf)
+    return np.linspace(minimum, maximum, bins + 1)[1:-1]
+
+
+def _discretize(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Integer bin codes per column, NaN mapped to an extra code
+    
+    Args:
+        values (np.ndarray): Data of shape (rows, features)
+        edges (np.ndarray): Interior edges of shape (features, bins - 1)
+    
+    Returns:
+        np.ndarray: Codes in [0, bins] of shape (rows, features)
+    """
+    bins = edges.shape[1] + 1
+    codes = np.empty(values.shape, dtype=np.int32)
+    for column in range(values.shape[1]):
+        codes[:, column] = np.searchsorted(edges[column], values[:, column], side='left')
+        codes[np.isnan(values[:, column]), column] = bins
+    return codes
+
+
+def _joint_counts(codes: np.ndarray, feature: int, labels: int) -> np.ndarray:
+    """
+    Joint histograms of one feature against every later feature
+    
+    Args:
+        codes (np.ndarray): Bin codes of shape (rows, features)
+        feature (int): Feature index i; pairs (i, j) for j > i are counted
+        labels (int): Number of distinct codes
+    
+    Returns:
+        np.ndarray: Counts of shape (features - i - 1, labels, labels)
+    """
+    n_pairs = codes.shape[1] - feature - 1
+    offsets = np.arange(n_pairs, dtype=np.int64) * labels * labels
+    counts = np.zeros(n_pairs * labels * labels, dtype=np.int64)
+    
+    for start in range(0, len(codes), MI_ROW_BLOCK):
+        block = codes[start:start + MI_ROW_BLOCK]
+        combined = block[:, feature, None].astype(np.int64) * labels + block[:, feature + 1:] + offsets
+        counts += np.bincount(combined.ravel(), minlength=len(counts))
+    
+    return counts.reshape(n_pairs, labels, labels)
+
+
+def _mutual_information_from_counts(counts: np.ndarray) -> np.ndarray:
+    """
+    Mutual information (nats) from stacked joint histograms
+    
+    Args:
+        counts (np.ndarray): Joint counts of shape (pairs, labels, labels)
+    
+    Returns:
+        np.ndarray: Mutual information per pair
+    """
+    totals = counts.sum(axis=(1, 2), keepdims=True).astype(np.float64)
+    joint = counts / np.where(totals > 0, totals, 1.0)
+    outer = joint.sum(axis=2, keepdims=True) * joint.sum(axis=1, keepdims=True)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = np.where(joint > 0, joint * np.log(joint / outer), 0.0)
+    return terms.sum(axis=(1, 2))
+
+
+def _entropy_from_codes(codes: np.ndarray, labels: int) -> np.ndarray:
+    """
+    Entropy (nats) of each column's codes, i.e. the MI of a feature with itself
+    """
+    entropies = np.empty(codes.shape[1])
+    for column in range(codes.shape[1]):
+        p = np.bincount(codes[:, column], minlength=labels) / len(codes)
+        p = p[p > 0]
+        entropies[column] = -np.sum(p * np.log(p))
+    return entropies
+
+
+def _init_mi_worker(codes: np.ndarray):
+    global _mi_worker_codes
+    _mi_worker_codes = codes
+
+
+def _mutual_information_rows(
+    features: List[int], 
+    labels: int, 
+    codes: Optional[np.ndarray] = None
+) -> List[Tuple[int, np.ndarray]]:
+    """
+    Upper-triangle MI rows for a set of features (in a worker process or inline)
+    
+    Uses the codes set by _init_mi_worker unless codes are passed with the task.
+    """
+    if codes is None:
+        codes = _mi_worker_codes
+    return [
+        (feature, _mutual_information_from_counts(_joint_counts(codes, feature, labels)))
+        for feature in features
+    ]
+
+
+def _rebatch(chunks: Iterable[pd.DataFrame], min_rows: int) -> Iterator[pd.DataFrame]:
+    """
+    Regroup chunks so every yielded frame has at least min_rows rows
+    
+    IncrementalPCA needs each partial_fit batch to hold at least as many rows
+    as components; short chunks (typically the CSV tail) are merged into a
+    neighbour. Only a frame smaller than min_rows overall yields a short batch.
+    """
+    ready, pending = None, None
+    for chunk in chunks:
+        pending = chunk if pending is None else pd.concat([pending, chunk])
+        if len(pending) >= min_rows:
+            if ready is not None:
+                yield ready
+            ready, pending = pending, None
+    
+    if pending is not None:
+        ready = pending if ready is None else pd.concat([ready, pending])
+    if ready is not None:
+        yield ready
+
+
+class CorrelationAccumulator:
+    """
+    Running sufficient statistics for Pearson correlation over streamed chunks
+    
+    Holds count, column means and the co-moment matrix sum((x - mean)(x - mean)^T)
+    and merges chunks with Chan et al.'s parallel update, so memory is bounded by
+    the chunk size and the number of features. Column minima/maxima are tracked
+    for histogram binning. Rows containing NaN are skipped.
+    """
+    def __init__(self, columns: Optional[List[str]] = None):
+        """
+        Initialize an empty accumulator
+        
+        Args:
+            columns (Optional[List[str]]): Feature names, taken from the first chunk if omitted
+        """
+        self.columns = list(columns) if columns is not None else None
+        self.count = 0.0
+        self.mean = None
+        self.co_moment = None
+        self.minimum = None
+        self.maximum = None
+    
+    def _merge(self, count: float, mean: np.ndarray, co_moment: np.ndarray):
+        if self.mean is None:
+            self.count, self.mean, self.co_moment = count, mean, co_moment
+            return
+        
+        total = self.count + count
+        delta = mean - self.mean
+        self.co_moment = self.co_moment + co_moment + np.outer(delta, delta) * (self.count * count / total)
+        self.mean = self.mean + delta * (count / total)
+        self.count = total
+    
+    def decay(self, factor: float):
+        """
+        Down-weight everything seen so far (means are unchanged)
+        
+        Args:
+            factor (float): Weight multiplier in (0, 1]
+        """
+        if self.mean is not None:
+            self.count *= factor
+            self.co_moment = self.co_moment * factor
+    
+    def update(self, chunk: pd.DataFrame, decay: Optional[float] = None):
+        """
+        Fold one chunk of rows into the statistics
+        
+        Args:
+            chunk (pd.DataFrame): Rows with the accumulator's feature columns
+            decay (Optional[float]): Weight multiplier applied to the existing
+                statistics first, so recent rows weigh more
+        """
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+        if decay is not None:
+            self.decay(decay)
+        
+        values = chunk[self.columns].to_numpy(dtype=np.float64)
+        values = values[~np.isnan(values).any(axis=1)]
+        if len(values) == 0:
+            return
+        
+        chunk_mean = values.mean(axis=0)
+        centered = values - chunk_mean
+        self._merge(float(len(values)), chunk_mean, centered.T @ centered)
+        
+        chunk_min, chunk_max = values.min(axis=0), values.max(axis=0)
+        self.minimum = chunk_min if self.minimum is None else np.minimum(self.minimum, chunk_min)
+        self.maximum = chunk_max if self.maximum is None else np.maximum(self.maximum, chunk_max)
+    
+    def save(self, path: str):
+        """
+        Persist the running state to an .npz file
+        
+        Statistics not seeded yet are written as empty float arrays, so an
+        accumulator saved before its first non-empty chunk loads back unseeded.
+        
+        Args:
+            path (str): Destination file
+        """
+        def stored(array: Optional[np.ndarray]) -> np.ndarray:
+            return np.empty(0, dtype=np.float64) if array is None else array
+        
+        np.savez(
+            path,
+            columns=np.asarray(self.columns or [], dtype=str),
+            count=np.float64(self.count),
+            mean=stored(self.mean),
+            co_moment=stored(self.co_moment),
+            minimum=stored(self.minimum),
+            maximum=stored(self.maximum)
+        )
+    
+    @classmethod
+    def load(cls, path: str) -> 'CorrelationAccumulator':
+        """
+        Restore a running state saved with save()
+        
+        Args:
+            path (str): Source .npz file
+        
+        Returns:
+            CorrelationAccumulator: Restored accumulator
+        """
+        def restored(array: np.ndarray) -> Optional[np.ndarray]:
+            return None if array.size == 0 else array
+        
+        with np.load(path) as state:
+            accumulator = cls(columns=state['columns'].tolist() or None)
+            accumulator.count = float(state['count'])
+            accumulator.mean = restored(state['mean'])
+            accumulator.co_moment = restored(state['co_moment'])
+            accumulator.minimum = restored(state['minimum'])
+            accumulator.maximum = restored(state['maximum'])
+        return accumulator
+    
+    def covariance(self, ddof: int = 1) -> np.ndarray:
+        """
+        Covariance matrix of everything seen so far
+        
+        Args:
+            ddof (int): Delta degrees of freedom
+        
+        Returns:
+            np.ndarray: Covariance matrix
+        """
+        return self.co_moment / (self.count - ddof)
+    
+    def correlation_matrix(self) -> pd.DataFrame:
+        """
+        Pearson correlation matrix of everything seen so far
+        
+        Returns:
+            pd.DataFrame: Correlation matrix
+        """
+        std_dev = np.sqrt(np.diag(self.co_moment))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlation = self.co_moment / np.outer(std_dev, std_dev)
+        correlation = np.clip(correlation, -1.0, 1.0)
+        
+        return pd.DataFrame(correlation, index=self.columns, columns=self.columns)
+
 
 class PlayerPropCorrelationAnalyzer:
     def __init__(self, correlation_threshold: float = 0.5):
@@ -14,8 +307,13 @@ class PlayerPropCorrelationAnalyzer:
             correlation_threshold (float): Threshold for significant correlations
         """
         self.correlation_threshold = correlation_threshold
+        # scikit-learn is imported here rather than at module import
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.decomposition import PCA
+        
         self.scaler = StandardScaler()
         self.pca = PCA()
+        self.correlation_state = None
 
     def preprocess_data(self, data: pd.DataFrame) -> np.ndarray:
         """
@@ -53,17 +351,8 @@ class PlayerPropCorrelationAnalyzer:
         Returns:
             List[Tuple[str, str, float]]: List of (feature1, feature2, correlation_value)
         """
-        significant_correlations = []
-        for i in range(len(correlation_matrix.columns)):
-            for j in range(i+1, len(correlation_matrix.columns)):
-                corr_value = correlation_matrix.iloc[i, j]
-                if abs(corr_value) >= self.correlation_threshold:
-                    significant_correlations.append(
-                        (correlation_matrix.columns[i], 
-                         correlation_matrix.columns[j], 
-                         corr_value)
-                    )
-        return significant_correlations
+        pairs = correlation_pairs(correlation_matrix, threshold=self.correlation_threshold)
+        return list(zip(pairs['feature1'], pairs['feature2'], pairs['correlation']))
 
     def perform_pca(self, data: pd.DataFrame) -> Dict[str, np.ndarray]:
         """
@@ -92,34 +381,65 @@ class PlayerPropCorrelationAnalyzer:
             'components': self.pca.components_
         }
 
-    def compute_mutual_information(self, data: pd.DataFrame) -> pd.DataFrame:
+    def compute_mutual_information(
+        self, 
+        data: pd.DataFrame, 
+        bins: int = MI_BINS, 
+        n_workers: Optional[int] = None,
+        executor: Optional[Executor] = None
+    ) -> pd.DataFrame:
         """
         Compute mutual information between features
         
+        Each column is binned once into integer codes and joint histograms are
+        built with bincount over combined codes for the upper triangle only,
+        spread across worker processes for wide feature sets.
+        
         Args:
             data (pd.DataFrame): Input player performance data
+            bins (int): Equal-width bins per feature
+            n_workers (Optional[int]): Worker processes, 1 runs serially; chosen
+                from the feature count against MI_PARALLEL_MIN_FEATURES when None
+            executor (Optional[Executor]): Existing pool to run on instead of
+                starting one; codes are then sent with each task
         
         Returns:
             pd.DataFrame: Mutual information matrix
         """
-        # Discretize continuous data for mutual information
-        discretized_data = data.apply(pd.cut, bins=10)
+        values = data.to_numpy(dtype=np.float64)
+        n_features = values.shape[1]
+        labels = bins + 1
         
-        # Compute mutual information
-        mi_matrix = pd.DataFrame(
-            index=data.columns,
-            columns=data.columns,
-            data=np.zeros((len(data.columns), len(data.columns)))
-        )
+        # Bin every column once into integer codes (equal-width, as pd.cut)
+        edges = np.array([
+            _interior_bin_edges(np.nanmin(values[:, column]), np.nanmax(values[:, column]), bins)
+            for column in range(n_features)
+        ]).reshape(n_features, bins - 1)
+        codes = _discretize(values, edges)
+        
+        if n_workers is None:
+            n_workers = default_workers(n_features, MI_PARALLEL_MIN_FEATURES, executor)
         
-        for col1 in data.columns:
-            for col2 in data.columns:
-                mi_matrix.loc[col1, col2] = stats.mutual_info_score(
-                    discretized_data[col1], 
-                    discretized_data[col2]
-                )
+        # Upper triangle only; the diagonal is each feature's entropy
+        mi = np.diag(_entropy_from_codes(codes, labels))
+        if n_workers <= 1:
+            rows = _mutual_information_rows(list(range(n_features - 1)), labels, codes)
+        else:
+            # Interleave features so every task gets a similar share of pairs
+            tasks = [list(range(worker, n_features - 1, n_workers)) for worker in range(n_workers)]
+            # A pool started here receives the codes once per worker
+            task_codes = [None if executor is None else codes] * len(tasks)
+            with worker_pool(
+                executor, max_workers=n_workers, initializer=_init_mi_worker, initargs=(codes,)
+            ) as pool:
+                chunks = pool.map(_mutual_information_rows, tasks, [labels] * len(tasks), task_codes)
+                rows = [row for chunk in chunks for row in chunk]
         
-        return mi_matrix
+        for feature, row in rows:
+            mi[feature, feature + 1:] = row
+            mi[feature + 1:, feature] = row
+        
+        return pd.DataFrame(mi, index=data.columns, columns=data.columns)
 
     def analyze_prop_relationships(self, data: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -148,4 +468,142 @@ class PlayerPropCorrelationAnalyzer:
             'significant_correlations': significant_correlations,
             'pca_results': pca_results,
             'mutual_information': mutual_info_matrix
-        }
\ No newline at end of file
+        }
+
+    def update_prop_relationships(
+        self, 
+        new_data: pd.DataFrame, 
+        decay: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Merge newly landed rows into the running correlation state
+        
+        Cost is proportional to the new rows (plus the feature count squared);
+        history is never revisited. The first call (or a state restored with
+        load_correlation_state) seeds the running state.
+        
+        Args:
+            new_data (pd.DataFrame): New rows with the same feature columns
+            decay (Optional[float]): Weight multiplier for existing history, e.g.
+                0.99 per night so recent seasons weigh more
+        
+        Returns:
+            Dict[str, Any]: Updated correlation matrix, significant correlations and
+            the (effective) number of observations
+        """
+        if self.correlation_state is None:
+            self.correlation_state = CorrelationAccumulator(columns=list(new_data.columns))
+        self.correlation_state.update(new_data, decay=decay)
+        
+        correlation_matrix = self.correlation_state.correlation_matrix()
+        
+        return {
+            'correlation_matrix': correlation_matrix,
+            'significant_correlations': self.find_significant_correlations(correlation_matrix),
+            'observations': self.correlation_state.count
+        }
+
+    def save_correlation_state(self, path: str):
+        """
+        Persist the running correlation state
+        
+        Args:
+            path (str): Destination .npz file
+        """
+        if self.correlation_state is None:
+            raise ValueError("No correlation state to save")
+        self.correlation_state.save(path)
+
+    def load_correlation_state(self, path: str):
+        """
+        Restore a running correlation state saved with save_correlation_state
+        
+        Args:
+            path (str): Source .npz file
+        """
+        self.correlation_state = CorrelationAccumulator.load(path)
+
+    def analyze_prop_relationships_streaming(
+        self, 
+        chunk_source: Callable[[], Iterable[pd.DataFrame]], 
+        bins: int = MI_BINS
+    ) -> Dict[str, Any]:
+        """
+        Out-of-core variant of analyze_prop_relationships
+        
+        Makes two passes over the chunks. The first accumulates correlation
+        sufficient statistics and partial-fits the scaler; the second feeds
+        standardized chunks to an IncrementalPCA and accumulates the joint
+        histograms for mutual information. Memory is bounded by the chunk size
+        and the feature count. Rows containing NaN are skipped.
+        
+        Args:
+            chunk_source (Callable[[], Iterable[pd.DataFrame]]): Returns a fresh chunk
+                iterator per pass, e.g. lambda: pd.read_csv(path, chunksize=100000)
+            bins (int): Equal-width bins per feature for mutual information
+        
+        Returns:
+            Dict[str, Any]: Same results as analyze_prop_relationships, without the
+            PCA-transformed data
+        """
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.decomposition import IncrementalPCA
+        
+        # Pass 1: correlation statistics, scaler and column ranges
+        accumulator = CorrelationAccumulator()
+        self.scaler = StandardScaler()
+        for chunk in chunk_source():
+            accumulator.update(chunk)
+            chunk = chunk[accumulator.columns].dropna()
+            if len(chunk):
+                self.scaler.partial_fit(chunk)
+        
+        self.correlation_state = accumulator
+        correlation_matrix = accumulator.correlation_matrix()
+        significant_correlations = self.find_significant_correlations(correlation_matrix)
+        
+        # Pass 2: incremental PCA and joint histograms on fixed bin edges
+        columns = accumulator.columns
+        n_features = len(columns)
+        labels = bins + 1
+        edges = np.array([
+            _interior_bin_edges(accumulator.minimum[column], accumulator.maximum[column], bins)
+            for column in range(n_features)
+        ]).reshape(n_features, bins - 1)
+        joint = [
+            np.zeros((n_features - feature - 1, labels, labels), dtype=np.int64) 
+            for feature in range(n_features)
+        ]
+        marginals = np.zeros((n_features, labels), dtype=np.int64)
+        
+        self.pca = IncrementalPCA()
+        chunks = (chunk[columns].dropna() for chunk in chunk_source())
+        for chunk in _rebatch(chunks, n_features):
+            values = chunk.to_numpy(dtype=np.float64)
+            self.pca.partial_fit(self.scaler.transform(chunk))
+            
+            codes = _discretize(values, edges)
+            for feature in range(n_features):
+                marginals[feature] += np.bincount(codes[:, feature], minlength=labels)
+                joint[feature] += _joint_counts(codes, feature, labels)
+        
+        # Mutual information from accumulated histograms; diagonal is the entropy
+        mi = np.zeros((n_features, n_features))
+        for feature in range(n_features - 1):
+            row = _mutual_information_from_counts(joint[feature])
+            mi[feature, feature + 1:] = row
+            mi[feature + 1:, feature] = row
+        
+        p = marginals / np.maximum(marginals.sum(axis=1, keepdims=True), 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.fill_diagonal(mi, -np.sum(np.where(p > 0, p * np.log(p), 0.0), axis=1))
+        
+        return {
+            'correlation_matrix': correlation_matrix,
+            'significant_correlations': significant_correlations,
+            'pca_results': {
+                'explained_variance': self.pca.explained_variance_ratio_,
+                'components': self.pca.components_
+            },
+            'mutual_information': pd.DataFrame(mi, index=columns, columns=columns)
+        }
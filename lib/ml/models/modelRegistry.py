@@ -0,0 +1,252 @@
+import os
+import re
+import json
+import uuid
+import importlib
+import threading
+import numpy as np
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from .artifactStore import ArrayBundle, save_array_bundle, MANIFEST_FILENAME
+
+_VERSION_PATTERN = re.compile(r'^v(\d+)$')
+
+# Manifest keys owned by the registry / artifact store
+_RESERVED_KEYS = {'kind', 'version', 'created_at', 'metrics', 'arrays', 'format_version'}
+
+# Default loader per model kind, resolved on first use so importing the
+# registry never pulls in TensorFlow or scikit-learn
+DEFAULT_LOADERS = {
+    'clutch': 'clutchModel:load_clutch_predictor',
+    'correlation': 'artifactStore:open_correlation_artifact',
+    'sentiment': 'sentimentModel:load_sentiment_analyzer',
+    'time_series': 'timeSeriesModel:load_time_series_predictor'
+}
+
+# Loaded models shared by every registry in this process: (version dir, loader) -> model
+_loaded_models: Dict[tuple, Any] = {}
+_loaded_lock = threading.Lock()
+
+
+def _json_ready(value: Any) -> Any:
+    # Metrics often arrive as NumPy scalars/arrays, which json cannot encode
+    if isinstance(value, dict):
+        return {str(key): _json_ready(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_ready(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _resolve_loader(kind: str) -> Optional[Callable[[ArrayBundle], Any]]:
+    target = DEFAULT_LOADERS.get(kind)
+    if target is None:
+        return None
+    module_name, attribute = target.split(':')
+    module = importlib.import_module(f'{__package__}.{module_name}' if __package__ else module_name)
+    return getattr(module, attribute)
+
+
+class ModelRegistry:
+    """
+    Versioned on-disk store for trained models
+
+    Each save creates <root>/<kind>/v<NNNN>/ holding one .npy file per array
+    plus a manifest with metadata and metrics. Arrays are memory-mapped on
+    load, so worker processes reading the same version share page cache
+    instead of each holding a private copy, and loaded models are cached per
+    process.
+    """
+    def __init__(self, root: str):
+        """
+        Initialize model registry
+
+        Args:
+            root (str): Registry root directory
+        """
+        self.root = root
+
+    def version_path(self, kind: str, version: int) -> str:
+        """
+        Directory of one stored version
+
+        Args:
+            kind (str): Model kind (e.g. 'clutch', 'sentiment')
+            version (int): Version number
+
+        Returns:
+            str: Version directory
+        """
+        return os.path.join(self.root, kind, f'v{version:04d}')
+
+    def versions(self, kind: str) -> List[int]:
+        """
+        Complete stored versions of a model kind, oldest first
+
+        Args:
+            kind (str): Model kind
+
+        Returns:
+            List[int]: Version numbers
+        """
+        kind_path = os.path.join(self.root, kind)
+        if not os.path.isdir(kind_path):
+            return []
+
+        versions = []
+        for name in os.listdir(kind_path):
+            match = _VERSION_PATTERN.match(name)
+            if match and os.path.exists(os.path.join(kind_path, name, MANIFEST_FILENAME)):
+                versions.append(int(match.group(1)))
+        return sorted(versions)
+
+    def latest_version(self, kind: str) -> int:
+        """
+        Newest stored version of a model kind
+
+        Args:
+            kind (str): Model kind
+
+        Returns:
+            int: Version number
+        """
+        versions = self.versions(kind)
+        if not versions:
+            raise FileNotFoundError(f"No '{kind}' models in registry {self.root}")
+        return versions[-1]
+
+    def save(
+        self,
+        kind: str,
+        arrays: Dict[str, np.ndarray],
+        metadata: Optional[Dict[str, Any]] = None,
+        metrics: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Store a new version of a model
+
+        The bundle is written to a private temporary directory and renamed into
+        place, so readers never see a partial version and concurrent savers
+        each get their own version number.
+
+        Args:
+            kind (str): Model kind
+            arrays (Dict[str, np.ndarray]): Weights and other arrays
+            metadata (Optional[Dict[str, Any]]): Settings needed to rebuild the model
+            metrics (Optional[Dict[str, Any]]): Evaluation metrics
+
+        Returns:
+            str: Directory of the new version
+        """
+        metadata = dict(metadata or {})
+        clashes = _RESERVED_KEYS & set(metadata)
+        if clashes:
+            raise ValueError(f"Metadata keys reserved by the registry: {sorted(clashes)}")
+
+        kind_path = os.path.join(self.root, kind)
+        os.makedirs(kind_path, exist_ok=True)
+        staging = os.path.join(kind_path, f'.staging-{uuid.uuid4().hex}')
+
+        version = (self.versions(kind) or [0])[-1] + 1
+        manifest = _json_ready(metadata)
+        manifest.update({
+            'kind': kind,
+            'version': version,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'metrics': _json_ready(metrics or {})
+        })
+        save_array_bundle(staging, arrays, manifest)
+
+        while True:
+            try:
+                os.rename(staging, self.version_path(kind, version))
+                break
+            except OSError:
+                if not os.path.exists(self.version_path(kind, version)):
+                    raise
+                # Another process took this number first
+                version += 1
+                self._set_manifest_version(staging, version)
+
+        return self.version_path(kind, version)
+
+    @staticmethod
+    def _set_manifest_version(directory: str, version: int):
+        manifest_path = os.path.join(directory, MANIFEST_FILENAME)
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        manifest['version'] = version
+        with open(manifest_path + '.tmp', 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(manifest_path + '.tmp', manifest_path)
+
+    def open(self, kind: str, version: Optional[int] = None) -> ArrayBundle:
+        """
+        Open a stored version as a lazily memory-mapped bundle
+
+        Args:
+            kind (str): Model kind
+            version (Optional[int]): Version number, newest if None
+
+        Returns:
+            ArrayBundle: Bundle reader
+        """
+        if version is None:
+            version = self.latest_version(kind)
+        return ArrayBundle(self.version_path(kind, version))
+
+    def load(
+        self,
+        kind: str,
+        version: Optional[int] = None,
+        loader: Optional[Callable[[ArrayBundle], Any]] = None
+    ) -> Any:
+        """
+        Load a stored version through a loader, cached for this process
+
+        Args:
+            kind (str): Model kind
+            version (Optional[int]): Version number, newest if None
+            loader (Optional[Callable]): Builds a model from an ArrayBundle; the
+                kind's entry in DEFAULT_LOADERS when None, or the bundle itself
+                for kinds without one
+
+        Returns:
+            Loaded model
+        """
+        if version is None:
+            version = self.latest_version(kind)
+        if loader is None:
+            loader = _resolve_loader(kind)
+
+        key = (os.path.realpath(self.version_path(kind, version)), loader)
+        with _loaded_lock:
+            if key not in _loaded_models:
+                bundle = self.open(kind, version)
+                _loaded_models[key] = bundle if loader is None else loader(bundle)
+            return _loaded_models[key]
+
+    def load_latest(self, kind: str, loader: Optional[Callable[[ArrayBundle], Any]] = None) -> Any:
+        """
+        Load the newest version of a model kind (see load)
+
+        Args:
+            kind (str): Model kind
+            loader (Optional[Callable]): Builds a model from an ArrayBundle
+
+        Returns:
+            Loaded model
+        """
+        return self.load(kind, loader=loader)
+
+
+def clear_model_cache():
+    """
+    Drop every model cached by ModelRegistry.load in this process
+    """
+    with _loaded_lock:
+        _loaded_models.clear()
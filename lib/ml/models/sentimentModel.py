@@ -1,29 +1,267 @@
+import queue
+import string
+import threading
+import time
 import numpy as np
 import pandas as pd
-import tensorflow as tf
-from tensorflow.keras.preprocessing.text import Tokenizer
-from tensorflow.keras.preprocessing.sequence import pad_sequences
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import Embedding, LSTM, Dense, Dropout
-from typing import List, Dict, Any
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable, Iterable, List, Dict, Any, Optional, Sequence, Tuple
+
+# TensorFlow is imported inside the methods that need it, so importing this
+# module (e.g. for FrozenVocabulary) stays cheap
+if TYPE_CHECKING:
+    import tensorflow as tf
+    from tensorflow.keras.models import Sequential
+    from tensorflow.keras.preprocessing.text import Tokenizer
+
+# Keras Tokenizer defaults
+TOKENIZER_FILTERS = '!"#$%&()*+,-./:;<=>?@[\\]^_`{|}~\t\n'
+
+# Padded lengths for bucketed inference (max_len is always the last bucket)
+DEFAULT_BUCKET_LENGTHS = (16, 32, 64, 128)
+
+
+class FrozenVocabulary:
+    """
+    Read-only copy of a fitted Keras Tokenizer for fast inference
+    
+    Reproduces Tokenizer.texts_to_sequences followed by pad_sequences (pre
+    padding/truncation, int32) with a plain dict lookup and a vectorized
+    scatter into a preallocated array, and never changes the trained index.
+    """
+    def __init__(
+        self, 
+        word_index: Dict[str, int], 
+        num_words: Optional[int] = None, 
+        oov_index: Optional[int] = None,
+        filters: str = TOKENIZER_FILTERS, 
+        lower: bool = True, 
+        split: str = ' '
+    ):
+        """
+        Freeze a word index
+        
+        Args:
+            word_index (Dict[str, int]): Trained word to index mapping
+            num_words (Optional[int]): Only indices below this are kept (Tokenizer num_words)
+            oov_index (Optional[int]): Index emitted for unknown words, dropped if None
+            filters (str): Characters replaced by the split character
+            lower (bool): Lowercase texts before splitting
+            split (str): Word separator
+        """
+        self.lookup = {
+            word: index for word, index in word_index.items() 
+            if not num_words or index < num_words
+        }
+        self.oov_index = oov_index
+        self.filters = filters
+        self.lower = lower
+        self.split = split
+        self._translation = str.maketrans({character: split for character in filters})
+    
+    @classmethod
+    def from_tokenizer(cls, tokenizer: 'Tokenizer') -> 'FrozenVocabulary':
+        """
+        Freeze a fitted Keras Tokenizer
+        
+        Args:
+            tokenizer (Tokenizer): Fitted tokenizer
+        
+        Returns:
+            FrozenVocabulary: Frozen copy of its word index and text filters
+        """
+        oov_index = tokenizer.word_index.get(tokenizer.oov_token) if tokenizer.oov_token else None
+        return cls(
+            dict(tokenizer.word_index), 
+            num_words=tokenizer.num_words, 
+            oov_index=oov_index,
+            filters=tokenizer.filters, 
+            lower=tokenizer.lower, 
+            split=tokenizer.split
+        )
+    
+    def encode(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert texts to token ids
+        
+        Args:
+            texts (List[str]): Text inputs
+        
+        Returns:
+            Tuple of the flat int32 id array and the number of ids per text
+        """
+        lookup, oov_index = self.lookup, self.oov_index
+        ids: List[int] = []
+        lengths = np.empty(len(texts), dtype=np.int64)
+        
+        for row, text in enumerate(texts):
+            if self.lower:
+                text = text.lower()
+            words = text.translate(self._translation).split(self.split)
+            start = len(ids)
+            for word in words:
+                index = lookup.get(word, oov_index) if word else None
+                if index is not None:
+                    ids.append(index)
+            lengths[row] = len(ids) - start
+        
+        return np.array(ids, dtype=np.int32), lengths
+    
+    @staticmethod
+    def pad(ids: np.ndarray, lengths: np.ndarray, max_len: int) -> np.ndarray:
+        """
+        Pre-pad/pre-truncate flat ids into a (texts, max_len) int32 array
+        
+        Args:
+            ids (np.ndarray): Flat ids from encode
+            lengths (np.ndarray): Ids per text from encode
+            max_len (int): Padded sequence length
+        
+        Returns:
+            np.ndarray: Padded sequences, as pad_sequences(maxlen=max_len)
+        """
+        padded = np.zeros((len(lengths), max_len), dtype=np.int32)
+        if len(ids) == 0:
+            return padded
+        
+        rows = np.repeat(np.arange(len(lengths)), lengths)
+        starts = np.cumsum(lengths) - lengths
+        columns = max_len - lengths[rows] + (np.arange(len(ids)) - starts[rows])
+        keep = columns >= 0
+        padded[rows[keep], columns[keep]] = ids[keep]
+        
+        return padded
+    
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Word index and text settings as plain arrays, for artifact bundles
+        
+        Returns:
+            Dict[str, np.ndarray]: Arrays readable by from_arrays
+        """
+        words = list(self.lookup)
+        return {
+            'vocabulary_words': np.array(words, dtype=str),
+            'vocabulary_indices': np.array([self.lookup[word] for word in words], dtype=np.int32),
+            'vocabulary_oov_index': np.array(-1 if self.oov_index is None else self.oov_index),
+            'vocabulary_filters': np.array(self.filters),
+            'vocabulary_lower': np.array(self.lower),
+            'vocabulary_split': np.array(self.split)
+        }
+    
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> 'FrozenVocabulary':
+        """
+        Rebuild a vocabulary from to_arrays output
+        
+        Args:
+            arrays (Dict[str, np.ndarray]): Arrays written by to_arrays
+        
+        Returns:
+            FrozenVocabulary: Equivalent frozen vocabulary
+        """
+        oov_index = int(arrays['vocabulary_oov_index'])
+        return cls(
+            dict(zip(arrays['vocabulary_words'].tolist(), arrays['vocabulary_indices'].tolist())),
+            oov_index=None if oov_index < 0 else oov_index,
+            filters=str(arrays['vocabulary_filters']),
+            lower=bool(arrays['vocabulary_lower']),
+            split=str(arrays['vocabulary_split'])
+        )
+    
+    def texts_to_padded(self, texts: List[str], max_len: int) -> np.ndarray:
+        """
+        Tokenize and pad a batch of texts
+        
+        Args:
+            texts (List[str]): Text inputs
+            max_len (int): Padded sequence length
+        
+        Returns:
+            np.ndarray: Padded int32 sequences
+        """
+        ids, lengths = self.encode(texts)
+        return self.pad(ids, lengths, max_len)
+    
+    def tensorflow_tokenizer(self, max_len: int) -> Callable[['tf.Tensor'], 'tf.Tensor']:
+        """
+        Graph-mode equivalent of texts_to_padded for tf.data pipelines
+        
+        Lowercasing, filtering and splitting use tf.strings ops and words are
+        looked up in a StaticHashTable, so the returned function runs without
+        the GIL and parallelizes under Dataset.map(num_parallel_calls=...).
+        
+        Args:
+            max_len (int): Padded sequence length
+        
+        Returns:
+            Callable mapping a 1-D string tensor to (texts, max_len) int32 ids
+        """
+        import tensorflow as tf
+        
+        words = list(self.lookup)
+        table = tf.lookup.StaticHashTable(
+            tf.lookup.KeyValueTensorInitializer(
+                tf.constant(words, dtype=tf.string),
+                tf.constant([self.lookup[word] for word in words], dtype=tf.int32)
+            ),
+            default_value=-1 if self.oov_index is None else self.oov_index
+        )
+        # RE2 character class of the filter characters; punctuation is escaped
+        filter_pattern = '[' + ''.join(
+            '\\' + character if character in string.punctuation else character 
+            for character in self.filters
+        ) + ']'
+        split_rewrite = self.split.replace('\\', '\\\\')
+        
+        def tokenize(texts: 'tf.Tensor') -> 'tf.Tensor':
+            if self.lower:
+                texts = tf.strings.lower(texts, encoding='utf-8')
+            if self.filters:
+                texts = tf.strings.regex_replace(texts, filter_pattern, split_rewrite)
+            tokens = tf.strings.split(texts, sep=self.split)
+            tokens = tf.ragged.boolean_mask(tokens, tf.strings.length(tokens) > 0)
+            ids = table.lookup(tokens)
+            ids = tf.ragged.boolean_mask(ids, ids >= 0)
+            
+            # Pre-pad/pre-truncate by scattering, as pad() does
+            rows = ids.value_rowids()
+            lengths = tf.gather(ids.row_lengths(), rows)
+            positions = tf.range(tf.size(rows, out_type=tf.int64)) - tf.gather(ids.row_starts(), rows)
+            columns = max_len - lengths + positions
+            keep = columns >= 0
+            return tf.scatter_nd(
+                tf.stack([tf.boolean_mask(rows, keep), tf.boolean_mask(columns, keep)], axis=1),
+                tf.boolean_mask(ids.flat_values, keep),
+                tf.stack([ids.nrows(), tf.constant(max_len, dtype=tf.int64)])
+            )
+        
+        return tokenize
+
 
 class SportsSentimentAnalyzer:
-    def __init__(self, max_words: int = 10000, max_len: int = 200):
+    def __init__(self, max_words: int = 10000, max_len: int = 200, score_cache=None):
         """
         Initialize sentiment analysis model for sports context
         
         Args:
             max_words (int): Maximum number of words to keep in vocabulary
             max_len (int): Maximum length of input sequences
+            score_cache: Optional score cache (e.g. analysis.scoreCache.ScoreCache) so
+                repeated texts skip the model; give it its own namespace
         """
         self.max_words = max_words
         self.max_len = max_len
+        
+        from tensorflow.keras.preprocessing.text import Tokenizer
         self.tokenizer = Tokenizer(num_words=max_words)
+        self.vocabulary = None
         self.model = None
+        self.score_cache = score_cache
 
     def preprocess_text(self, texts: List[str]) -> np.ndarray:
         """
-        Preprocess text data for model input
+        Preprocess text data for model input, fitting the tokenizer (training only)
         
         Args:
             texts (List[str]): List of text inputs
@@ -38,9 +276,24 @@ class SportsSentimentAnalyzer:
         sequences = self.tokenizer.texts_to_sequences(texts)
         
         # Pad sequences
+        from tensorflow.keras.preprocessing.sequence import pad_sequences
         return pad_sequences(sequences, maxlen=self.max_len)
 
-    def build_model(self, vocab_size: int) -> Sequential:
+    def vectorize_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Tokenize and pad texts with the frozen training vocabulary
+        
+        Args:
+            texts (List[str]): List of text inputs
+        
+        Returns:
+            np.ndarray: Padded int32 sequences
+        """
+        if self.vocabulary is None:
+            self.vocabulary = FrozenVocabulary.from_tokenizer(self.tokenizer)
+        return self.vocabulary.texts_to_padded(texts, self.max_len)
+
+    def build_model(self, vocab_size: int) -> 'Sequential':
         """
         Build sentiment analysis LSTM model
         
@@ -50,8 +303,14 @@ class SportsSentimentAnalyzer:
         Returns:
             Sequential: Compiled Keras model
         """
+        from tensorflow.keras.models import Sequential
+        from tensorflow.keras.layers import Embedding, LSTM, Dense, Dropout
+        
+        # No fixed input_length: training pads to max_len, bucketed inference
+        # runs shorter padded lengths through the same weights. Index 0 is only
+        # ever padding, and masking it makes scores independent of pad length.
         model = Sequential([
-            Embedding(vocab_size, 100, input_length=self.max_len),
+            Embedding(vocab_size, 100, mask_zero=True),
             LSTM(128, return_sequences=True),
             Dropout(0.2),
             LSTM(64),
@@ -79,6 +338,173 @@ class SportsSentimentAnalyzer:
         # Build and train model
         self.model = self.build_model(vocab_size)
         self.model.fit(X, labels, epochs=10, validation_split=0.2, batch_size=32)
+        
+        # Inference uses a frozen copy of the trained index
+        self.vocabulary = FrozenVocabulary.from_tokenizer(self.tokenizer)
+        
+        # Cached scores came from the previous weights
+        if self.score_cache is not None:
+            self.score_cache.clear()
+
+    def fit_vocabulary(self, text_chunks: Iterable[List[str]]) -> int:
+        """
+        Fit the tokenizer chunk by chunk and freeze the result
+        
+        Tokenizer word counts accumulate across fit_on_texts calls, so the
+        resulting index is identical to fitting on the whole corpus at once.
+        
+        Args:
+            text_chunks (Iterable[List[str]]): Corpus texts in chunks
+        
+        Returns:
+            int: Number of texts seen
+        """
+        text_count = 0
+        for texts in text_chunks:
+            self.tokenizer.fit_on_texts(texts)
+            text_count += len(texts)
+        
+        self.vocabulary = FrozenVocabulary.from_tokenizer(self.tokenizer)
+        return text_count
+
+    def streaming_dataset(
+        self,
+        chunk_source: Callable[[], Iterable[pd.DataFrame]],
+        start: int = 0,
+        stop: Optional[int] = None,
+        batch_size: int = 32,
+        shuffle_buffer: Optional[int] = None,
+        text_column: str = 'text',
+        label_column: str = 'sentiment'
+    ) -> 'tf.data.Dataset':
+        """
+        tf.data pipeline over CSV chunks: slice rows, shuffle, batch, tokenize, prefetch
+        
+        Rows are read serially from chunk_source; tokenization runs as graph ops
+        (FrozenVocabulary.tensorflow_tokenizer), so batches are tokenized in parallel.
+        
+        Args:
+            chunk_source (Callable[[], Iterable[pd.DataFrame]]): Returns a fresh chunk
+                iterator each time the dataset is iterated (once per epoch)
+            start (int): First global row to include
+            stop (Optional[int]): Row after the last one to include
+            batch_size (int): Texts per batch
+            shuffle_buffer (Optional[int]): Bounded shuffle buffer size, no shuffling if None
+            text_column (str): Text column name
+            label_column (str): Label column name
+        
+        Returns:
+            tf.data.Dataset: Batches of (padded int32 sequences, float32 labels)
+        """
+        import tensorflow as tf
+        
+        def chunk_rows():
+            offset = 0
+            for chunk in chunk_source():
+                lo = max(start - offset, 0)
+                hi = len(chunk) if stop is None else min(stop - offset, len(chunk))
+                offset += len(chunk)
+                if lo < hi:
+                    yield (
+                        chunk[text_column].iloc[lo:hi].fillna('').astype(str).to_numpy(),
+                        chunk[label_column].iloc[lo:hi].to_numpy(dtype=np.float32)
+                    )
+                if stop is not None and offset >= stop:
+                    break
+        
+        tokenize = self.vocabulary.tensorflow_tokenizer(self.max_len)
+        
+        def tokenize_batch(texts, labels):
+            sequences = tokenize(texts)
+            sequences.set_shape([None, self.max_len])
+            return sequences, labels
+        
+        dataset = tf.data.Dataset.from_generator(
+            chunk_rows,
+            output_signature=(
+                tf.TensorSpec(shape=(None,), dtype=tf.string),
+                tf.TensorSpec(shape=(None,), dtype=tf.float32)
+            )
+        ).unbatch()
+        
+        if shuffle_buffer:
+            dataset = dataset.shuffle(shuffle_buffer, reshuffle_each_iteration=True)
+        
+        return (
+            dataset
+            .batch(batch_size)
+            .map(tokenize_batch, num_parallel_calls=tf.data.AUTOTUNE)
+            .prefetch(tf.data.AUTOTUNE)
+        )
+
+    def train_streaming(
+        self,
+        chunk_source: Callable[[], Iterable[pd.DataFrame]],
+        epochs: int = 10,
+        batch_size: int = 32,
+        validation_split: float = 0.2,
+        shuffle_buffer: int = 10000,
+        text_column: str = 'text'
+    ) -> int:
+        """
+        Train without holding the corpus in memory
+        
+        One pass fits the tokenizer and counts rows; training then streams
+        chunks through streaming_dataset each epoch. As with validation_split in
+        train(), the last fraction of rows is held out for validation.
+        
+        Args:
+            chunk_source (Callable[[], Iterable[pd.DataFrame]]): Returns a fresh chunk
+                iterator per pass, e.g. lambda: pd.read_csv(path, chunksize=100000)
+            epochs (int): Training epochs
+            batch_size (int): Texts per batch
+            validation_split (float): Trailing fraction of rows used for validation
+            shuffle_buffer (int): Bounded shuffle buffer size for training rows
+            text_column (str): Text column name
+        
+        Returns:
+            int: Number of rows in the corpus
+        """
+        row_count = self.fit_vocabulary(
+            chunk[text_column].fillna('').astype(str).tolist() for chunk in chunk_source()
+        )
+        split_at = int(row_count * (1.0 - validation_split))
+        
+        train_dataset = self.streaming_dataset(
+            chunk_source, stop=split_at, batch_size=batch_size, shuffle_buffer=shuffle_buffer
+        )
+        validation_dataset = self.streaming_dataset(
+            chunk_source, start=split_at, batch_size=batch_size
+        ) if split_at < row_count else None
+        
+        # Get vocabulary size
+        vocab_size = min(len(self.tokenizer.word_index) + 1, self.max_words)
+        
+        # Build and train model
+        self.model = self.build_model(vocab_size)
+        self.model.fit(train_dataset, epochs=epochs, validation_data=validation_dataset)
+        
+        # Cached scores came from the previous weights
+        if self.score_cache is not None:
+            self.score_cache.clear()
+        
+        return row_count
+
+    def export_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Model weights and frozen vocabulary as plain arrays, for the model registry
+        
+        Returns:
+            Dict[str, np.ndarray]: weight_<i> per Keras weight plus vocabulary arrays
+        """
+        if self.model is None:
+            raise ValueError("Model must be trained before export")
+        if self.vocabulary is None:
+            self.vocabulary = FrozenVocabulary.from_tokenizer(self.tokenizer)
+        
+        arrays = {f'weight_{i}': weight for i, weight in enumerate(self.model.get_weights())}
+        arrays.update(self.vocabulary.to_arrays())
+        return arrays
 
     def predict_sentiment(self, texts: List[str]) -> np.ndarray:
         """
@@ -93,12 +519,63 @@ class SportsSentimentAnalyzer:
         if self.model is None:
             raise ValueError("Model must be trained before prediction")
         
+        if self.score_cache is not None:
+            scores = self.score_cache.get_or_compute(
+                texts,
+                lambda batch: self.model.predict(self.vectorize_texts(batch))
+            )
+            return scores.reshape(-1, 1)
+        
         # Preprocess input texts
-        X = self.preprocess_text(texts)
+        X = self.vectorize_texts(texts)
         
         # Predict sentiment
         return self.model.predict(X)
 
+    def predict_sentiment_bucketed(
+        self, 
+        texts: List[str], 
+        bucket_lengths: Sequence[int] = DEFAULT_BUCKET_LENGTHS,
+        batch_size: int = 256
+    ) -> np.ndarray:
+        """
+        Predict sentiment with length-bucketed padding
+        
+        Texts are grouped by token count and each group runs at the smallest
+        bucket length that holds it, so short posts do not pay for max_len
+        LSTM steps; results are returned in input order. The embedding masks
+        padding, so scores match predict_sentiment up to float rounding.
+        
+        Args:
+            texts (List[str]): Text data to classify
+            bucket_lengths (Sequence[int]): Padded lengths below max_len
+            batch_size (int): Batch size for each bucket's forward passes
+        
+        Returns:
+            np.ndarray: Sentiment scores (0-1)
+        """
+        if self.model is None:
+            raise ValueError("Model must be trained before prediction")
+        if self.vocabulary is None:
+            self.vocabulary = FrozenVocabulary.from_tokenizer(self.tokenizer)
+        
+        ids, lengths = self.vocabulary.encode(texts)
+        padded = self.vocabulary.pad(ids, lengths, self.max_len)
+        
+        # Pre-padding keeps every token in the last `length` columns
+        boundaries = np.array(sorted(
+            {length for length in bucket_lengths if length < self.max_len} | {self.max_len}
+        ))
+        buckets = np.searchsorted(boundaries, np.clip(lengths, 1, self.max_len), side='left')
+        
+        scores = np.empty((len(texts), 1), dtype=np.float32)
+        for bucket in np.unique(buckets):
+            rows = np.flatnonzero(buckets == bucket)
+            bucket_input = padded[rows, self.max_len - boundaries[bucket]:]
+            scores[rows] = self.model.predict(bucket_input, batch_size=batch_size, verbose=0)
+        
+        return scores
+
     def evaluate_model(self, texts: List[str], labels: np.ndarray) -> Dict[str, float]:
         """
         Evaluate model performance
@@ -110,7 +587,7 @@ class SportsSentimentAnalyzer:
         Returns:
             Dict[str, float]: Performance metrics
         """
-        X = self.preprocess_text(texts)
+        X = self.vectorize_texts(texts)
         
         # Evaluate model
         loss, accuracy = self.model.evaluate(X, labels)
@@ -118,4 +595,174 @@ class SportsSentimentAnalyzer:
         return {
             'loss': loss,
             'accuracy': accuracy
-        }
\ No newline at end of file
+        }
+
+    def evaluate_streaming(
+        self, 
+        chunk_source: Callable[[], Iterable[pd.DataFrame]], 
+        batch_size: int = 32
+    ) -> Dict[str, float]:
+        """
+        Evaluate model performance over a chunked corpus
+        
+        Args:
+            chunk_source (Callable[[], Iterable[pd.DataFrame]]): Returns a fresh chunk iterator
+            batch_size (int): Texts per batch
+        
+        Returns:
+            Dict[str, float]: Performance metrics
+        """
+        loss, accuracy = self.model.evaluate(self.streaming_dataset(chunk_source, batch_size=batch_size))
+        
+        return {
+            'loss': loss,
+            'accuracy': accuracy
+        }
+
+
+class SentimentBatchScheduler:
+    """
+    Micro-batching front end for SportsSentimentAnalyzer
+    
+    Concurrent callers submit texts; a single worker thread gathers requests
+    for up to max_wait_ms (or until max_batch_size texts are queued), scores
+    them in one bucketed pass and hands each caller its slice.
+    """
+    def __init__(
+        self, 
+        analyzer: SportsSentimentAnalyzer, 
+        max_batch_size: int = 1024, 
+        max_wait_ms: float = 5.0,
+        bucket_lengths: Sequence[int] = DEFAULT_BUCKET_LENGTHS
+    ):
+        """
+        Start the scheduler
+        
+        Args:
+            analyzer (SportsSentimentAnalyzer): Trained analyzer
+            max_batch_size (int): Texts per shared forward pass before flushing early
+            max_wait_ms (float): Longest time a request waits for companions
+            bucket_lengths (Sequence[int]): Padded lengths for bucketed inference
+        """
+        self.analyzer = analyzer
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.bucket_lengths = bucket_lengths
+        self._requests = queue.Queue()
+        # Guards _closed so no request can be queued behind the stop sentinel
+        self._lock = threading.Lock()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+    
+    def submit(self, texts: List[str]) -> Future:
+        """
+        Queue texts for scoring (RuntimeError once the scheduler is closed)
+        
+        Args:
+            texts (List[str]): Text data to classify
+        
+        Returns:
+            Future: Resolves to the sentiment scores for these texts
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot submit to a closed SentimentBatchScheduler")
+            self._requests.put((list(texts), future))
+        return future
+    
+    def predict(self, texts: List[str]) -> np.ndarray:
+        """
+        Score texts, sharing a forward pass with concurrent callers
+        
+        Args:
+            texts (List[str]): Text data to classify
+        
+        Returns:
+            np.ndarray: Sentiment scores (0-1)
+        """
+        return self.submit(texts).result()
+    
+    def close(self):
+        """
+        Stop the worker after pending requests are served (later calls are no-ops)
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._requests.put(None)
+        self._worker.join()
+    
+    def _collect(self, first) -> Tuple[List[Tuple[List[str], Future]], bool]:
+        batch, queued = [first], len(first[0])
+        deadline = time.monotonic() + self.max_wait_ms / 1000.0
+        
+        while queued < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._requests.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if request is None:
+                return batch, True
+            batch.append(request)
+            queued += len(request[0])
+        
+        return batch, False
+    
+    def _run(self):
+        stopping = False
+        while not stopping:
+            request = self._requests.get()
+            if request is None:
+                break
+            
+            batch, stopping = self._collect(request)
+            texts = [text for request_texts, _ in batch for text in request_texts]
+            
+            try:
+                scores = self.analyzer.predict_sentiment_bucketed(texts, self.bucket_lengths)
+            except Exception as error:
+                for _, future in batch:
+                    future.set_exception(error)
+                continue
+            
+            offset = 0
+            for request_texts, future in batch:
+                future.set_result(scores[offset:offset + len(request_texts)])
+                offset += len(request_texts)
+
+
+def load_sentiment_analyzer(bundle) -> SportsSentimentAnalyzer:
+    """
+    Rebuild a trained analyzer from a model registry bundle
+    
+    The tokenizer is not restored; inference runs on the frozen vocabulary.
+    
+    Args:
+        bundle: models.artifactStore.ArrayBundle written from export_arrays, with
+            max_words and max_len in its manifest
+    
+    Returns:
+        SportsSentimentAnalyzer: Analyzer ready for prediction
+    """
+    analyzer = SportsSentimentAnalyzer(
+        max_words=bundle.manifest['max_words'], 
+        max_len=bundle.manifest['max_len']
+    )
+    analyzer.vocabulary = FrozenVocabulary.from_arrays(
+        {name: bundle.array(name) for name in bundle.names() if name.startswith('vocabulary_')}
+    )
+    
+    weight_count = sum(1 for name in bundle.names() if name.startswith('weight_'))
+    weights = [np.asarray(bundle.array(f'weight_{i}')) for i in range(weight_count)]
+    
+    # The embedding matrix has one row per vocabulary index
+    analyzer.model = analyzer.build_model(vocab_size=weights[0].shape[0])
+    analyzer.model.build((None, analyzer.max_len))
+    analyzer.model.set_weights(weights)
+    return analyzer
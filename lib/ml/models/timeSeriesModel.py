@@ -1,10 +1,13 @@
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import MinMaxScaler
-from sklearn.model_selection import train_test_split
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import LSTM, Dense, Dropout
-from typing import List, Dict, Any
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import TYPE_CHECKING, List, Dict, Any, Union
+
+from .artifactStore import ArrayBundle
+
+# scikit-learn and TensorFlow are imported inside the methods that need them
+if TYPE_CHECKING:
+    from tensorflow.keras.models import Sequential, Model
 
 class PlayerTimeSeriesPredictor:
     def __init__(self, lookback_period: int = 10, forecast_horizon: int = 5):
@@ -18,31 +21,119 @@ class PlayerTimeSeriesPredictor:
         self.lookback_period = lookback_period
         self.forecast_horizon = forecast_horizon
         self.model = None
+        
+        from sklearn.preprocessing import MinMaxScaler
         self.scaler = MinMaxScaler()
+        self._forward = None
+        
+        # Per-player ring buffers of the latest scaled observations: id -> [buffer, count]
+        self.recent_observations = {}
+
+    def __getstate__(self):
+        # The compiled forward pass is rebuilt on demand and cannot be pickled
+        state = self.__dict__.copy()
+        state['_forward'] = None
+        return state
 
-    def prepare_data(self, player_data: pd.DataFrame, target_column: str) -> tuple:
+    def prepare_data(self, player_data: pd.DataFrame, target_column: str, fit_scaler: bool = True) -> tuple:
         """
         Prepare time series data for LSTM model
         
         Args:
             player_data (pd.DataFrame): DataFrame with player performance data
             target_column (str): Column to predict
+            fit_scaler (bool): Fit the scaler on this data (training) or reuse the
+                scaler fitted at training time
         
         Returns:
             tuple: Preprocessed X and y data
         """
         # Normalize the data
-        scaled_data = self.scaler.fit_transform(player_data[[target_column]])
+        if fit_scaler:
+            scaled_data = self.scaler.fit_transform(player_data[[target_column]])
+        else:
+            scaled_data = self._scale(player_data[target_column].to_numpy(dtype=np.float64))[:, np.newaxis]
         
         # Create sequences
-        X, y = [], []
-        for i in range(len(scaled_data) - self.lookback_period - self.forecast_horizon + 1):
-            X.append(scaled_data[i:i+self.lookback_period])
-            y.append(scaled_data[i+self.lookback_period:i+self.lookback_period+self.forecast_horizon].flatten())
+        windows = self._windows(scaled_data[:, 0])
+        return windows[:, :self.lookback_period, np.newaxis], windows[:, self.lookback_period:]
+
+    def _scale(self, values: np.ndarray) -> np.ndarray:
+        # MinMaxScaler.transform for the single fitted target column
+        return values * self.scaler.scale_[0] + self.scaler.min_[0]
+
+    def _inverse_scale(self, values: np.ndarray) -> np.ndarray:
+        # MinMaxScaler.inverse_transform, element-wise so (n, horizon) arrays work
+        return (values - self.scaler.min_[0]) / self.scaler.scale_[0]
+
+    def _windows(self, series: np.ndarray) -> np.ndarray:
+        """
+        Strided (lookback + horizon) windows over a 1-D series, without copying
+        
+        Args:
+            series (np.ndarray): Scaled series
+        
+        Returns:
+            np.ndarray: Read-only view of shape (windows, lookback + horizon)
+        """
+        window = self.lookback_period + self.forecast_horizon
+        if len(series) < window:
+            return np.empty((0, window), dtype=series.dtype)
+        return sliding_window_view(series, window)
+
+    def prepare_panel_data(
+        self, 
+        panel_data: pd.DataFrame, 
+        target_column: str, 
+        player_column: str = 'player_id',
+        order_column: str = None,
+        fit_scaler: bool = True
+    ) -> tuple:
+        """
+        Prepare LSTM windows for many players from one frame
+        
+        The frame is sorted once by player (and order column), windows are taken
+        as strided views over the whole column and those that would cross a
+        player boundary are masked out, so no Python loop runs per player. Rows
+        with a missing player key are dropped.
+        
+        Args:
+            panel_data (pd.DataFrame): Performance data for many players
+            target_column (str): Column to predict
+            player_column (str): Column identifying the player
+            order_column (str): Column giving game order within a player
+                (frame order is kept when None)
+            fit_scaler (bool): Fit the scaler on this data (training) or reuse the
+                scaler fitted at training time
+        
+        Returns:
+            tuple: X, y and the player key of each window
+        """
+        # Rows without a player key belong to no history (factorize would code them -1)
+        panel_data = panel_data[panel_data[player_column].notna()]
+        sort_columns = [player_column] if order_column is None else [player_column, order_column]
+        panel_data = panel_data.sort_values(sort_columns, kind='stable')
+        
+        # Normalize the data
+        if fit_scaler:
+            scaled_data = self.scaler.fit_transform(panel_data[[target_column]])
+        else:
+            scaled_data = self._scale(panel_data[target_column].to_numpy(dtype=np.float64))[:, np.newaxis]
+        
+        # Keep windows whose first and last rows belong to the same player
+        codes, players = pd.factorize(panel_data[player_column])
+        windows = self._windows(scaled_data[:, 0])
+        window = self.lookback_period + self.forecast_horizon
+        valid = codes[:len(windows)] == codes[window - 1:]
         
-        return np.array(X), np.array(y)
+        windows = windows[valid]
+        return (
+            windows[:, :self.lookback_period, np.newaxis], 
+            windows[:, self.lookback_period:], 
+            np.asarray(players)[codes[:len(valid)][valid]]
+        )
 
-    def build_model(self, input_shape: tuple) -> Sequential:
+    def build_model(self, input_shape: tuple) -> 'Sequential':
         """
         Build LSTM model for time series prediction
         
@@ -52,6 +143,9 @@ class PlayerTimeSeriesPredictor:
         Returns:
             Sequential: Compiled Keras model
         """
+        from tensorflow.keras.models import Sequential
+        from tensorflow.keras.layers import LSTM, Dense, Dropout
+        
         model = Sequential([
             LSTM(50, activation='relu', input_shape=input_shape, return_sequences=True),
             Dropout(0.2),
@@ -70,6 +164,8 @@ class PlayerTimeSeriesPredictor:
             player_data (pd.DataFrame): DataFrame with player performance data
             target_column (str): Column to predict
         """
+        from sklearn.model_selection import train_test_split
+        
         X, y = self.prepare_data(player_data, target_column)
         
         # Split data
@@ -93,11 +189,125 @@ class PlayerTimeSeriesPredictor:
         if self.model is None:
             raise ValueError("Model must be trained before prediction")
         
-        X, _ = self.prepare_data(player_data, target_column)
+        X, _ = self.prepare_data(player_data, target_column, fit_scaler=False)
         predictions = self.model.predict(X)
         
         # Inverse transform predictions
-        return self.scaler.inverse_transform(predictions)
+        return self._inverse_scale(predictions)
+
+    def forecast_next(self, player_data: pd.DataFrame, target_column: str, player_id=None) -> np.ndarray:
+        """
+        Forecast the next forecast_horizon periods from the most recent window only
+        
+        Args:
+            player_data (pd.DataFrame): DataFrame with player performance data, oldest first
+            target_column (str): Column to predict
+            player_id: Player identifier, used by models conditioned on the player
+        
+        Returns:
+            np.ndarray: Predicted values for the next forecast_horizon periods
+        """
+        if self.model is None:
+            raise ValueError("Model must be trained before prediction")
+        
+        history = player_data[target_column].to_numpy(dtype=np.float64)
+        if len(history) < self.lookback_period:
+            raise ValueError(f"Need at least {self.lookback_period} observations to forecast")
+        
+        return self._forecast_window(self._scale(history[-self.lookback_period:]), player_id)
+
+    def _model_input(self, scaled_windows: np.ndarray, player_ids=None):
+        # Plain LSTM input; subclasses conditioned on the player add to it
+        return scaled_windows.reshape(-1, self.lookback_period, 1).astype(np.float32)
+
+    def _forecast_window(self, scaled_window: np.ndarray, player_id=None) -> np.ndarray:
+        import tensorflow as tf
+        
+        # Compiled single-window forward pass, skipping predict()'s per-call setup
+        if self._forward is None or self._forward[0] is not self.model:
+            model = self.model
+            self._forward = (model, tf.function(lambda inputs: model(inputs, training=False)))
+        
+        model_input = tf.nest.map_structure(tf.constant, self._model_input(scaled_window, [player_id]))
+        prediction = self._forward[1](model_input).numpy()[0]
+        return self._inverse_scale(prediction)
+
+    def seed_player(self, player_id, history: np.ndarray):
+        """
+        Load a player's latest observations into the online ring buffer
+        
+        Args:
+            player_id: Player identifier
+            history (np.ndarray): Past observations, oldest first
+        """
+        self.recent_observations.pop(player_id, None)
+        for value in np.asarray(history, dtype=np.float64)[-self.lookback_period:]:
+            self._push(player_id, value)
+
+    def _push(self, player_id, value: float):
+        entry = self.recent_observations.get(player_id)
+        if entry is None:
+            entry = self.recent_observations[player_id] = [np.zeros(self.lookback_period), 0]
+        
+        buffer, count = entry
+        buffer[count % self.lookback_period] = self._scale(value)
+        entry[1] = count + 1
+
+    def observe(self, player_id, value: float) -> np.ndarray:
+        """
+        Record a new game result and forecast the next periods for that player
+        
+        Uses the scaler fitted at training time and a ring buffer of the last
+        lookback_period observations, so each call is O(lookback) plus one
+        forward pass.
+        
+        Args:
+            player_id: Player identifier
+            value (float): Latest observed value of the target column
+        
+        Returns:
+            np.ndarray: Predicted values for the next forecast_horizon periods, or
+            None until lookback_period observations have been seen
+        """
+        if self.model is None:
+            raise ValueError("Model must be trained before prediction")
+        
+        self._push(player_id, value)
+        buffer, count = self.recent_observations[player_id]
+        if count < self.lookback_period:
+            return None
+        
+        # Oldest observation sits at the next write position
+        start = count % self.lookback_period
+        return self._forecast_window(np.concatenate((buffer[start:], buffer[:start])), player_id)
+
+    def export_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Model weights and scaler range as plain arrays, for artifact bundles
+        
+        Returns:
+            Dict[str, np.ndarray]: weight_<i> per Keras weight plus scaler_range
+        """
+        if self.model is None:
+            raise ValueError("Model must be trained before export")
+        
+        arrays = {f'weight_{i}': weight for i, weight in enumerate(self.model.get_weights())}
+        arrays['scaler_range'] = np.array([self.scaler.data_min_[0], self.scaler.data_max_[0]])
+        return arrays
+
+    def restore_arrays(self, arrays: Dict[str, np.ndarray]):
+        """
+        Rebuild the model and scaler from export_arrays output
+        
+        Args:
+            arrays (Dict[str, np.ndarray]): Arrays written by export_arrays
+        """
+        # Refitting on the stored extremes reproduces every fitted scaler attribute
+        self.scaler.fit(np.asarray(arrays['scaler_range'], dtype=np.float64).reshape(-1, 1))
+        
+        self.model = self.build_model(input_shape=(self.lookback_period, 1))
+        weight_count = sum(1 for name in arrays if name.startswith('weight_'))
+        self.model.set_weights([np.asarray(arrays[f'weight_{i}']) for i in range(weight_count)])
 
     def evaluate_model(self, player_data: pd.DataFrame, target_column: str) -> Dict[str, float]:
         """
@@ -110,7 +320,9 @@ class PlayerTimeSeriesPredictor:
         Returns:
             Dict[str, float]: Performance metrics
         """
-        X, y = self.prepare_data(player_data, target_column)
+        from sklearn.model_selection import train_test_split
+        
+        X, y = self.prepare_data(player_data, target_column, fit_scaler=False)
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
         
         # Predict and calculate metrics
@@ -121,4 +333,251 @@ class PlayerTimeSeriesPredictor:
         return {
             'mean_squared_error': mse,
             'mean_absolute_error': mae
-        }
\ No newline at end of file
+        }
+
+
+class GlobalPlayerTimeSeriesPredictor(PlayerTimeSeriesPredictor):
+    """
+    One LSTM over every player's windows, conditioned on a learned player embedding
+    
+    Players share the sequence weights and the scaler, so a whole league trains
+    in one process and one fit instead of one model per player.
+    """
+    def __init__(self, lookback_period: int = 10, forecast_horizon: int = 5, embedding_dim: int = 8):
+        """
+        Initialize the global time series predictor
+        
+        Args:
+            lookback_period (int): Number of previous periods to use for prediction
+            forecast_horizon (int): Number of future periods to predict
+            embedding_dim (int): Size of the per-player embedding
+        """
+        super().__init__(lookback_period, forecast_horizon)
+        self.embedding_dim = embedding_dim
+        self.players = []
+        self.player_index = {}
+
+    def build_model(self, input_shape: tuple) -> 'Model':
+        """
+        Build LSTM model with a player embedding joined after the sequence layers
+        
+        Args:
+            input_shape (tuple): Shape of one input window
+        
+        Returns:
+            Model: Compiled Keras model taking [windows, player codes]
+        """
+        from tensorflow.keras.models import Model
+        from tensorflow.keras.layers import LSTM, Dense, Dropout, Input, Embedding, Flatten, Concatenate
+        
+        window_input = Input(shape=input_shape, name='window')
+        player_input = Input(shape=(1,), dtype='int32', name='player')
+        
+        sequence = LSTM(50, activation='relu', return_sequences=True)(window_input)
+        sequence = Dropout(0.2)(sequence)
+        sequence = LSTM(50, activation='relu')(sequence)
+        sequence = Dropout(0.2)(sequence)
+        
+        player_embedding = Flatten()(Embedding(len(self.players), self.embedding_dim)(player_input))
+        output = Dense(self.forecast_horizon)(Concatenate()([sequence, player_embedding]))
+        
+        model = Model(inputs=[window_input, player_input], outputs=output)
+        model.compile(optimizer='adam', loss='mse')
+        return model
+
+    def _player_codes(self, player_ids) -> np.ndarray:
+        try:
+            return np.array([self.player_index[player_id] for player_id in player_ids], dtype=np.int32)
+        except KeyError as error:
+            raise ValueError(f"Unknown player {error.args[0]!r}, the model was not trained on it")
+
+    def _model_input(self, scaled_windows: np.ndarray, player_ids=None):
+        return [
+            super()._model_input(scaled_windows),
+            self._player_codes(player_ids).reshape(-1, 1)
+        ]
+
+    def train_panel(
+        self, 
+        panel_data: pd.DataFrame, 
+        target_column: str, 
+        player_column: str = 'player_id',
+        order_column: str = None,
+        epochs: int = 50
+    ):
+        """
+        Train one model on every player's windows
+        
+        Args:
+            panel_data (pd.DataFrame): Performance data for many players
+            target_column (str): Column to predict
+            player_column (str): Column identifying the player
+            order_column (str): Column giving game order within a player
+            epochs (int): Training epochs
+        """
+        from sklearn.model_selection import train_test_split
+        
+        X, y, window_players = self.prepare_panel_data(panel_data, target_column, player_column, order_column)
+        if len(X) < 2:
+            raise ValueError("Not enough windows to train, players need lookback + horizon games")
+        
+        self.players = list(pd.unique(window_players))
+        self.player_index = {player_id: code for code, player_id in enumerate(self.players)}
+        codes = self._player_codes(window_players)
+        
+        # Split data
+        X_train, X_test, c_train, c_test, y_train, y_test = train_test_split(
+            X, codes, y, test_size=0.2, random_state=42
+        )
+        
+        # Build and train model
+        self.model = self.build_model(input_shape=(X.shape[1], X.shape[2]))
+        self.model.fit(
+            [X_train, c_train.reshape(-1, 1)], y_train, epochs=epochs, batch_size=32, validation_split=0.2, verbose=0
+        )
+
+    def train(self, player_data: pd.DataFrame, target_column: str, player_column: str = 'player_id'):
+        """
+        Train on a panel frame (see train_panel)
+        
+        Args:
+            player_data (pd.DataFrame): Performance data for many players
+            target_column (str): Column to predict
+            player_column (str): Column identifying the player
+        """
+        self.train_panel(player_data, target_column, player_column)
+
+    def predict(self, player_data: pd.DataFrame, target_column: str, player_id=None) -> np.ndarray:
+        """
+        Make predictions for every window of one player's history
+        
+        Args:
+            player_data (pd.DataFrame): One player's performance data, oldest first
+            target_column (str): Column to predict
+            player_id: Player the history belongs to
+        
+        Returns:
+            np.ndarray: Predicted values
+        """
+        if self.model is None:
+            raise ValueError("Model must be trained before prediction")
+        
+        X, _ = self.prepare_data(player_data, target_column, fit_scaler=False)
+        predictions = self.model.predict(self._model_input(X, [player_id] * len(X)), verbose=0)
+        return self._inverse_scale(predictions)
+
+    def evaluate_model(
+        self, 
+        player_data: pd.DataFrame, 
+        target_column: str, 
+        player_column: str = 'player_id',
+        order_column: str = None
+    ) -> Dict[str, float]:
+        """
+        Evaluate model performance on the windows held out by train_panel
+        
+        Args:
+            player_data (pd.DataFrame): Performance data for many players
+            target_column (str): Column to predict
+            player_column (str): Column identifying the player
+            order_column (str): Column giving game order within a player
+        
+        Returns:
+            Dict[str, float]: Performance metrics
+        """
+        from sklearn.model_selection import train_test_split
+        
+        X, y, window_players = self.prepare_panel_data(
+            player_data, target_column, player_column, order_column, fit_scaler=False
+        )
+        codes = self._player_codes(window_players)
+        X_train, X_test, c_train, c_test, y_train, y_test = train_test_split(
+            X, codes, y, test_size=0.2, random_state=42
+        )
+        
+        # Predict and calculate metrics
+        y_pred = self.model.predict([X_test.astype(np.float32), c_test.reshape(-1, 1)], verbose=0)
+        mse = np.mean(np.square(y_test - y_pred))
+        mae = np.mean(np.abs(y_test - y_pred))
+        
+        return {
+            'mean_squared_error': mse,
+            'mean_absolute_error': mae
+        }
+
+    def export_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Model weights, scaler range and player order as plain arrays
+        
+        Numeric and string player ids keep their dtype in the players array;
+        other (mixed or object) ids are stored as strings.
+        
+        Returns:
+            Dict[str, np.ndarray]: Arrays for an artifact bundle
+        """
+        arrays = super().export_arrays()
+        players = np.asarray(self.players)
+        if players.dtype.kind not in 'biuU':
+            players = np.asarray([str(player_id) for player_id in self.players])
+        arrays['players'] = players
+        return arrays
+
+    def restore_arrays(self, arrays: Dict[str, np.ndarray]):
+        """
+        Rebuild the model, scaler and player index from export_arrays output
+        
+        Player ids come back as Python values of the stored dtype (int, str, ...).
+        
+        Args:
+            arrays (Dict[str, np.ndarray]): Arrays written by export_arrays
+        """
+        self.players = np.asarray(arrays['players']).tolist()
+        self.player_index = {player_id: code for code, player_id in enumerate(self.players)}
+        super().restore_arrays(arrays)
+
+
+def load_time_series_predictor(bundle: ArrayBundle) -> PlayerTimeSeriesPredictor:
+    """
+    Rebuild a single-player predictor from a model registry bundle
+    
+    Args:
+        bundle (ArrayBundle): Bundle written from export_arrays, with
+            lookback_period and forecast_horizon in its manifest
+    
+    Returns:
+        PlayerTimeSeriesPredictor: Restored predictor, ready for forecast_next/observe
+    """
+    predictor = PlayerTimeSeriesPredictor(bundle.manifest['lookback_period'], bundle.manifest['forecast_horizon'])
+    predictor.restore_arrays({name: bundle.array(name) for name in bundle.names()})
+    return predictor
+
+
+def load_league_predictor(bundle: Union[str, ArrayBundle], player_id=None) -> PlayerTimeSeriesPredictor:
+    """
+    Load a predictor from a bundle written by trainTimeSeriesModel's league driver
+    
+    Args:
+        bundle (Union[str, ArrayBundle]): Bundle or bundle directory
+        player_id: Player to load from a 'per_player' bundle (ignored for 'global')
+    
+    Returns:
+        PlayerTimeSeriesPredictor: Restored predictor, ready for forecast_next/observe
+    """
+    if isinstance(bundle, str):
+        bundle = ArrayBundle(bundle)
+    manifest = bundle.manifest
+    
+    if manifest['mode'] == 'global':
+        predictor = GlobalPlayerTimeSeriesPredictor(
+            manifest['lookback_period'], manifest['forecast_horizon'], manifest['embedding_dim']
+        )
+        names = {name: name for name in bundle.names()}
+    else:
+        entry = manifest['players'].get(str(player_id))
+        if entry is None:
+            raise ValueError(f"Player {player_id!r} is not in the bundle")
+        predictor = PlayerTimeSeriesPredictor(manifest['lookback_period'], manifest['forecast_horizon'])
+        names = entry['arrays']
+    
+    predictor.restore_arrays({name: bundle.array(stored) for name, stored in names.items()})
+    return predictor
@@ -0,0 +1,219 @@
+import os
+import sys
+import glob
+import json
+import hashlib
+import importlib.util
+import numpy as np
+import pandas as pd
+from typing import Iterator, List, Optional
+
+# Parquet needs a pyarrow or fastparquet engine; without one, loads skip the cache
+PARQUET_ENGINE = next(
+    (engine for engine in ('pyarrow', 'fastparquet') if importlib.util.find_spec(engine) is not None),
+    None
+)
+
+CACHE_DIRNAME = '.data_cache'
+
+# Object columns with at most this share of distinct values become categorical
+CATEGORICAL_MAX_UNIQUE_RATIO = 0.5
+
+
+def _exit_missing(data_path: str):
+    print(f"Error: Data file not found at {data_path}")
+    sys.exit(1)
+
+
+def downcast_frame(
+    data: pd.DataFrame,
+    categorical_columns: Optional[List[str]] = None,
+    categorical_max_unique_ratio: float = CATEGORICAL_MAX_UNIQUE_RATIO
+) -> pd.DataFrame:
+    """
+    Shrink default read_csv dtypes
+
+    float64 becomes float32 and integers take the smallest integer type that
+    holds them. Object columns become categorical when listed, or, when
+    categorical_columns is None, when their share of distinct values is at most
+    categorical_max_unique_ratio.
+
+    Args:
+        data (pd.DataFrame): Frame with default dtypes
+        categorical_columns (Optional[List[str]]): Columns to make categorical
+            (empty list for none), chosen by cardinality when None
+        categorical_max_unique_ratio (float): Cardinality cutoff for automatic choice
+
+    Returns:
+        pd.DataFrame: Frame with compact dtypes
+    """
+    converted = {}
+    for column, dtype in data.dtypes.items():
+        values = data[column]
+        if dtype == np.float64:
+            converted[column] = values.astype(np.float32)
+        elif pd.api.types.is_integer_dtype(dtype):
+            converted[column] = pd.to_numeric(values, downcast='integer')
+        elif pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            if categorical_columns is None:
+                make_categorical = len(values) > 0 and values.nunique() <= categorical_max_unique_ratio * len(values)
+            else:
+                make_categorical = column in categorical_columns
+            if make_categorical:
+                converted[column] = values.astype('category')
+
+    return data.assign(**converted) if converted else data
+
+
+def _digest(key: dict) -> str:
+    return hashlib.blake2b(json.dumps(key, sort_keys=True).encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _cache_path(data_path: str, cache_dir: Optional[str], options: dict) -> str:
+    # <stem>_<source digest>_<state digest>.parquet: the first digest names the
+    # source path and load options, the second changes with the file's size/mtime
+    stat = os.stat(data_path)
+    source_digest = _digest({'path': os.path.abspath(data_path), 'options': options})
+    state_digest = _digest({'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns})
+
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(data_path)), CACHE_DIRNAME)
+    stem = os.path.splitext(os.path.basename(data_path))[0]
+    return os.path.join(cache_dir, f'{stem}_{source_digest}_{state_digest}.parquet')
+
+
+def _remove_stale_caches(cache_path: str):
+    # Older versions of the same source and options share everything but the state digest
+    prefix = cache_path[:cache_path.rindex('_') + 1]
+    for stale_path in glob.glob(glob.escape(prefix) + '*.parquet'):
+        if stale_path != cache_path:
+            try:
+                os.remove(stale_path)
+            except OSError:
+                pass
+
+
+def load_table(
+    data_path: str,
+    columns: Optional[List[str]] = None,
+    categorical_columns: Optional[List[str]] = None,
+    use_cache: bool = True,
+    cache_dir: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Load a CSV with only the needed columns and compact dtypes, via a Parquet cache
+
+    The first load parses the CSV and writes the downcast frame to a Parquet
+    file keyed by the source path, size and modification time plus the load
+    options; later loads with the same key read the Parquet file instead. A
+    changed source file gets a new key, so stale caches are never read, and
+    writing the new cache deletes the older ones for the same source and options.
+
+    Args:
+        data_path (str): Path to CSV
+        columns (Optional[List[str]]): Columns to load (all when None), in this order
+        categorical_columns (Optional[List[str]]): See downcast_frame
+        use_cache (bool): Read and write the Parquet cache when an engine is installed
+        cache_dir (Optional[str]): Cache directory, a hidden directory next to
+            the CSV when None
+
+    Returns:
+        pd.DataFrame: Loaded data
+    """
+    if not os.path.exists(data_path):
+        _exit_missing(data_path)
+    if columns is not None:
+        columns = list(dict.fromkeys(columns))
+
+    cache_path = None
+    if use_cache and PARQUET_ENGINE is not None:
+        cache_path = _cache_path(data_path, cache_dir, {
+            'columns': columns,
+            'categorical_columns': categorical_columns
+        })
+        if os.path.exists(cache_path):
+            return pd.read_parquet(cache_path, engine=PARQUET_ENGINE)
+
+    try:
+        data = pd.read_csv(data_path, usecols=columns)
+    except ValueError as e:
+        print(f"Error: Missing required columns in CSV - {e}")
+        sys.exit(1)
+
+    if columns is not None:
+        data = data[columns]
+    data = downcast_frame(data, categorical_columns)
+
+    if cache_path is not None:
+        # A cache that cannot be written (read-only data dir) only costs speed
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            data.to_parquet(cache_path + '.tmp', engine=PARQUET_ENGINE, index=False)
+            os.replace(cache_path + '.tmp', cache_path)
+            _remove_stale_caches(cache_path)
+        except OSError:
+            pass
+
+    return data
+
+
+def iter_table_chunks(
+    data_path: str,
+    chunksize: int,
+    columns: Optional[List[str]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a CSV in chunks with only the needed columns, floats as float32
+
+    Categoricals are not applied per chunk because their categories would
+    differ between chunks.
+
+    Args:
+        data_path (str): Path to CSV
+        chunksize (int): Rows per chunk
+        columns (Optional[List[str]]): Columns to load (all when None)
+
+    Returns:
+        Iterator over DataFrame chunks
+    """
+    if not os.path.exists(data_path):
+        _exit_missing(data_path)
+
+    def chunks():
+        try:
+            for chunk in pd.read_csv(data_path, usecols=columns, chunksize=chunksize):
+                yield downcast_frame(chunk if columns is None else chunk[columns], categorical_columns=[])
+        except ValueError as e:
+            print(f"Error: Missing required columns in CSV - {e}")
+            sys.exit(1)
+
+    return chunks()
+
+
+def load_player_data(data_path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Load player performance data from CSV
+
+    Args:
+        data_path (str): Path to player performance data CSV
+        columns (Optional[List[str]]): Columns the caller needs (all when None)
+
+    Returns:
+        pd.DataFrame: Loaded player performance data
+    """
+    return load_table(data_path, columns=columns)
+
+
+def load_sentiment_data(data_path: str) -> tuple:
+    """
+    Load sports sentiment data from CSV
+
+    Args:
+        data_path (str): Path to sentiment data CSV
+
+    Returns:
+        tuple: Texts and labels
+    """
+    # Texts stay plain strings: the tokenizer wants a list of str
+    data = load_table(data_path, columns=['text', 'sentiment'], categorical_columns=[])
+    return data['text'].tolist(), data['sentiment'].to_numpy()
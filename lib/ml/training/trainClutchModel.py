@@ -2,30 +2,13 @@ import sys
 import os
 import numpy as np
 import pandas as pd
-import joblib
-import json
-from datetime import datetime
 
 # Ensure the models directory is in the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.clutchModel import ClutchPerformancePredictor
-
-def load_player_data(data_path: str) -> pd.DataFrame:
-    """
-    Load player performance data from CSV
-    
-    Args:
-        data_path (str): Path to player performance data CSV
-    
-    Returns:
-        pd.DataFrame: Loaded player performance data
-    """
-    try:
-        return pd.read_csv(data_path)
-    except FileNotFoundError:
-        print(f"Error: Data file not found at {data_path}")
-        sys.exit(1)
+from models.modelRegistry import ModelRegistry
+from training.dataLoader import load_player_data
 
 def train_clutch_performance_model(
     data_path: str, 
@@ -44,9 +27,6 @@ def train_clutch_performance_model(
         performance_columns (list): Columns to define clutch performance
         clutch_threshold (float): Threshold for defining clutch performance
     """
-    # Load data
-    player_data = load_player_data(data_path)
-    
     # Set default features if not provided
     if clutch_features is None:
         clutch_features = [
@@ -58,6 +38,9 @@ def train_clutch_performance_model(
     if performance_columns is None:
         performance_columns = ['points', 'assists', 'rebounds']
     
+    # Load only the columns the model uses
+    player_data = load_player_data(data_path, columns=clutch_features + performance_columns)
+    
     # Initialize and train model
     clutch_predictor = ClutchPerformancePredictor(clutch_threshold=clutch_threshold)
     clutch_predictor.train(player_data, clutch_features, performance_columns)
@@ -72,33 +55,27 @@ def train_clutch_performance_model(
     # Analyze feature importance
     feature_importance = clutch_predictor.feature_importance(clutch_features)
     
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Generate unique filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    model_filename = os.path.join(output_dir, f"clutch_model_{timestamp}.joblib")
-    metrics_filename = os.path.join(output_dir, f"clutch_metrics_{timestamp}.json")
-    feature_importance_filename = os.path.join(output_dir, f"feature_importance_{timestamp}.json")
-    
-    # Save model
-    joblib.dump(clutch_predictor, model_filename)
-    
-    # Save performance metrics
-    with open(metrics_filename, 'w') as f:
-        json.dump({k: float(v) for k, v in performance_metrics.items()}, f)
-    
-    # Save feature importance
-    with open(feature_importance_filename, 'w') as f:
-        json.dump({k: float(v) for k, v in feature_importance.items()}, f)
+    # Store weights, scaler and metrics as a new registry version under output_dir;
+    # serve with ModelRegistry(output_dir).load_latest('clutch') or, without
+    # TensorFlow, loader=clutchInference.NumpyClutchPredictor.from_bundle
+    model_path = ModelRegistry(output_dir).save(
+        'clutch',
+        clutch_predictor.export_arrays(clutch_features),
+        metadata={
+            'clutch_threshold': clutch_threshold,
+            'clutch_features': list(clutch_features),
+            'performance_columns': list(performance_columns),
+            'feature_importance': {k: float(v) for k, v in feature_importance.items()}
+        },
+        metrics=performance_metrics
+    )
     
-    print(f"Model saved to: {model_filename}")
-    print(f"Performance Metrics saved to: {metrics_filename}")
-    print(f"Feature Importance saved to: {feature_importance_filename}")
+    print(f"Model saved to: {model_path}")
+    print(f"Performance Metrics: {performance_metrics}")
     
     # Return key insights
     return {
-        'model_path': model_filename,
+        'model_path': model_path,
         'accuracy': performance_metrics['accuracy'],
         'feature_importance': dict(feature_importance)
     }
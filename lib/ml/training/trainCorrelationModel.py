@@ -2,35 +2,21 @@ import sys
 import os
 import numpy as np
 import pandas as pd
-import joblib
-import json
-from datetime import datetime
 
-# Ensure the models directory is in the Python path
+# Ensure the models directory and lib/ (for the shared common package) are in the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from models.correlationModel import PlayerPropCorrelationAnalyzer
-
-def load_player_data(data_path: str) -> pd.DataFrame:
-    """
-    Load player performance data from CSV
-    
-    Args:
-        data_path (str): Path to player performance data CSV
-    
-    Returns:
-        pd.DataFrame: Loaded player performance data
-    """
-    try:
-        return pd.read_csv(data_path)
-    except FileNotFoundError:
-        print(f"Error: Data file not found at {data_path}")
-        sys.exit(1)
+from models.artifactStore import correlation_artifact_arrays
+from models.modelRegistry import ModelRegistry
+from training.dataLoader import load_player_data, iter_table_chunks
 
 def train_correlation_analysis(
     data_path: str, 
     output_dir: str,
-    correlation_threshold: float = 0.5
+    correlation_threshold: float = 0.5,
+    chunksize: int = None
 ):
     """
     Perform correlation analysis and save results
@@ -39,66 +25,48 @@ def train_correlation_analysis(
         data_path (str): Path to input data
         output_dir (str): Directory to save analysis results
         correlation_threshold (float): Threshold for significant correlations
+        chunksize (int): Rows per chunk for out-of-core analysis; loads the whole
+            CSV into memory when None
     """
-    # Load data
-    player_data = load_player_data(data_path)
-    
     # Initialize correlation analyzer
     correlation_analyzer = PlayerPropCorrelationAnalyzer(
         correlation_threshold=correlation_threshold
     )
     
     # Perform comprehensive correlation analysis
-    analysis_results = correlation_analyzer.analyze_prop_relationships(player_data)
-    
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Generate unique filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Prepare serializable results
-    serializable_results = {
-        'correlation_matrix': analysis_results['correlation_matrix'].to_dict(),
-        'significant_correlations': [
-            {'feature1': f1, 'feature2': f2, 'correlation': float(corr)} 
-            for f1, f2, corr in analysis_results['significant_correlations']
-        ],
-        'pca_results': {
-            'explained_variance': analysis_results['pca_results']['explained_variance'].tolist(),
-            'components': analysis_results['pca_results']['components'].tolist()
-        },
-        'mutual_information': analysis_results['mutual_information'].to_dict()
-    }
-    
-    # Save results
-    results_filename = os.path.join(output_dir, f"correlation_analysis_{timestamp}.json")
-    with open(results_filename, 'w') as f:
-        json.dump(serializable_results, f, indent=2)
+    if chunksize is None:
+        player_data = load_player_data(data_path)
+        analysis_results = correlation_analyzer.analyze_prop_relationships(player_data)
+    else:
+        analysis_results = correlation_analyzer.analyze_prop_relationships_streaming(
+            lambda: iter_table_chunks(data_path, chunksize)
+        )
     
-    # Save PCA model for future use
-    pca_model_filename = os.path.join(output_dir, f"pca_model_{timestamp}.joblib")
-    joblib.dump(correlation_analyzer.pca, pca_model_filename)
+    # Store results, scaler and PCA as a new memory-mappable registry version
+    arrays, metadata = correlation_artifact_arrays(analysis_results, correlation_analyzer)
+    metadata['correlation_threshold'] = correlation_threshold
+    results_path = ModelRegistry(output_dir).save('correlation', arrays, metadata)
     
-    print(f"Correlation analysis results saved to: {results_filename}")
-    print(f"PCA model saved to: {pca_model_filename}")
+    print(f"Correlation analysis results saved to: {results_path}")
     
     # Return key insights
     return {
-        'significant_correlations_count': len(serializable_results['significant_correlations']),
-        'top_pca_variance': serializable_results['pca_results']['explained_variance'][:3]
+        'results_path': results_path,
+        'significant_correlations_count': len(analysis_results['significant_correlations']),
+        'top_pca_variance': analysis_results['pca_results']['explained_variance'][:3].tolist()
     }
 
 def main():
     # Example usage with command-line arguments
-    if len(sys.argv) != 3:
-        print("Usage: python train_correlation_model.py <data_path> <output_dir>")
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python train_correlation_model.py <data_path> <output_dir> [chunksize]")
         sys.exit(1)
     
     data_path = sys.argv[1]
     output_dir = sys.argv[2]
+    chunksize = int(sys.argv[3]) if len(sys.argv) > 3 else None
     
-    train_correlation_analysis(data_path, output_dir)
+    train_correlation_analysis(data_path, output_dir, chunksize=chunksize)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,39 +2,39 @@ import sys
 import os
 import numpy as np
 import pandas as pd
-import joblib
-from datetime import datetime
 
 # Ensure the models directory is in the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.sentimentModel import SportsSentimentAnalyzer
+from models.modelRegistry import ModelRegistry
+from training.dataLoader import load_sentiment_data, iter_table_chunks
 
-def load_sentiment_data(data_path: str) -> tuple:
+def sentiment_chunk_source(data_path: str, chunksize: int):
     """
-    Load sports sentiment data from CSV
+    Build a re-iterable chunk source over the sentiment CSV
     
     Args:
         data_path (str): Path to sentiment data CSV
+        chunksize (int): Rows per chunk
     
     Returns:
-        tuple: Texts and labels
+        Callable returning a fresh iterator of DataFrame chunks
     """
-    try:
-        data = pd.read_csv(data_path)
-        return data['text'].tolist(), data['sentiment'].to_numpy()
-    except FileNotFoundError:
-        print(f"Error: Data file not found at {data_path}")
-        sys.exit(1)
-    except KeyError as e:
-        print(f"Error: Missing required columns in CSV - {e}")
-        sys.exit(1)
+    # Fails fast on a missing file rather than on the first pass
+    iter_table_chunks(data_path, chunksize, columns=['text', 'sentiment'])
+    
+    def chunks():
+        return iter_table_chunks(data_path, chunksize, columns=['text', 'sentiment'])
+    
+    return chunks
 
 def train_sentiment_model(
     data_path: str, 
     output_dir: str,
     max_words: int = 10000,
-    max_len: int = 200
+    max_len: int = 200,
+    chunksize: int = None
 ):
     """
     Train and save sentiment analysis model
@@ -44,52 +44,49 @@ def train_sentiment_model(
         output_dir (str): Directory to save trained model
         max_words (int): Maximum vocabulary size
         max_len (int): Maximum sequence length
+        chunksize (int): Rows per chunk for streaming training; loads the whole
+            CSV into memory when None
     """
-    # Load data
-    texts, labels = load_sentiment_data(data_path)
-    
-    # Initialize and train model
+    # Initialize model
     sentiment_analyzer = SportsSentimentAnalyzer(
         max_words=max_words, 
         max_len=max_len
     )
-    sentiment_analyzer.train(texts, labels)
     
-    # Evaluate model
-    performance_metrics = sentiment_analyzer.evaluate_model(texts, labels)
+    if chunksize is None:
+        # Load data, train and evaluate in memory
+        texts, labels = load_sentiment_data(data_path)
+        sentiment_analyzer.train(texts, labels)
+        performance_metrics = sentiment_analyzer.evaluate_model(texts, labels)
+    else:
+        # Stream chunks through tf.data for training and evaluation
+        chunk_source = sentiment_chunk_source(data_path, chunksize)
+        sentiment_analyzer.train_streaming(chunk_source)
+        performance_metrics = sentiment_analyzer.evaluate_streaming(chunk_source)
     
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Generate unique filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    model_filename = os.path.join(output_dir, f"sentiment_model_{timestamp}.joblib")
-    metrics_filename = os.path.join(output_dir, f"sentiment_metrics_{timestamp}.json")
-    tokenizer_filename = os.path.join(output_dir, f"sentiment_tokenizer_{timestamp}.joblib")
-    
-    # Save model, metrics, and tokenizer
-    joblib.dump(sentiment_analyzer.model, model_filename)
-    joblib.dump(sentiment_analyzer.tokenizer, tokenizer_filename)
-    
-    # Save performance metrics
-    import json
-    with open(metrics_filename, 'w') as f:
-        json.dump({k: float(v) for k, v in performance_metrics.items()}, f)
+    # Store weights, frozen vocabulary and metrics as a new registry version under output_dir
+    model_path = ModelRegistry(output_dir).save(
+        'sentiment',
+        sentiment_analyzer.export_arrays(),
+        metadata={'max_words': max_words, 'max_len': max_len},
+        metrics=performance_metrics
+    )
     
-    print(f"Model saved to: {model_filename}")
-    print(f"Tokenizer saved to: {tokenizer_filename}")
+    print(f"Model saved to: {model_path}")
     print(f"Performance Metrics: {performance_metrics}")
+    return model_path
 
 def main():
     # Example usage with command-line arguments
-    if len(sys.argv) != 3:
-        print("Usage: python train_sentiment_model.py <data_path> <output_dir>")
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python train_sentiment_model.py <data_path> <output_dir> [chunksize]")
         sys.exit(1)
     
     data_path = sys.argv[1]
     output_dir = sys.argv[2]
+    chunksize = int(sys.argv[3]) if len(sys.argv) > 3 else None
     
-    train_sentiment_model(data_path, output_dir)
+    train_sentiment_model(data_path, output_dir, chunksize=chunksize)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
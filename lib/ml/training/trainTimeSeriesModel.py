@@ -2,29 +2,20 @@ import sys
 import os
 import numpy as np
 import pandas as pd
-import joblib
-from datetime import datetime
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
 # Ensure the models directory is in the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from models.timeSeriesModel import PlayerTimeSeriesPredictor
+from models.timeSeriesModel import PlayerTimeSeriesPredictor, GlobalPlayerTimeSeriesPredictor
+from models.modelRegistry import ModelRegistry
+from training.dataLoader import load_player_data
 
-def load_player_data(data_path: str) -> pd.DataFrame:
-    """
-    Load player performance data from CSV
-    
-    Args:
-        data_path (str): Path to player performance data CSV
-    
-    Returns:
-        pd.DataFrame: Loaded player performance data
-    """
-    try:
-        return pd.read_csv(data_path)
-    except FileNotFoundError:
-        print(f"Error: Data file not found at {data_path}")
-        sys.exit(1)
+LEAGUE_MODES = ('global', 'per_player')
+
+# Players need a few windows beyond one for the train/validation/test splits
+MIN_PLAYER_WINDOWS = 10
 
 def train_time_series_model(
     data_path: str, 
@@ -40,7 +31,7 @@ def train_time_series_model(
         output_dir (str): Directory to save trained model
     """
     # Load data
-    player_data = load_player_data(data_path)
+    player_data = load_player_data(data_path, columns=[target_column])
     
     # Initialize and train model
     predictor = PlayerTimeSeriesPredictor()
@@ -49,36 +40,169 @@ def train_time_series_model(
     # Evaluate model
     performance_metrics = predictor.evaluate_model(player_data, target_column)
     
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
+    # Store weights, scaler range and metrics as a new registry version under output_dir
+    model_path = ModelRegistry(output_dir).save(
+        'time_series',
+        predictor.export_arrays(),
+        metadata={
+            'target_column': target_column,
+            'lookback_period': predictor.lookback_period,
+            'forecast_horizon': predictor.forecast_horizon
+        },
+        metrics=performance_metrics
+    )
+    
+    print(f"Model saved to: {model_path}")
+    print(f"Performance Metrics: {performance_metrics}")
+    return model_path
+
+def _init_player_worker():
+    # Pay TensorFlow startup once per worker rather than once per player, and
+    # keep each worker on one core so the pool does not oversubscribe the CPU
+    import tensorflow as tf
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+    tf.config.threading.set_intra_op_parallelism_threads(1)
+
+def _train_player_model(task: tuple) -> tuple:
+    """
+    Train one player's model inside a pool worker
     
-    # Generate unique filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    model_filename = os.path.join(output_dir, f"time_series_model_{timestamp}.joblib")
-    metrics_filename = os.path.join(output_dir, f"time_series_metrics_{timestamp}.json")
+    Args:
+        task (tuple): (player_id, target values oldest first, lookback, horizon)
     
-    # Save model
-    joblib.dump(predictor, model_filename)
+    Returns:
+        tuple: player_id, exported arrays and performance metrics
+    """
+    player_id, values, lookback_period, forecast_horizon = task
+    player_data = pd.DataFrame({'target': values})
     
-    # Save performance metrics
-    import json
-    with open(metrics_filename, 'w') as f:
-        json.dump({k: float(v) for k, v in performance_metrics.items()}, f)
+    predictor = PlayerTimeSeriesPredictor(lookback_period, forecast_horizon)
+    predictor.train(player_data, 'target')
+    metrics = predictor.evaluate_model(player_data, 'target')
     
-    print(f"Model saved to: {model_filename}")
-    print(f"Performance Metrics: {performance_metrics}")
+    return player_id, predictor.export_arrays(), {k: float(v) for k, v in metrics.items()}
+
+def train_league_time_series_models(
+    data_path: str, 
+    target_column: str, 
+    output_dir: str,
+    mode: str = 'global',
+    player_column: str = 'player_id',
+    order_column: str = None,
+    lookback_period: int = 10,
+    forecast_horizon: int = 5,
+    n_workers: int = None
+) -> str:
+    """
+    Train time series models for every player in a league-wide frame
+    
+    'global' fits one GlobalPlayerTimeSeriesPredictor with player embeddings;
+    'per_player' fits one PlayerTimeSeriesPredictor per player in a process
+    pool whose workers import TensorFlow once and are reused across players.
+    Either way the result is a single indexed artifact bundle.
+    
+    Args:
+        data_path (str): Path to input data
+        target_column (str): Column to predict
+        output_dir (str): Directory to save the bundle in
+        mode (str): 'global' or 'per_player'
+        player_column (str): Column identifying the player
+        order_column (str): Column giving game order within a player
+        lookback_period (int): Number of previous periods to use for prediction
+        forecast_horizon (int): Number of future periods to predict
+        n_workers (int): Pool size for 'per_player', CPU count when None
+    
+    Returns:
+        str: Registry version directory (see models.timeSeriesModel.load_league_predictor)
+    """
+    if mode not in LEAGUE_MODES:
+        raise ValueError(f"mode must be one of {LEAGUE_MODES}, got {mode!r}")
+    
+    panel_columns = [player_column, target_column] + ([] if order_column is None else [order_column])
+    panel_data = load_player_data(data_path, columns=panel_columns)
+    sort_columns = [player_column] if order_column is None else [player_column, order_column]
+    panel_data = panel_data.sort_values(sort_columns, kind='stable')
+    
+    # Players without enough games for the splits are left out and listed
+    min_games = lookback_period + forecast_horizon + MIN_PLAYER_WINDOWS - 1
+    games = panel_data.groupby(player_column, sort=False)[target_column].transform('size')
+    skipped = sorted(str(p) for p in panel_data.loc[games < min_games, player_column].unique())
+    panel_data = panel_data[games >= min_games]
+    
+    metadata = {
+        'mode': mode,
+        'target_column': target_column,
+        'player_column': player_column,
+        'lookback_period': lookback_period,
+        'forecast_horizon': forecast_horizon,
+        'skipped_players': skipped
+    }
+    
+    if mode == 'global':
+        predictor = GlobalPlayerTimeSeriesPredictor(lookback_period, forecast_horizon)
+        predictor.train_panel(panel_data, target_column, player_column)
+        metrics = predictor.evaluate_model(panel_data, target_column, player_column)
+        
+        arrays = predictor.export_arrays()
+        metadata['embedding_dim'] = predictor.embedding_dim
+        metadata['players'] = {str(player_id): {} for player_id in predictor.players}
+    else:
+        tasks = [
+            (str(player_id), group.to_numpy(dtype=np.float64), lookback_period, forecast_horizon)
+            for player_id, group in panel_data.groupby(player_column, sort=False)[target_column]
+        ]
+        
+        arrays = {}
+        metrics = {}
+        metadata['players'] = {}
+        # spawn keeps workers clear of any TensorFlow state initialized in this process
+        with ProcessPoolExecutor(
+            max_workers=n_workers or os.cpu_count() or 1,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_player_worker
+        ) as executor:
+            for player_id, player_arrays, player_metrics in executor.map(_train_player_model, tasks):
+                names = {}
+                for name, array in player_arrays.items():
+                    names[name] = f'{player_id}/{name}'
+                    arrays[names[name]] = array
+                metadata['players'][player_id] = {'arrays': names, 'metrics': player_metrics}
+        
+        # Bundle-level metrics are the mean over players; per-player values stay in metadata
+        player_metric_values = [entry['metrics'] for entry in metadata['players'].values()]
+        if player_metric_values:
+            metrics = {
+                name: float(np.mean([values[name] for values in player_metric_values]))
+                for name in player_metric_values[0]
+            }
+    
+    # One registry version indexes every player's arrays
+    bundle_dir = ModelRegistry(output_dir).save('time_series_league', arrays, metadata, metrics)
+    
+    print(f"Trained {len(metadata['players'])} players ({len(skipped)} skipped) in {mode} mode")
+    print(f"Bundle saved to: {bundle_dir}")
+    return bundle_dir
 
 def main():
     # Example usage with command-line arguments
-    if len(sys.argv) != 4:
-        print("Usage: python train_time_series_model.py <data_path> <target_column> <output_dir>")
+    if len(sys.argv) not in (4, 5, 6):
+        print(
+            "Usage: python train_time_series_model.py <data_path> <target_column> <output_dir> "
+            "[global|per_player] [player_column]"
+        )
         sys.exit(1)
     
     data_path = sys.argv[1]
     target_column = sys.argv[2]
     output_dir = sys.argv[3]
     
-    train_time_series_model(data_path, target_column, output_dir)
+    if len(sys.argv) == 4:
+        train_time_series_model(data_path, target_column, output_dir)
+    else:
+        player_column = sys.argv[5] if len(sys.argv) == 6 else 'player_id'
+        train_league_time_series_models(
+            data_path, target_column, output_dir, mode=sys.argv[4], player_column=player_column
+        )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
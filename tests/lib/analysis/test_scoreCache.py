@@ -0,0 +1,50 @@
+# tests/lib/analysis/test_scoreCache.py
+
+import sqlite3
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from analysis import scoreCache
+from analysis.scoreCache import ScoreCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(scoreCache, 'time', SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+def _disk_keys(db_path, namespace='default'):
+    with sqlite3.connect(db_path) as db:
+        return {key for (key,) in db.execute('SELECT key FROM scores WHERE namespace = ?', (namespace,))}
+
+
+def test_disk_tier_deletes_expired_rows(tmp_path, clock):
+    db_path = str(tmp_path / 'scores.db')
+    cache = ScoreCache(ttl_seconds=60, db_path=db_path)
+    cache.put_many(['old'], np.array([0.1]))
+
+    clock[0] += 120
+    cache.put_many(['new'], np.array([0.2]))
+    cache.close()
+
+    assert _disk_keys(db_path) == {'new'}
+
+
+def test_disk_tier_keeps_newest_rows_per_namespace(tmp_path, clock):
+    db_path = str(tmp_path / 'scores.db')
+    cache = ScoreCache(db_path=db_path, max_disk_size=3)
+    other = ScoreCache(db_path=db_path, namespace='other', max_disk_size=3)
+    other.put_many(['x'], np.array([0.5]))
+
+    for index in range(5):
+        clock[0] += 1
+        cache.put_many([f'key{index}'], np.array([float(index)]))
+    cache.close()
+    other.close()
+
+    assert _disk_keys(db_path) == {'key2', 'key3', 'key4'}
+    assert _disk_keys(db_path, 'other') == {'x'}
@@ -0,0 +1,54 @@
+# tests/lib/analysis/test_sentimentAnalysis.py
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from analysis.sentimentAnalysis import KeyPhraseCounter, SentimentAnalyzer
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.map_calls = 0
+
+    def map(self, *args, **kwargs):
+        self.map_calls += 1
+        return super().map(*args, **kwargs)
+
+
+def test_social_sentiment_runs_on_caller_executor():
+    pytest.importorskip('textblob')
+    texts = ['great comeback win', 'awful loss tonight', 'the game was on'] * 900
+
+    with CountingExecutor() as executor:
+        pooled = SentimentAnalyzer.analyze_social_sentiment(texts, executor=executor)
+        SentimentAnalyzer.analyze_social_sentiment(texts, executor=executor)
+        assert executor.map_calls == 2
+
+    serial = SentimentAnalyzer.analyze_social_sentiment(texts, n_workers=1)
+    np.testing.assert_allclose(pooled['overall_sentiment'], serial['overall_sentiment'])
+    assert pooled['sentiment_breakdown'] == serial['sentiment_breakdown']
+
+
+def test_top_phrases_break_ties_by_first_appearance():
+    texts = [
+        'zebra apple mango', 'kiwi zebra', 'mango apple kiwi',
+        'plum pear fig', 'pear plum', 'zebra kiwi apple mango'
+    ]
+    counter = KeyPhraseCounter(capacity=100)
+    counter.ingest(texts[:3])
+    counter.ingest(texts[3:])
+
+    for top_n in range(1, 8):
+        expected = SentimentAnalyzer.extract_key_phrases(texts, top_n=top_n)
+        assert list(counter.top_phrases(top_n).items()) == list(expected.items())
+
+
+def test_top_phrases_tie_order_survives_pruning():
+    # The table reaches 2 * capacity on the third text and is pruned among ties
+    counter = KeyPhraseCounter(capacity=3)
+    counter.ingest(['delta alpha', 'gamma beta', 'echo foxtrot', 'alpha gamma'])
+
+    assert counter.top_phrases(3) == {'alpha': 2.0, 'gamma': 2.0, 'delta': 1.0}
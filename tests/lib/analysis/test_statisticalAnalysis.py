@@ -0,0 +1,107 @@
+# tests/lib/analysis/test_statisticalAnalysis.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.statisticalAnalysis import BayesianPropUpdater, StatisticalAnalyzer, StreamingZScore
+
+
+@pytest.fixture
+def long_frame():
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({
+        'player_id': rng.choice(['a', 'b', 'c'], 600),
+        'points': rng.normal(20, 5, 600),
+        'assists': rng.normal(5, 2, 600)
+    })
+    frame.loc[::11, 'points'] = np.nan
+    frame.loc[::13, 'assists'] = np.nan
+    frame.loc[::17, 'player_id'] = None
+    return frame
+
+
+def test_streaming_z_scores_match_batch_with_missing_values(long_frame):
+    columns = ['points', 'assists']
+    batch = StatisticalAnalyzer.calculate_z_scores_batch(
+        long_frame, group_column='player_id', value_columns=columns
+    )
+
+    streaming = StreamingZScore()
+    chunks = [long_frame.iloc[start:start + 70] for start in range(0, len(long_frame), 70)]
+    for chunk in chunks:
+        streaming.update(chunk[columns].to_numpy(), chunk['player_id'].to_numpy())
+
+    statistics = streaming.statistics()
+    order = [statistics['groups'].index(group) for group in batch['groups']]
+    np.testing.assert_allclose(statistics['mean'][order], batch['mean'])
+    np.testing.assert_allclose(statistics['standard_deviation'][order], batch['standard_deviation'])
+
+    z_scores = np.vstack([
+        streaming.score(chunk[columns].to_numpy(), chunk['player_id'].to_numpy())['z_scores']
+        for chunk in chunks
+    ])
+    np.testing.assert_allclose(z_scores, batch['z_scores'], equal_nan=True)
+
+
+def test_streaming_statistics_before_update_are_empty():
+    statistics = StreamingZScore().statistics()
+
+    assert statistics['groups'] == []
+    assert statistics['mean'].size == 0
+    assert statistics['standard_deviation'].size == 0
+
+
+def test_streaming_update_accepts_empty_chunk():
+    streaming = StreamingZScore()
+    streaming.update(np.array([]), np.array([]))
+    streaming.update(np.array([1.0, 3.0]), np.array(['a', 'a']))
+
+    np.testing.assert_allclose(streaming.statistics()['mean'], [[2.0]])
+
+
+def test_prop_model_batch_on_empty_frame_returns_empty_table(long_frame):
+    metrics = ['points', 'assists']
+    filled = StatisticalAnalyzer.probabilistic_prop_model_batch(long_frame, metrics, n_workers=1)
+    empty = StatisticalAnalyzer.probabilistic_prop_model_batch(long_frame.iloc[:0], metrics, n_workers=1)
+
+    assert list(empty['table'].columns) == list(filled['table'].columns)
+    assert len(empty['table']) == 0
+    assert empty['grid'].shape == (0, filled['grid'].shape[1])
+    assert empty['pdf'].shape == (0, filled['pdf'].shape[1])
+
+
+def test_bayesian_estimate_keeps_long_histories_comparable():
+    rng = np.random.default_rng(1)
+    tight = rng.normal(20, 2, 2000)
+    loose = rng.normal(20, 5, 2000)
+
+    tight_estimate = StatisticalAnalyzer.bayesian_probability_estimation(0.5, tight)
+    loose_estimate = StatisticalAnalyzer.bayesian_probability_estimation(0.5, loose)
+
+    # Both posteriors underflow, the log-odds still rank the evidence
+    assert tight_estimate['posterior_probability'] == 0.0
+    assert np.isfinite(tight_estimate['posterior_log_odds'])
+    assert tight_estimate['posterior_log_odds'] > loose_estimate['posterior_log_odds']
+
+    short = StatisticalAnalyzer.bayesian_probability_estimation(0.3, tight[:5])
+    odds = short['posterior_probability'] / (1 - short['posterior_probability'])
+    np.testing.assert_allclose(short['posterior_log_odds'], np.log(odds))
+
+
+def test_bayesian_batch_and_updater_match_single_estimates():
+    rng = np.random.default_rng(2)
+    priors = np.array([0.2, 0.5, 0.7])
+    evidence_sets = [rng.normal(10, 2, n) for n in (3, 40, 600)]
+
+    batch = StatisticalAnalyzer.bayesian_probability_batch(priors, evidence_sets)
+    updater = BayesianPropUpdater()
+    for prop, (prior, evidence) in enumerate(zip(priors, evidence_sets)):
+        single = StatisticalAnalyzer.bayesian_probability_estimation(prior, evidence)
+        updater.set_prior(prop, prior, evidence[:1])
+        for value in evidence[1:]:
+            streamed = updater.update(prop, value)
+
+        for field in ('log_likelihood', 'posterior_probability', 'posterior_log_odds'):
+            np.testing.assert_allclose(batch[field][prop], single[field], rtol=1e-9)
+            np.testing.assert_allclose(streamed[field], single[field], rtol=1e-9)
@@ -0,0 +1,12 @@
+# tests/lib/conftest.py
+
+import os
+import sys
+
+# lib/ holds the analysis package; lib/ml holds models and training, which the
+# training scripts import as top-level packages
+LIB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'lib')
+
+for path in (os.path.join(LIB_DIR, 'ml'), LIB_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,139 @@
+# tests/lib/ml/models/test_correlationModel.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('sklearn')
+
+from sklearn.metrics import mutual_info_score
+
+from models import correlationModel
+from models.correlationModel import CorrelationAccumulator, PlayerPropCorrelationAnalyzer
+
+
+def _stat_frame(seed: int, n_features: int = 6) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    base = rng.normal(size=(400, 1))
+    values = base * rng.uniform(0, 1, n_features) + rng.normal(size=(400, n_features))
+    return pd.DataFrame(values, columns=[f'stat_{i}' for i in range(n_features)])
+
+
+def _sklearn_mutual_information(data: pd.DataFrame, bins: int = 10) -> np.ndarray:
+    codes = {column: pd.cut(data[column], bins=bins, labels=False) for column in data.columns}
+    return np.array([
+        [mutual_info_score(codes[first], codes[second]) for second in data.columns]
+        for first in data.columns
+    ])
+
+
+@pytest.mark.parametrize('n_workers', [1, 2])
+def test_mutual_information_matches_sklearn(n_workers):
+    data = _stat_frame(0)
+    mi = PlayerPropCorrelationAnalyzer().compute_mutual_information(data, n_workers=n_workers)
+
+    np.testing.assert_allclose(mi.to_numpy(), _sklearn_mutual_information(data), atol=1e-12)
+    assert list(mi.columns) == list(data.columns)
+
+
+def test_serial_mutual_information_leaves_worker_state_alone(monkeypatch):
+    # The module global belongs to pool workers; concurrent serial callers
+    # sharing it would read each other's codes
+    def fail(codes):
+        raise AssertionError('serial path touched the worker global')
+
+    monkeypatch.setattr(correlationModel, '_init_mi_worker', fail)
+    data = _stat_frame(1)
+    mi = PlayerPropCorrelationAnalyzer().compute_mutual_information(data, n_workers=1)
+
+    np.testing.assert_allclose(mi.to_numpy(), _sklearn_mutual_information(data), atol=1e-12)
+
+
+def _chunks(data: pd.DataFrame, size: int):
+    return lambda: (data.iloc[start:start + size] for start in range(0, len(data), size))
+
+
+def test_streaming_analysis_matches_in_memory_analysis():
+    data = _stat_frame(2)
+    in_memory = PlayerPropCorrelationAnalyzer().analyze_prop_relationships(data)
+    streaming = PlayerPropCorrelationAnalyzer().analyze_prop_relationships_streaming(_chunks(data, 37))
+
+    pd.testing.assert_frame_equal(streaming['correlation_matrix'], in_memory['correlation_matrix'])
+    assert streaming['significant_correlations'] == pytest.approx(in_memory['significant_correlations'])
+    pd.testing.assert_frame_equal(streaming['mutual_information'], in_memory['mutual_information'])
+
+    np.testing.assert_allclose(
+        streaming['pca_results']['explained_variance'], in_memory['pca_results']['explained_variance']
+    )
+    # Components are defined up to sign
+    np.testing.assert_allclose(
+        np.abs(streaming['pca_results']['components']), np.abs(in_memory['pca_results']['components']),
+        atol=1e-8
+    )
+
+
+def test_streaming_analysis_skips_rows_with_missing_values():
+    data = _stat_frame(3)
+    holes = data.copy()
+    holes.iloc[::7, 2] = np.nan
+    holes.iloc[::11, 4] = np.nan
+
+    in_memory = PlayerPropCorrelationAnalyzer().analyze_prop_relationships(holes.dropna())
+    streaming = PlayerPropCorrelationAnalyzer().analyze_prop_relationships_streaming(_chunks(holes, 50))
+
+    pd.testing.assert_frame_equal(streaming['correlation_matrix'], in_memory['correlation_matrix'])
+    pd.testing.assert_frame_equal(streaming['mutual_information'], in_memory['mutual_information'])
+
+
+def test_accumulator_matches_dataframe_corr():
+    data = _stat_frame(4)
+    data.iloc[::9, 1] = np.nan
+    accumulator = CorrelationAccumulator()
+    for chunk in _chunks(data, 23)():
+        accumulator.update(chunk)
+
+    complete = data.dropna()
+    pd.testing.assert_frame_equal(accumulator.correlation_matrix(), complete.corr())
+    np.testing.assert_allclose(accumulator.covariance(), complete.cov().to_numpy())
+    assert accumulator.count == len(complete)
+
+
+def test_incremental_updates_survive_a_state_round_trip(tmp_path):
+    data = _stat_frame(5)
+    path = str(tmp_path / 'state.npz')
+
+    analyzer = PlayerPropCorrelationAnalyzer()
+    analyzer.update_prop_relationships(data.iloc[:250])
+    analyzer.save_correlation_state(path)
+
+    nightly = PlayerPropCorrelationAnalyzer()
+    nightly.load_correlation_state(path)
+    result = nightly.update_prop_relationships(data.iloc[250:])
+
+    pd.testing.assert_frame_equal(result['correlation_matrix'], data.corr())
+    assert result['observations'] == len(data)
+    assert result['significant_correlations'] == pytest.approx(
+        analyzer.find_significant_correlations(data.corr())
+    )
+
+
+def test_unseeded_accumulator_round_trips(tmp_path):
+    path = str(tmp_path / 'state.npz')
+    CorrelationAccumulator().save(path)
+    restored = CorrelationAccumulator.load(path)
+
+    assert restored.columns is None and restored.mean is None and restored.count == 0
+    restored.update(_stat_frame(6))
+    pd.testing.assert_frame_equal(restored.correlation_matrix(), _stat_frame(6).corr())
+
+
+def test_decay_weights_recent_rows_more():
+    old, new = _stat_frame(7), _stat_frame(8)
+    accumulator = CorrelationAccumulator()
+    accumulator.update(old)
+    accumulator.update(new, decay=0.5)
+
+    # Decaying history by one half is the same as counting new rows twice
+    doubled = pd.concat([old, new, new])
+    np.testing.assert_allclose(accumulator.count, len(doubled) / 2)
+    np.testing.assert_allclose(accumulator.correlation_matrix(), doubled.corr(), atol=1e-12)
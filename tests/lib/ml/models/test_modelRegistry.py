@@ -0,0 +1,100 @@
+# tests/lib/ml/models/test_modelRegistry.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.modelRegistry import ModelRegistry, clear_model_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_model_cache():
+    clear_model_cache()
+    yield
+    clear_model_cache()
+
+
+def test_save_and_open_round_trip(tmp_path):
+    registry = ModelRegistry(str(tmp_path))
+    weights = np.arange(12, dtype=np.float32).reshape(3, 4)
+    labels = np.array(['low', 'high'])
+
+    registry.save('clutch_test', {'weights': weights * 0}, {'threshold': 0.5})
+    path = registry.save(
+        'clutch_test', {'weights': weights, 'labels': labels}, {'threshold': 0.7}, {'auc': np.float64(0.81)}
+    )
+
+    assert registry.versions('clutch_test') == [1, 2]
+    assert path == registry.version_path('clutch_test', 2)
+
+    bundle = registry.load_latest('clutch_test')
+    assert bundle.manifest['version'] == 2
+    assert bundle.manifest['threshold'] == 0.7
+    assert bundle.manifest['metrics'] == {'auc': 0.81}
+    assert sorted(bundle.names()) == ['labels', 'weights']
+
+    stored = bundle.array('weights')
+    assert isinstance(stored, np.memmap)
+    np.testing.assert_array_equal(stored, weights)
+    assert stored.dtype == weights.dtype
+    np.testing.assert_array_equal(bundle.array('labels'), labels)
+
+    np.testing.assert_array_equal(registry.open('clutch_test', 1).array('weights'), weights * 0)
+
+
+def test_load_is_cached_until_cleared(tmp_path):
+    registry = ModelRegistry(str(tmp_path))
+    registry.save('clutch_test', {'weights': np.ones(3)})
+    calls = []
+
+    def loader(bundle):
+        calls.append(bundle.directory)
+        return np.asarray(bundle.array('weights')).sum()
+
+    assert registry.load('clutch_test', loader=loader) == 3.0
+    assert ModelRegistry(str(tmp_path)).load_latest('clutch_test', loader=loader) == 3.0
+    assert len(calls) == 1
+
+    clear_model_cache()
+    registry.load('clutch_test', loader=loader)
+    assert len(calls) == 2
+
+
+def test_save_rejects_reserved_metadata(tmp_path):
+    with pytest.raises(ValueError):
+        ModelRegistry(str(tmp_path)).save('clutch_test', {'weights': np.ones(3)}, {'version': 7})
+
+
+def test_load_latest_without_versions_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ModelRegistry(str(tmp_path)).load_latest('clutch_test')
+
+
+def test_correlation_results_round_trip_through_default_loader(tmp_path):
+    pytest.importorskip('sklearn')
+    from models.artifactStore import CorrelationArtifact, correlation_artifact_arrays
+    from models.correlationModel import PlayerPropCorrelationAnalyzer
+
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(rng.normal(size=(200, 4)), columns=['points', 'rebounds', 'assists', 'steals'])
+    data['rebounds'] += data['points']
+    analyzer = PlayerPropCorrelationAnalyzer(correlation_threshold=0.3)
+    results = analyzer.analyze_prop_relationships(data)
+
+    arrays, metadata = correlation_artifact_arrays(results, analyzer)
+    ModelRegistry(str(tmp_path)).save('correlation', arrays, metadata)
+    artifact = ModelRegistry(str(tmp_path)).load_latest('correlation')
+
+    assert isinstance(artifact, CorrelationArtifact)
+    assert artifact.features == list(data.columns)
+    np.testing.assert_allclose(
+        artifact.rows(['points', 'steals']), results['correlation_matrix'].loc[['points', 'steals']], atol=1e-6
+    )
+    stored_pairs = artifact.significant_correlations()
+    assert [pair[:2] for pair in stored_pairs] == [pair[:2] for pair in results['significant_correlations']]
+    np.testing.assert_allclose(
+        [pair[2] for pair in stored_pairs], [pair[2] for pair in results['significant_correlations']], rtol=1e-6
+    )
+    np.testing.assert_allclose(
+        artifact.transform(data), results['pca_results']['transformed_data'], atol=1e-5
+    )
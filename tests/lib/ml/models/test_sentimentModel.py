@@ -0,0 +1,82 @@
+# tests/lib/ml/models/test_sentimentModel.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+tf = pytest.importorskip('tensorflow')
+
+from tensorflow.keras.preprocessing.text import Tokenizer
+
+from models.sentimentModel import FrozenVocabulary, SentimentBatchScheduler, SportsSentimentAnalyzer
+
+TEXTS = [
+    'Clutch three at the buzzer!!! What a WIN',
+    'refs blew it... again; awful loss',
+    'Ça va: the comeback was (mostly) luck',
+    '',
+    '   spaced    out\ttabs\nnewlines   ',
+    'unknownword ' * 40 + 'win',
+    'win win win ' * 30
+]
+
+
+@pytest.fixture(params=[None, '<OOV>'])
+def vocabulary(request):
+    tokenizer = Tokenizer(num_words=12, oov_token=request.param)
+    tokenizer.fit_on_texts(TEXTS[:3] + ['win loss clutch buzzer refs'] * 3)
+    return FrozenVocabulary.from_tokenizer(tokenizer)
+
+
+@pytest.mark.parametrize('max_len', [4, 16, 64])
+def test_tensorflow_tokenizer_matches_texts_to_padded(vocabulary, max_len):
+    tokenize = vocabulary.tensorflow_tokenizer(max_len)
+
+    np.testing.assert_array_equal(
+        tokenize(tf.constant(TEXTS)).numpy(),
+        vocabulary.texts_to_padded(TEXTS, max_len)
+    )
+
+
+def test_streaming_dataset_matches_in_memory_vectorization(vocabulary):
+    analyzer = SportsSentimentAnalyzer(max_len=16)
+    analyzer.vocabulary = vocabulary
+    frame = pd.DataFrame({'text': TEXTS * 3, 'sentiment': np.arange(len(TEXTS) * 3) % 2})
+
+    def chunks():
+        for start in range(0, len(frame), 5):
+            yield frame.iloc[start:start + 5]
+
+    batches = list(analyzer.streaming_dataset(chunks, start=2, stop=19, batch_size=4))
+    sequences = np.concatenate([batch[0].numpy() for batch in batches])
+    labels = np.concatenate([batch[1].numpy() for batch in batches])
+
+    np.testing.assert_array_equal(sequences, vocabulary.texts_to_padded(frame['text'][2:19].tolist(), 16))
+    np.testing.assert_array_equal(labels, frame['sentiment'][2:19].to_numpy(dtype=np.float32))
+
+
+def test_scheduler_rejects_submissions_after_close(vocabulary):
+    analyzer = SportsSentimentAnalyzer(max_len=16)
+    analyzer.vocabulary = vocabulary
+    analyzer.model = analyzer.build_model(vocab_size=12)
+    scheduler = SentimentBatchScheduler(analyzer, max_wait_ms=1.0)
+
+    pending = scheduler.submit(TEXTS)
+    scheduler.close()
+    scheduler.close()
+
+    np.testing.assert_allclose(pending.result(timeout=30), analyzer.predict_sentiment(TEXTS), atol=1e-6)
+    with pytest.raises(RuntimeError):
+        scheduler.submit(TEXTS)
+
+
+def test_bucketed_scores_match_full_length_scores(vocabulary):
+    analyzer = SportsSentimentAnalyzer(max_len=64)
+    analyzer.vocabulary = vocabulary
+    analyzer.model = analyzer.build_model(vocab_size=12)
+
+    np.testing.assert_allclose(
+        analyzer.predict_sentiment_bucketed(TEXTS, bucket_lengths=(4, 16)),
+        analyzer.predict_sentiment(TEXTS),
+        atol=1e-6
+    )
@@ -0,0 +1,73 @@
+# tests/lib/ml/models/test_timeSeriesModel.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('sklearn')
+
+from models.timeSeriesModel import PlayerTimeSeriesPredictor
+
+
+@pytest.fixture
+def panel():
+    rng = np.random.default_rng(0)
+    games = {'a': 30, 'b': 25, 'c': 12}
+    frame = pd.DataFrame({
+        'player_id': np.repeat(list(games), list(games.values())),
+        'game': np.concatenate([np.arange(n) for n in games.values()]),
+        'points': rng.normal(20, 5, sum(games.values()))
+    })
+    # Shuffled so the panel path has to restore game order itself
+    return frame.sample(frac=1.0, random_state=0)
+
+
+def test_panel_windows_match_per_player_windows(panel):
+    predictor = PlayerTimeSeriesPredictor(lookback_period=5, forecast_horizon=2)
+    X, y, players = predictor.prepare_panel_data(panel, 'points', order_column='game')
+
+    expected_X, expected_y, expected_players = [], [], []
+    for player_id, history in panel.sort_values('game').groupby('player_id'):
+        player_X, player_y = predictor.prepare_data(history, 'points', fit_scaler=False)
+        expected_X.append(player_X)
+        expected_y.append(player_y)
+        expected_players += [player_id] * len(player_X)
+
+    np.testing.assert_allclose(X, np.concatenate(expected_X))
+    np.testing.assert_allclose(y, np.concatenate(expected_y))
+    assert list(players) == expected_players
+
+
+def test_panel_windows_skip_rows_without_player(panel):
+    predictor = PlayerTimeSeriesPredictor(lookback_period=5, forecast_horizon=2)
+    unkeyed = pd.DataFrame({'player_id': [None] * 20, 'game': np.arange(20), 'points': 20.0})
+    _, _, players = predictor.prepare_panel_data(
+        pd.concat([panel, unkeyed]), 'points', order_column='game'
+    )
+
+    # A player with n games has n - (lookback + horizon) + 1 windows
+    assert pd.Series(players).value_counts().to_dict() == {'a': 24, 'b': 19, 'c': 6}
+
+
+def test_global_predictor_keeps_integer_player_ids_through_registry(panel, tmp_path):
+    pytest.importorskip('tensorflow')
+    from models.modelRegistry import ModelRegistry
+    from models.timeSeriesModel import GlobalPlayerTimeSeriesPredictor, load_league_predictor
+
+    panel = panel.assign(player_id=panel['player_id'].map({'a': 101, 'b': 123, 'c': 7}))
+    predictor = GlobalPlayerTimeSeriesPredictor(lookback_period=5, forecast_horizon=2, embedding_dim=2)
+    predictor.train_panel(panel, 'points', order_column='game', epochs=1)
+
+    metadata = {'mode': 'global', 'lookback_period': 5, 'forecast_horizon': 2, 'embedding_dim': 2}
+    ModelRegistry(str(tmp_path)).save('time_series_league', predictor.export_arrays(), metadata)
+    restored = load_league_predictor(ModelRegistry(str(tmp_path)).open('time_series_league'))
+
+    assert restored.players == [int(player_id) for player_id in predictor.players]
+    history = panel[panel['player_id'] == 123].sort_values('game')
+    np.testing.assert_allclose(
+        restored.forecast_next(history, 'points', player_id=123),
+        predictor.forecast_next(history, 'points', player_id=123),
+        rtol=1e-5
+    )
+    restored.seed_player(123, history['points'].to_numpy())
+    assert restored.observe(123, 20.0).shape == (2,)